@@ -0,0 +1,69 @@
+"""
+Benchmark do sorteio adaptativo: tabela de alias x random.choices
+
+Compara o custo de montar uma sessão de 10 questões ponderadas com a tabela
+de alias de Vose (O(k) por sessão) e com random.choices sobre a lista de
+pesos (O(n) por sessão).
+
+Uso: python bench_adaptive.py [tamanho_banco ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from adaptive import AdaptiveSampler
+
+SESSION_SIZE = 10
+
+
+def naive_sample(population, weights, num, rng):
+    """Sorteio ingênuo: random.choices sobre todos os pesos, descartando repetidas"""
+    chosen = set()
+    while len(chosen) < num:
+        chosen.update(rng.choices(population, weights, k=num - len(chosen)))
+    return list(chosen)
+
+
+def bench(size: int, rounds: int = 200):
+    rng = random.Random(3)
+    now = time.time()
+    ids = [f"q{i}" for i in range(size)]
+    stats = {
+        qid: (attempts, rng.randint(0, attempts), now - rng.uniform(0, 30) * 86400)
+        for qid in ids[: size // 2]
+        for attempts in [rng.randint(1, 10)]
+    }
+    sampler = AdaptiveSampler(ids, stats, now)
+    population = range(size)
+
+    start = time.perf_counter()
+    sampler.sample(SESSION_SIZE, rng)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        sampler.sample(SESSION_SIZE, rng)
+    alias = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        naive_sample(population, sampler.weights, SESSION_SIZE, rng)
+    naive = (time.perf_counter() - start) / rounds
+
+    print(f"banco {size:>9,}: tabela {build * 1000:8.2f} ms (uma vez) | "
+          f"alias {alias * 1e6:8.1f} µs/sessão | random.choices {naive * 1e6:10.1f} µs/sessão "
+          f"({naive / alias:,.0f}x)")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [226, 10000, 100000, 1000000]
+    for size in sizes:
+        bench(size, rounds=50 if size >= 1000000 else 200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark do histórico de tentativas (AttemptStore)
+
+Grava N tentativas sintéticas pelo escritor em lote e mede a latência das
+consultas agregadas por tópico e por questão.
+
+Uso: python bench_attempt_store.py [tentativas]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from attempt_store import AttemptStore
+
+
+def timed(fn, rounds: int = 1000) -> float:
+    """Latência média de fn() em milissegundos"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(1)
+    topics = [f"10{major}.{minor}" for major in range(1, 5) for minor in range(1, 5)]
+    questions = [(f"{topic}-{i:05d}", topic) for topic in topics for i in range(500)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AttemptStore(os.path.join(tmp, "history.db"), batch_size=5000)
+
+        start = time.perf_counter()
+        worst_enqueue = 0.0
+        for i in range(total):
+            qid, topic = questions[rng.randrange(len(questions))]
+            t0 = time.perf_counter()
+            store.record(f"user{i % 20}", qid, topic, str(rng.randrange(4)), rng.random() < 0.6, i)
+            worst_enqueue = max(worst_enqueue, time.perf_counter() - t0)
+        store.flush()
+        elapsed = time.perf_counter() - start
+        print(f"{total:,} tentativas gravadas em {elapsed:.1f} s ({total / elapsed:,.0f}/s), "
+              f"pior record(): {worst_enqueue * 1000:.3f} ms")
+
+        print(f"topic_stats:      {timed(lambda: store.topic_stats('user3')):.3f} ms")
+        print(f"question_summary: {timed(lambda: store.question_summary('user3', questions[7][0])):.3f} ms")
+        print(f"question_stats (tópico): "
+              f"{timed(lambda: store.question_stats('user3', '103.2'), 100):.3f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark da correção em lote (batch_grader) x correção questão a questão
+
+Gera folhas de resposta sintéticas para um simulado de 60 questões e compara
+o laço com grade_answer (como o submit_answer) com a correção vetorizada.
+
+Uso: python bench_batch_grader.py [folhas]
+"""
+
+import random
+import sys
+import time
+
+from synthetic_bank import SRC_DIR  # noqa: F401  (ajusta o sys.path)
+
+from batch_grader import AnswerKey, ResponseMatrix, grade
+from exam import build_exam
+from question_bank import QuestionBank
+from quiz_session import grade_answer
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(7)
+    bank = QuestionBank()
+    exam = build_exam(bank, rng=rng)
+    key = AnswerKey.from_questions(exam)
+    records = [
+        {"student": f"aluno{i}",
+         "answers": {question.id: rng.randrange(4) for question in exam if rng.random() < 0.95}}
+        for i in range(count)
+    ]
+
+    start = time.perf_counter()
+    scores = []
+    for record in records:
+        answers = record["answers"]
+        scores.append(sum(
+            grade_answer(question, str(answers[question.id]))
+            for question in exam if question.id in answers
+        ))
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sheets = ResponseMatrix.from_records(records, key)
+    loaded = time.perf_counter() - start
+    start = time.perf_counter()
+    report = grade(key, sheets)
+    vectorized = time.perf_counter() - start
+
+    assert report.scores.tolist() == scores
+    bank.pack.close()
+    print(f"{count:,} folhas x {len(key)} questões")
+    print(f"  grade_answer por questão  {scalar * 1000:9.1f} ms  ({count / scalar:12,.0f} folhas/s)")
+    print(f"  matriz de respostas       {loaded * 1000:9.1f} ms")
+    print(f"  correção vetorizada       {vectorized * 1000:9.1f} ms  ({count / vectorized:12,.0f} folhas/s)")
+
+
+if __name__ == "__main__":
+    main()
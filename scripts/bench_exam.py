@@ -0,0 +1,39 @@
+"""
+Benchmark da montagem de simulados (build_exam) em bancos sintéticos
+
+Uso: python bench_exam.py [tamanho_banco ...]
+"""
+
+import os
+import sys
+import time
+
+from synthetic_bank import synthetic_pack_path
+
+from exam import build_exam
+from question_bank import QuestionBank
+
+
+def bench(size: int, rounds: int = 200):
+    path = synthetic_pack_path(size)
+    try:
+        bank = QuestionBank(path)
+        build_exam(bank)  # aquecimento
+        start = time.perf_counter()
+        for _ in range(rounds):
+            exam = build_exam(bank)
+        elapsed = (time.perf_counter() - start) / rounds
+        bank.pack.close()
+    finally:
+        os.remove(path)
+    print(f"banco {size:>9,}: simulado de {len(exam)} questões em {elapsed * 1000:.3f} ms")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [226, 10000, 100000]
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark da correção tolerante a erros de digitação (fuzzy_match)
+
+Usa os termos das explicações do banco como respostas aceitas de uma questão
+com muitas alternativas, gera respostas com 0 a 2 erros e compara a busca na
+BK-tree com o cálculo da distância até cada alternativa. Mede também a
+correção em lote (grade_many) de respostas típicas de uma turma, com repetição.
+
+Uso: python bench_fuzzy.py [respostas]
+"""
+
+import random
+import sys
+import time
+
+from synthetic_bank import SRC_DIR  # noqa: F401  (ajusta o sys.path)
+
+from fuzzy_match import FuzzyMatcher, allowed_typos, fold, levenshtein, literal_words, pattern_masks
+from question_bank import QuestionBank
+from search_index import tokenize
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    for _ in range(rng.randrange(3)):
+        position = rng.randrange(len(word) + 1)
+        edit = rng.randrange(3)
+        if edit == 0:
+            word = word[:position] + rng.choice(LETTERS) + word[position:]
+        elif edit == 1 and position < len(word):
+            word = word[:position] + word[position + 1:]
+        elif position < len(word):
+            word = word[:position] + rng.choice(LETTERS) + word[position + 1:]
+    return word
+
+
+def linear_match(accepted, answer: str) -> bool:
+    text = fold(answer)
+    limit = allowed_typos(text)
+    masks = pattern_masks(text)
+    exact = literal_words(answer)
+    return any(levenshtein(text, candidate, limit, masks) <= limit and literals == exact
+               for candidate, literals in accepted)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(13)
+    bank = QuestionBank()
+    vocabulary = sorted({
+        term for topic in bank.get_all_topics() for question in bank.get_questions(topic)
+        for term in tokenize(question.explanation) if len(term) >= 4
+    })
+    bank.pack.close()
+
+    matcher = FuzzyMatcher(tuple(vocabulary))
+    folded = [(fold(term), literal_words(term)) for term in vocabulary]
+    answers = [misspell(rng.choice(vocabulary), rng) for _ in range(count)]
+
+    start = time.perf_counter()
+    tree = [matcher.matches(answer) for answer in answers]
+    tree_time = time.perf_counter() - start
+    start = time.perf_counter()
+    linear = [linear_match(folded, answer) for answer in answers[:count // 10]]
+    linear_time = (time.perf_counter() - start) * 10
+    assert tree[:len(linear)] == linear
+
+    print(f"{len(vocabulary):,} respostas aceitas, {count:,} respostas com 0-2 erros "
+          f"({sum(tree) / count:.0%} aceitas)")
+    print(f"  distância até cada alternativa  {count / linear_time:10,.0f} respostas/s")
+    print(f"  BK-tree                         {count / tree_time:10,.0f} respostas/s")
+
+    # Turma: poucas respostas aceitas, muitas respostas repetidas
+    matcher = FuzzyMatcher(("partição", "tabela de partições", "fdisk -l"))
+    typed = [misspell(rng.choice(("particao", "tabela de particoes", "fdisk")), rng)
+             for _ in range(count * 5)]
+    start = time.perf_counter()
+    results = matcher.grade_many(typed)
+    elapsed = time.perf_counter() - start
+    print(f"  lote de {len(typed):,} respostas de texto: {len(typed) / elapsed:,.0f} respostas/s "
+          f"({sum(results) / len(results):.0%} aceitas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark da correção em lote de arquivos grandes (grade_file / LPIC1.py corrigir)
+
+Gera um arquivo JSONL de folhas sintéticas (respostas a todas as questões do
+banco) e o corrige com 1, 2, 4... processos, mostrando folhas por segundo e o
+pico de memória do processo principal.
+
+Uso: python bench_grade_cli.py [folhas] [processos ...]
+"""
+
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+from synthetic_bank import SRC_DIR  # noqa: F401  (ajusta o sys.path)
+
+from batch_grader import AnswerKey, grade_file
+from question_bank import QuestionBank
+
+
+def write_sheets(path: str, key: AnswerKey, count: int, seed: int = 3):
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            answers = {question_id: rng.randrange(4) for question_id in key.question_ids
+                       if rng.random() < 0.9}
+            f.write(json.dumps({"student": f"aluno{i}", "answers": answers}) + "\n")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    cpus = os.cpu_count() or 1
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or sorted({1, 2, 4, cpus})
+
+    bank = QuestionBank()
+    key = AnswerKey.from_bank(bank)
+    bank.pack.close()
+
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fd)
+    try:
+        write_sheets(path, key, count)
+        print(f"{count:,} folhas x {len(key)} questões ({os.path.getsize(path) / 2**20:.0f} MiB), "
+              f"{cpus} CPU(s)")
+        baseline = None
+        for workers in worker_counts:
+            with open(os.devnull, "w", encoding="utf-8") as output:
+                start = time.perf_counter()
+                totals = grade_file(path, key, output, workers=workers)
+                elapsed = time.perf_counter() - start
+            rate = totals.students / elapsed
+            baseline = baseline or rate
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"  {workers:>2} processo(s): {rate:10,.0f} folhas/s  "
+                  f"({rate / baseline:4.2f}x)  pico RSS principal {peak:.0f} MiB")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark da análise de itens (item_analysis) em históricos sintéticos
+
+Gera respostas de alunos com habilidades diferentes (modelo logístico) para um
+banco de questões, mede o recálculo completo das estatísticas, a leitura de um
+histórico SQLite e a atualização incremental com poucas tentativas novas.
+
+Uso: python bench_item_analysis.py [respostas] [questões]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from synthetic_bank import SRC_DIR  # noqa: F401  (ajusta o sys.path)
+
+from attempt_store import AttemptStore
+from item_analysis import ItemAnalysis
+
+
+def synthetic_responses(count: int, items: int, rng):
+    users_n = max(count // 50, 1)
+    ability = rng.normal(0, 1, users_n)
+    difficulty = rng.normal(0, 1, items)
+    users = rng.integers(0, users_n, count, dtype=np.int32)
+    questions = rng.integers(0, items, count, dtype=np.int32)
+    chance = 1 / (1 + np.exp(-(ability[users] - difficulty[questions])))
+    correct = (rng.random(count) < chance).astype(np.int8)
+    wrong_option = rng.integers(1, 4, count)
+    options = np.where(correct == 1, 0, wrong_option).astype(np.int8)
+    return users, questions, correct, options, users_n
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000000
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    rng = np.random.default_rng(11)
+    users, questions, correct, options, users_n = synthetic_responses(count, items, rng)
+
+    analysis = ItemAnalysis()
+    analysis.user_codes = {f"u{i}": i for i in range(users_n)}
+    for item in range(items):
+        analysis._item(f"q{item}", "sintético")
+    analysis.add_responses(users, questions, correct, options)
+    start = time.perf_counter()
+    stats = analysis.compute()
+    elapsed = time.perf_counter() - start
+    mean_r = np.nanmean(stats["discrimination"])
+    print(f"{count:,} respostas, {items:,} questões, {users_n:,} alunos: "
+          f"recálculo completo em {elapsed:.2f} s (discriminação média {mean_r:.2f})")
+
+    # Histórico SQLite: leitura inicial e incremental
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    store = AttemptStore(path)
+    try:
+        sample = min(count, 200000)
+        for i in range(sample):
+            store.record(f"u{users[i]}", f"q{questions[i]}", "sintético",
+                         str(options[i]), bool(correct[i]), answered_at=float(i))
+        store.flush()
+        start = time.perf_counter()
+        from_db = ItemAnalysis.from_store(store)
+        from_db.compute()
+        full = time.perf_counter() - start
+
+        for i in range(sample, sample + 1000):
+            store.record(f"u{users[i % count]}", f"q{questions[i % count]}", "sintético",
+                         "1", False, answered_at=float(i))
+        store.flush()
+        start = time.perf_counter()
+        added = from_db.update(store)
+        from_db.compute()
+        incremental = time.perf_counter() - start
+        print(f"histórico de {sample:,} tentativas: leitura + cálculo {full:.2f} s; "
+              f"+1.000 tentativas ({added} novas respostas) em {incremental * 1000:.0f} ms")
+    finally:
+        store.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
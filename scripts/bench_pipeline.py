@@ -0,0 +1,51 @@
+"""
+Benchmark do avaliador de pipelines (pipeline) com um log de acesso grande
+
+Gera em fluxo um /var/log/access.log com N linhas (~80 bytes cada) e executa
+pipelines típicos do tópico 103.2 sobre ele, medindo a vazão e o pico de
+memória do processo (ru_maxrss). O pico não deve crescer com o tamanho da
+entrada: head para cedo, grep | wc só conta e o sort ordena em blocos
+gravados em disco (ordenação externa).
+
+Uso: python bench_pipeline.py [linhas]
+"""
+
+import resource
+import sys
+import time
+
+from synthetic_bank import SRC_DIR  # noqa: F401  (ajusta o sys.path)
+
+from pipeline import Files, access_log_lines, run
+
+PIPELINES = (
+    "head -n 5 /var/log/access.log",
+    "grep -c ' 404 ' /var/log/access.log",
+    "cut -d' ' -f7 /var/log/access.log | sort | uniq -c | sort -rn | head -3",
+    "cut -d' ' -f1 /var/log/access.log | sort -u | wc -l",
+    "tail -n 2 /var/log/access.log | tr 'a-z' 'A-Z'",
+)
+
+
+def peak_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    files = Files(["/var/log/access.log"], {"/var/log/access.log": lambda: access_log_lines(count)})
+    size = sum(len(line) + 1 for line in files.lines("/var/log/access.log"))
+    print(f"/var/log/access.log: {count:,} linhas, {size / 1e6:.0f} MB (gerado em fluxo)")
+    baseline = peak_mb()
+    print(f"  pico de memória antes dos pipelines: {baseline:.0f} MB")
+
+    for text in PIPELINES:
+        start = time.perf_counter()
+        output = list(run(text, files))
+        elapsed = time.perf_counter() - start
+        print(f"  {elapsed:7.2f} s {size / 1e6 / elapsed:6.1f} MB/s  pico {peak_mb():5.0f} MB  {text}")
+        print(f"            -> {output[0]!r}{' ...' if len(output) > 1 else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Memória por questão: dict x Question (__slots__, strings internadas)
+
+Decodifica todas as questões de um pacote sintético duas vezes, como dicts
+(formato antigo do QuestionBank) e como Question, e mede com tracemalloc os
+bytes alocados por questão em cada representação. Por fim, materializa cada
+tópico num QuestionBank e mostra o relatório de construção (get_build_report:
+tempo, memória estimada e quais tópicos continuam no cache LRU).
+
+Uso: python bench_question_memory.py [tamanho_banco]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+from synthetic_bank import synthetic_pack_path
+
+from question import Question
+from question_bank import QuestionBank
+from question_pack import QuestionPack
+
+
+def measure(pack: QuestionPack, convert) -> int:
+    """Bytes alocados (e mantidos) para decodificar todas as questões"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    questions = [
+        convert(pack.get(index), topic)
+        for topic in pack.topics()
+        for index in pack.topic_range(topic)
+    ]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del questions
+    return size
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    path = synthetic_pack_path(size)
+    pack = QuestionPack.open(path)
+    try:
+        as_dict = measure(pack, lambda record, topic: dict(record, topic=topic))
+        as_question = measure(pack, Question.from_dict)
+        bank = QuestionBank(path, max_cached_topics=8)
+        for topic in bank.get_all_topics():
+            bank.get_questions(topic)
+        build_report = bank.get_build_report()
+        bank.pack.close()
+    finally:
+        pack.close()
+        os.remove(path)
+
+    print(f"{size:,} questões")
+    print(f"  dict      {as_dict / size:8.1f} bytes/questão  ({as_dict / 2**20:8.1f} MiB)")
+    print(f"  Question  {as_question / size:8.1f} bytes/questão  ({as_question / 2**20:8.1f} MiB)")
+    print(f"  economia  {(1 - as_question / as_dict) * 100:.1f}%")
+    print("\nConstrução dos tópicos no QuestionBank (cache de 8 tópicos):")
+    print(build_report)
+
+
+if __name__ == "__main__":
+    main()
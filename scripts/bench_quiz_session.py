@@ -0,0 +1,52 @@
+"""
+Benchmark do motor QuizSession sem interface gráfica
+
+Executa sessões completas (iniciar, responder todas, navegar, finalizar) e
+mostra quantas sessões por segundo o motor suporta.
+
+Uso: python bench_quiz_session.py [sessoes] [questoes_por_sessao]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from question_bank import QuestionBank
+from quiz_session import QuizSession
+
+
+def run(sessions: int, per_session: int) -> float:
+    """Roda as sessões e retorna sessões por segundo"""
+    bank = QuestionBank()
+    topics = bank.get_all_topics()
+    pools = {topic: bank.get_random_questions(topic, per_session) for topic in topics}
+    answers = [str(random.randrange(4)) for _ in range(per_session)]
+
+    session = QuizSession()
+    start = time.perf_counter()
+    for i in range(sessions):
+        topic = topics[i % len(topics)]
+        session.start(pools[topic], topic)
+        for answer in answers:
+            if session.current_question is None:
+                break
+            session.answer(answer)
+            if not session.next():
+                break
+        session.finish()
+    elapsed = time.perf_counter() - start
+    return sessions / elapsed
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    per_session = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rate = run(sessions, per_session)
+    print(f"{sessions} sessões de {per_session} questões: {rate:,.0f} sessões/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark dos exercícios de expressões regulares (regex_match)
+
+Mede o custo de compilar um padrão x buscá-lo no cache LRU, a avaliação de
+padrões sobre N linhas (laço Python linha a linha x map/compress em C), a
+ida e volta até o processo de trabalho e quanto tempo leva para um padrão
+com backtracking catastrófico ser interrompido e o processo recriado.
+
+Uso: python bench_regex.py [linhas]
+"""
+
+import itertools
+import re
+import sys
+import time
+
+from synthetic_bank import SRC_DIR  # noqa: F401  (ajusta o sys.path)
+
+import regex_match
+from timed_worker import TimedWorker, WorkerTimeout
+from pipeline import access_log_lines, regex_source
+
+PATTERNS = (" 500 ", "^192\\.168\\.3\\.", "GET /(login|api/dados) ", "[0-9]{4}$")
+
+
+def spec(pattern: str):
+    return (pattern, True, False, False, False, False, False)
+
+
+def per_line(pattern: str, lines) -> frozenset:
+    regex = re.compile(regex_source(pattern, True))
+    return frozenset(index for index, line in enumerate(lines) if regex.search(line))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    lines = tuple(access_log_lines(count))
+
+    distinct = [f"(usuario|grupo){i}[0-9]+" for i in range(2000)]
+    start = time.perf_counter()
+    for pattern in distinct:
+        regex_match.compile_spec(spec(pattern))
+    cold = (time.perf_counter() - start) / len(distinct)
+    start = time.perf_counter()
+    for pattern in itertools.islice(itertools.cycle(distinct[-500:]), 100000):
+        regex_match.compile_spec(spec(pattern))
+    warm = (time.perf_counter() - start) / 100000
+    print(f"compilação {cold * 1e6:.0f} µs x cache LRU {warm * 1e6:.2f} µs por padrão")
+
+    print(f"avaliação sobre {count:,} linhas:")
+    for pattern in PATTERNS:
+        start = time.perf_counter()
+        expected = per_line(pattern, lines)
+        loop = time.perf_counter() - start
+        start = time.perf_counter()
+        selected = regex_match.selected_lines(spec(pattern), lines)
+        vectorized = time.perf_counter() - start
+        assert selected == expected
+        print(f"  {pattern!r:28} ({len(selected) / count:4.0%} casam) laço {loop * 1000:7.1f} ms, "
+              f"map/compress {vectorized * 1000:7.1f} ms")
+
+    worker = TimedWorker()
+    sample = lines[:50]
+    start = time.perf_counter()
+    worker.call(regex_match.evaluate_spec, spec("GET"), sample)
+    print(f"processo de trabalho: início {time.perf_counter() - start:.2f} s", end="")
+    start = time.perf_counter()
+    for i in range(200):
+        worker.call(regex_match.evaluate_spec, spec(f"GET /{i}"), sample)
+    print(f", ida e volta {(time.perf_counter() - start) / 200 * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    try:
+        worker.call(regex_match.evaluate_spec, spec("(a+)+$"), ("a" * 40 + "b",))
+    except WorkerTimeout:
+        pass
+    stopped = time.perf_counter() - start
+    start = time.perf_counter()
+    worker.call(regex_match.evaluate_spec, spec("GET"), sample)
+    print(f"  (a+)+$ interrompido em {stopped:.2f} s; novo processo pronto em "
+          f"{time.perf_counter() - start:.2f} s")
+    worker.stop()
+
+
+if __name__ == "__main__":
+    main()
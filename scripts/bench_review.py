@@ -0,0 +1,46 @@
+"""
+Benchmark do agendador de revisão espaçada (ReviewScheduler)
+
+Uso: python bench_review.py [cartoes]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from review import DAY, Card, ReviewScheduler
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(7)
+    now = time.time()
+    cards = [
+        Card(f"q{i}", "103.2", interval=rng.randint(1, 30), reps=2,
+             due=now + rng.uniform(-5, 30) * DAY)
+        for i in range(total)
+    ]
+
+    start = time.perf_counter()
+    scheduler = ReviewScheduler(cards)
+    print(f"{total:,} cartões carregados em {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rounds = 2000
+    start = time.perf_counter()
+    for _ in range(rounds):
+        due = scheduler.next_due(10, now)
+    print(f"next_due(10): {(time.perf_counter() - start) / rounds * 1e6:.1f} µs")
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        card = due[i % len(due)]
+        scheduler.review(card.question_id, card.topic, rng.random() < 0.7, now)
+        due = scheduler.next_due(10, now) or due
+    print(f"review + next_due: {(time.perf_counter() - start) / rounds * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark da busca textual (SearchIndex) em bancos sintéticos
+
+Mede construção, gravação/carga do índice e a latência das consultas.
+
+Uso: python bench_search.py [tamanho_banco]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from synthetic_bank import synthetic_pack_path
+
+from question_bank import QuestionBank
+from search_index import SearchIndex
+
+QUERIES = ["kernel", "cmd1234", "particao", "montag", "termo42", "inode filtro", "processo sinal pacote", "kernel termo7", "103.2 77"]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    path = synthetic_pack_path(size)
+    try:
+        bank = QuestionBank(path)
+        signature = bank.pack.signature()
+
+        start = time.perf_counter()
+        index = SearchIndex.build(bank, signature)
+        print(f"{size:,} questões indexadas em {time.perf_counter() - start:.2f} s "
+              f"({len(index.postings):,} termos)")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index_path = os.path.join(tmp, "search.idx")
+            start = time.perf_counter()
+            index.save(index_path)
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            index = SearchIndex.load(index_path, signature)
+            print(f"gravação {saved:.2f} s | carga {time.perf_counter() - start:.2f} s "
+                  f"({os.path.getsize(index_path) / 1e6:.1f} MB)")
+
+        for query in QUERIES:
+            index.search(query)  # aquecimento (caches de trigramas e pesos)
+            rounds = 20
+            start = time.perf_counter()
+            for _ in range(rounds):
+                results = index.search(query)
+            elapsed = (time.perf_counter() - start) / rounds
+            print(f"{query!r:28} {elapsed * 1000:8.3f} ms  ({len(results)} resultados)")
+        bank.pack.close()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Memória por processo: QuestionBank próprio x FrozenBank compartilhado
+
+Inicia N processos (spawn) que percorrem todas as questões de um banco
+sintético, de duas formas:
+    privado       cada processo abre o pacote e materializa todos os tópicos
+                  (get_questions), como um servidor com N workers faria hoje
+    compartilhado o processo pai congela o banco em shared_memory e cada
+                  processo apenas se anexa e lê os textos (memoryview)
+
+Para cada processo mostra o RSS antes e depois e o PSS (memória proporcional,
+que divide as páginas compartilhadas entre os processos). Requer /proc (Linux).
+
+Uso: python bench_shared_bank.py [--workers 4] [--size 200000]
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+
+from synthetic_bank import synthetic_pack_path
+
+from frozen_bank import FrozenBank, freeze
+from question_bank import QuestionBank
+
+
+def memory_kib():
+    """(RSS, PSS) do processo atual em KiB"""
+    values = {}
+    for path in ("/proc/self/status", "/proc/self/smaps_rollup"):
+        try:
+            with open(path) as f:
+                for line in f:
+                    name, _, rest = line.partition(":")
+                    if name in ("VmRSS", "Pss"):
+                        values[name] = int(rest.split()[0])
+        except OSError:
+            pass
+    return values.get("VmRSS", 0), values.get("Pss", 0)
+
+
+def private_worker(pack_path: str, barrier, results):
+    before, _ = memory_kib()
+    bank = QuestionBank(pack_path, max_cached_topics=1000)
+    chars = 0
+    for topic in bank.get_all_topics():
+        for question in bank.get_questions(topic):
+            chars += len(question.text) + sum(len(o) for o in question.options)
+    barrier.wait()  # todos carregados: mede com as páginas de todos presentes
+    after, pss = memory_kib()
+    results.put((before, after, pss, chars))
+    barrier.wait()
+
+
+def shared_worker(name: str, barrier, results):
+    before, _ = memory_kib()
+    bank = FrozenBank.attach(name)
+    chars = 0
+    for index in range(bank.question_count):
+        chars += len(bank.question_text(index))
+        chars += sum(len(option) for option in bank.option_texts(index))
+    barrier.wait()
+    after, pss = memory_kib()
+    results.put((before, after, pss, chars))
+    barrier.wait()
+    bank.close()
+
+
+def run(label: str, target, arg, workers: int):
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [context.Process(target=target, args=(arg, barrier, results))
+                 for _ in range(workers)]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    rows = [results.get() for _ in processes]
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+
+    print(f"\n{label} ({workers} processos, {elapsed:.1f} s)")
+    print(f"  {'worker':>6} {'RSS antes':>12} {'RSS depois':>12} {'PSS depois':>12}")
+    for i, (before, after, pss, _) in enumerate(rows):
+        print(f"  {i:>6} {before / 1024:9.1f} MiB {after / 1024:9.1f} MiB {pss / 1024:9.1f} MiB")
+    total_pss = sum(row[2] for row in rows)
+    growth = sum(row[1] - row[0] for row in rows) / len(rows)
+    print(f"  crescimento médio do RSS: {growth / 1024:.1f} MiB; PSS somado: {total_pss / 1024:.1f} MiB")
+    return total_pss
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória do banco por processo")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--size", type=int, default=200000)
+    args = parser.parse_args()
+
+    path = synthetic_pack_path(args.size)
+    try:
+        bank = QuestionBank(path)
+        data = freeze(bank)
+        bank.pack.close()
+        print(f"banco de {args.size:,} questões: pacote {os.path.getsize(path) / 2**20:.1f} MiB, "
+              f"congelado {len(data) / 2**20:.1f} MiB")
+
+        private = run("privado (QuestionBank por processo)", private_worker, path, args.workers)
+        frozen = FrozenBank.create_shared(data)
+        try:
+            shared = run("compartilhado (FrozenBank em shared_memory)", shared_worker,
+                         frozen.shared_name, args.workers)
+        finally:
+            frozen.unlink()
+            frozen.close()
+    finally:
+        os.remove(path)
+
+    if shared:
+        print(f"\nPSS somado: {private / 1024:.1f} MiB -> {shared / 1024:.1f} MiB "
+              f"({private / shared:.1f}x menos)")
+
+
+if __name__ == "__main__":
+    main()
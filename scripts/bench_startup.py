@@ -0,0 +1,104 @@
+"""
+Benchmark de inicialização do aplicativo LPIC-1
+
+Mede, em processos novos:
+    import_ms       tempo para importar LPIC1.py
+    first_paint_ms  do lançamento do processo até a janela ser desenhada
+    interactive_ms  do lançamento até o banco carregado e os botões habilitados
+
+Os dois últimos exigem um display (DISPLAY ou Xvfb disponível); sem display
+apenas o tempo de importação é medido. As medianas são comparadas com o
+orçamento em startup_budget.json e o script sai com código 1 se algum valor
+estourar, para uso em verificações automáticas.
+
+Uso: python bench_startup.py [repeticoes] [--json arquivo_saida]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from virtual_display import display_env
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(SCRIPTS_DIR, "..", "src")
+BUDGET_PATH = os.path.join(SCRIPTS_DIR, "startup_budget.json")
+
+IMPORT_SNIPPET = (
+    "import sys, time; sys.path.insert(0, {src!r}); t = time.perf_counter(); "
+    "import LPIC1; print((time.perf_counter() - t) * 1000)"
+)
+
+
+def measure_import() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET.format(src=SRC_DIR)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return float(output.strip())
+
+
+def measure_window(env) -> dict:
+    """Lança o aplicativo em modo sonda e lê os tempos gravados"""
+    with tempfile.TemporaryDirectory() as tmp:
+        probe = os.path.join(tmp, "startup.json")
+        env = dict(
+            env,
+            LPIC1_STARTUP_PROBE=probe,
+            LPIC1_HISTORY_DB=os.path.join(tmp, "history.db"),
+            LPIC1_STARTUP_T0=repr(time.time()),
+        )
+        subprocess.run([sys.executable, os.path.join(SRC_DIR, "LPIC1.py")],
+                       env=env, check=True, timeout=60)
+        with open(probe, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def main():
+    args = sys.argv[1:]
+    output_path = None
+    if "--json" in args:
+        i = args.index("--json")
+        output_path = args[i + 1]
+        del args[i:i + 2]
+    rounds = int(args[0]) if args else 5
+
+    results = {"import_ms": statistics.median(measure_import() for _ in range(rounds))}
+
+    env, server = display_env()
+    try:
+        if env is None:
+            print("Sem display (DISPLAY/Xvfb): medindo apenas a importação")
+        else:
+            runs = [measure_window(env) for _ in range(rounds)]
+            for key in ("first_paint_ms", "interactive_ms"):
+                values = [run[key] for run in runs if key in run]
+                if values:
+                    results[key] = statistics.median(values)
+    finally:
+        if server is not None:
+            server.terminate()
+
+    with open(BUDGET_PATH, encoding="utf-8") as f:
+        budget = json.load(f)
+
+    failed = False
+    for key, value in results.items():
+        limit = budget.get(key)
+        status = "ok" if limit is None or value <= limit else "ESTOUROU"
+        failed = failed or status != "ok"
+        print(f"{key:16} {value:8.1f} ms  (orçamento {limit} ms) {status}")
+
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump({"results": results, "budget": budget, "ok": not failed}, f, indent=2)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
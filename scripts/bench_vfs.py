@@ -0,0 +1,93 @@
+"""
+Benchmark do sistema de arquivos em memória (vfs) com árvores grandes
+
+Monta uma árvore com N entradas, mede a resolução de caminhos (com e sem o
+cache), o snapshot/restore copy-on-write e a correção de um exercício por
+diff depois de poucas alterações, comparando com a comparação completa
+entre árvores independentes.
+
+Uso: python bench_vfs.py [entradas]
+"""
+
+import random
+import sys
+import time
+from typing import List, Tuple
+
+from synthetic_bank import SRC_DIR  # noqa: F401  (ajusta o sys.path)
+
+from vfs import FileSystem, Shell, diff
+
+
+def build_tree(entries: int) -> Tuple[FileSystem, List[str]]:
+    fs = FileSystem()
+    paths = []
+    directories = ["/dados"]
+    fs.mkdir("/dados")
+    for i in range(entries - 1):
+        parent = directories[i // 20] if i // 20 < len(directories) else directories[-1]
+        if i % 10 == 0:
+            path = f"{parent}/dir{i}"
+            fs.mkdir(path)
+            directories.append(path)
+        else:
+            path = f"{parent}/arquivo{i}.txt"
+            fs.write_file(path, f"conteúdo {i}\n")
+        paths.append(path)
+    return fs, paths
+
+
+def timed(function, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(17)
+
+    start = time.perf_counter()
+    fs, paths = build_tree(entries)
+    built = time.perf_counter() - start
+    depth = max(path.count("/") for path in paths)
+    print(f"{entries:,} entradas (profundidade até {depth}) montadas em {built:.2f} s")
+
+    sample = [rng.choice(paths) for _ in range(20000)]
+    uncached = timed(lambda: [fs._walk(path, 1, True, 0, 0) for path in sample]) / len(sample)
+    [fs.lookup(path) for path in sample]
+    cached = timed(lambda: [fs.lookup(path) for path in sample]) / len(sample)
+    print(f"  resolução de caminho: {uncached * 1e6:.1f} µs percorrendo, {cached * 1e6:.2f} µs no cache")
+
+    snapshot_time = timed(fs.snapshot, 100)
+    snapshot = fs.snapshot()
+    student = FileSystem(snapshot)
+    shell = Shell(student, "root")
+    targets = rng.sample([path for path in paths if path.endswith(".txt")], 10)
+    for path in targets[:5]:
+        shell.run(f"rm {path}")
+    for path in targets[5:]:
+        shell.run(f"echo alterado >> {path}")
+    expected = FileSystem(snapshot)
+    for path in targets[:5]:
+        expected.unlink(path)
+
+    fast = timed(lambda: diff(expected, student), 20)
+    restore_time = timed(lambda: student.restore(snapshot), 100)
+    print(f"  snapshot {snapshot_time * 1e6:.1f} µs, restore {restore_time * 1e6:.1f} µs")
+
+    for path in targets[5:]:
+        shell.run(f"echo alterado >> {path}")
+    lines = diff(expected, student)
+    full_expected, _ = build_tree(entries)
+    for path in targets[:5]:
+        full_expected.unlink(path)
+    full = timed(lambda: diff(full_expected, student))
+    assert diff(full_expected, student) == lines
+    print(f"  correção por diff ({len(lines)} diferenças): {fast * 1000:.2f} ms a partir do snapshot "
+          f"x {full * 1000:.0f} ms comparando árvores independentes")
+
+
+if __name__ == "__main__":
+    main()
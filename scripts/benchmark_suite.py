@@ -0,0 +1,262 @@
+"""
+Suíte de benchmarks dos caminhos críticos do LPIC-1
+
+Mede:
+    bank.construct          criação do QuestionBank (abertura do pacote)
+    bank.random.<n>.cold    primeiro get_random_questions(tópico, 10) num banco de n questões
+    bank.random.<n>.warm    chamadas seguintes (tópico já materializado)
+    grade.multiple          correção como no submit_answer (grade_answer, múltipla escolha)
+    session.answer          QuizSession.answer + estatísticas (múltipla escolha)
+    render.show_question    show_question com widgets reais (precisa de display)
+    render.show_feedback    show_answer_feedback com widgets reais (precisa de display)
+
+Cada amostra cronometra um lote de chamadas (como o timeit) que dura ao menos
+MIN_SAMPLE_SECONDS, então casos de menos de 1 µs não ficam abaixo da resolução
+do relógio; as medições "cold" repetem a abertura do banco a cada rodada.
+Os resultados (microssegundos por chamada: média, p50, p95, mínimo) são
+gravados em JSON. Com --compare, sai com código 1 se até a amostra mais rápida
+(mínimo) ficar acima da mediana (p50) anterior mais a tolerância e também acima
+do p95 anterior: o ruído entre duas execuções idênticas não aparece como
+regressão.
+
+Uso:
+    python benchmark_suite.py [--sizes 226,10000,100000,1000000] [--json saida.json]
+                              [--compare anterior.json] [--tolerance 0.25]
+"""
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Histórico isolado: os benchmarks não devem tocar no ~/.lpic1 do usuário
+_TMP_DIR = tempfile.mkdtemp(prefix="lpic1-bench-")
+atexit.register(shutil.rmtree, _TMP_DIR, True)
+os.environ["LPIC1_HISTORY_DB"] = os.path.join(_TMP_DIR, "history.db")
+
+from synthetic_bank import synthetic_pack_path
+from virtual_display import display_env
+
+from question import MULTIPLE
+from question_bank import QuestionBank
+from quiz_session import QuizSession, grade_answer
+
+DEFAULT_SIZES = [226, 10000, 100000, 1000000]
+MIN_SAMPLE_SECONDS = 0.002
+COLD_ROUNDS = 10
+
+
+def summarize(samples):
+    """Estatísticas de uma lista de durações (segundos) em microssegundos"""
+    ordered = sorted(samples)
+    return {
+        "rounds": len(ordered),
+        "mean_us": statistics.fmean(ordered) * 1e6,
+        "p50_us": ordered[len(ordered) // 2] * 1e6,
+        "p95_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e6,
+        "min_us": ordered[0] * 1e6,
+    }
+
+
+def batch_size(fn) -> int:
+    """Chamadas por amostra para cada amostra durar ao menos MIN_SAMPLE_SECONDS"""
+    fn()  # aquecimento: a primeira chamada (cache frio) não define o lote
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= MIN_SAMPLE_SECONDS:
+            return number
+        number *= 2
+
+
+def measure(fn, rounds: int):
+    number = batch_size(fn)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return dict(summarize(samples), number=number)
+
+
+def measure_cold(setup, fn, rounds: int = COLD_ROUNDS):
+    """Primeira chamada de fn(setup()), com um estado novo a cada rodada"""
+    samples = []
+    for _ in range(rounds):
+        state = setup()
+        start = time.perf_counter()
+        fn(state)
+        samples.append(time.perf_counter() - start)
+        state.pack.close()
+    return summarize(samples)
+
+
+def per_item(stats, count: int):
+    """Tempos de um lote divididos pelo número de itens"""
+    return {key: value / count if key.endswith("_us") else value for key, value in stats.items()}
+
+
+def bench_bank(results):
+    results["bank.construct"] = measure(lambda: QuestionBank().pack.close(), 50)
+
+
+def bench_random(results, size: int):
+    path = None if size == 226 else synthetic_pack_path(size)
+    try:
+        bank = QuestionBank(path)
+        topic = bank.get_all_topics()[0]
+        results[f"bank.random.{size}.cold"] = measure_cold(
+            lambda: QuestionBank(path), lambda cold: cold.get_random_questions(topic, 10)
+        )
+        results[f"bank.random.{size}.warm"] = measure(
+            lambda: bank.get_random_questions(topic, 10), 200
+        )
+        bank.pack.close()
+    finally:
+        if path:
+            os.remove(path)
+
+
+def bench_grading(results):
+    bank = QuestionBank()
+    questions = [q for topic in bank.get_all_topics() for q in bank.get_questions(topic)
+                 if q.kind == MULTIPLE]
+    rng = random.Random(5)
+    answers = [(q, str(rng.randrange(4))) for q in questions]
+    count = len(answers)
+
+    def grade_all():
+        for question, answer in answers:
+            grade_answer(question, answer)
+
+    results["grade.multiple"] = per_item(measure(grade_all, 200), count)
+
+    session = QuizSession()
+
+    def answer_session():
+        session.start(questions[:60])
+        for question, answer in answers[:60]:
+            session.answer(answer)
+            session.next()
+
+    results["session.answer"] = per_item(measure(answer_session, 500), 60)
+    bank.pack.close()
+
+
+def bench_render(results) -> bool:
+    """Renderização real (Tk); retorna False se não houver display"""
+    env, server = display_env()
+    if env is None:
+        return False
+    try:
+        os.environ["DISPLAY"] = env["DISPLAY"]
+        import tkinter as tk
+        from LPIC1 import LPIC1StudyApp
+
+        root = tk.Tk()
+        app = LPIC1StudyApp(root)
+        app.finish_startup()
+        root.update()
+
+        app.current_topic.set(app.question_bank.get_all_topics()[0])
+        app.start_test()
+        total = app.session.total_questions
+
+        def show():
+            app.session.go_to((app.session.current_index + 1) % total)
+            app.show_question()
+            root.update_idletasks()
+
+        results["render.show_question"] = measure(show, 1000)
+
+        for _ in range(total):
+            app.user_answer_var.set("0")
+            app.submit_answer()
+            app.next_question()
+
+        def feedback():
+            app.session.go_to((app.session.current_index + 1) % total)
+            app.show_answer_feedback()
+            root.update_idletasks()
+
+        results["render.show_feedback"] = measure(feedback, 1000)
+        app.on_close()
+        return True
+    finally:
+        if server is not None:
+            server.terminate()
+
+
+def compare(results, baseline_path: str, tolerance: float) -> bool:
+    """Compara com a execução anterior; True se não houver regressão
+
+    Regressão é o mínimo atual acima do p50 anterior mais a tolerância e do p95
+    anterior (a dispersão medida na própria execução de referência)."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    ok = True
+    print(f"\nComparação com {baseline_path} (tolerância {tolerance:.0%}):")
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["p50_us"]
+        ratio = stats["p50_us"] / before if before else 1.0
+        limit = max(before * (1 + tolerance), baseline[name]["p95_us"])
+        regressed = stats["min_us"] > limit
+        ok = ok and not regressed
+        flag = "REGRESSÃO" if regressed else "ok"
+        print(f"  {name:28} {before:12.2f} -> {stats['p50_us']:12.2f} µs  ({ratio:5.2f}x) {flag}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos do LPIC-1")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="tamanhos de banco para get_random_questions")
+    parser.add_argument("--json", dest="output", help="arquivo JSON de saída")
+    parser.add_argument("--compare", help="JSON de uma execução anterior")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="regressão aceita sobre o p50 anterior (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = {}
+    bench_bank(results)
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        bench_random(results, size)
+    bench_grading(results)
+    rendered = bench_render(results)
+
+    for name, stats in results.items():
+        print(f"{name:28} p50 {stats['p50_us']:12.2f} µs   p95 {stats['p95_us']:12.2f} µs")
+    if not rendered:
+        print("render.*: sem display (DISPLAY/Xvfb), não medido")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "render_measured": rendered,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare and not compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Gerador de carga para o servidor HTTP de testes (quiz_server.py)
+
+Cada cliente virtual abre uma conexão keep-alive e repete o fluxo de um aluno:
+cria uma sessão, lê e responde cada questão e pede o resultado. As latências
+de cada requisição vão para um histograma (instrumentation.LatencyHistogram).
+
+Por padrão o servidor é iniciado num subprocesso (um núcleo só para ele) numa
+porta livre do loopback; use --port para testar um servidor já em execução.
+
+Uso: python load_quiz_server.py [--clients 1000] [--sessions 5000] [--num 10]
+                                [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+from instrumentation import LatencyHistogram
+
+
+class Client:
+    """Conexão keep-alive de um aluno virtual"""
+
+    def __init__(self, reader, writer, histogram: LatencyHistogram):
+        self.reader = reader
+        self.writer = writer
+        self.histogram = histogram
+
+    async def request(self, method: str, path: str, data=None):
+        body = json.dumps(data).encode() if data is not None else b""
+        start = time.perf_counter_ns()
+        self.writer.write(b"%s %s HTTP/1.1\r\nHost: lpic1\r\nContent-Length: %d\r\n\r\n%s" % (
+            method.encode(), path.encode(), len(body), body))
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        status = int(head[9:12])
+        length = 0
+        for line in head.split(b"\r\n"):
+            if line[:15].lower() == b"content-length:":
+                length = int(line[15:])
+        payload = await self.reader.readexactly(length)
+        self.histogram.record(time.perf_counter_ns() - start)
+        if status >= 400:
+            raise RuntimeError(f"{method} {path}: {status} {payload.decode()}")
+        return json.loads(payload)
+
+
+async def student(client: Client, topics, num: int, rng: random.Random):
+    """Uma sessão completa: criar, responder todas, pedir o resultado"""
+    created = await client.request("POST", "/sessions", {"topic": rng.choice(topics), "num": num})
+    base = f"/sessions/{created['session']}"
+    for index in range(created["total"]):
+        await client.request("GET", f"{base}/questions/{index}")
+        await client.request("POST", f"{base}/answers",
+                             {"index": index, "answer": str(rng.randrange(4))})
+    await client.request("GET", f"{base}/results")
+
+
+async def run_load(host: str, port: int, clients: int, sessions: int, num: int):
+    histogram = LatencyHistogram()
+    connections = []
+    for _ in range(clients):
+        reader, writer = await asyncio.open_connection(host, port)
+        connections.append(Client(reader, writer, histogram))
+
+    topics = [entry["topic"] for entry in (await connections[0].request("GET", "/topics"))["topics"]]
+    remaining = [sessions]
+
+    async def worker(client: Client, seed: int):
+        rng = random.Random(seed)
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            await student(client, topics, num, rng)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(client, seed) for seed, client in enumerate(connections)))
+    elapsed = time.perf_counter() - start
+
+    for client in connections:
+        client.writer.close()
+    return histogram, elapsed
+
+
+def free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(host: str, port: int, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Servidor não respondeu em {host}:{port}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Carga no servidor HTTP de testes LPIC-1")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="servidor já em execução (sem subprocesso)")
+    parser.add_argument("--clients", type=int, default=1000, help="conexões simultâneas")
+    parser.add_argument("--sessions", type=int, default=5000, help="sessões no total")
+    parser.add_argument("--num", type=int, default=10, help="questões por sessão")
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port(args.host)
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(SRC_DIR, "quiz_server.py"),
+             "--host", args.host, "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        wait_for_server(args.host, port)
+        histogram, elapsed = asyncio.run(
+            run_load(args.host, port, args.clients, args.sessions, args.num)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    stats = histogram.summary()
+    print(f"{args.sessions} sessões, {args.clients} conexões, {stats['count']} requisições "
+          f"em {elapsed:.2f} s")
+    print(f"  {stats['count'] / elapsed:,.0f} req/s, {args.sessions / elapsed:,.0f} sessões/s")
+    print(f"  latência p50 {stats['p50_ms']:.2f} ms  p95 {stats['p95_ms']:.2f} ms  "
+          f"p99 {stats['p99_ms']:.2f} ms  máx {stats['max_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Banco de questões sintético para benchmarks
+
+Gera tópicos com o mesmo formato das fontes em src/questions e compila um
+pacote .qpack temporário com o número de questões pedido.
+"""
+
+import itertools
+import os
+import random
+import sys
+import tempfile
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+from question_pack import build_pack, load_sources
+
+WORDS = [
+    "kernel", "módulo", "partição", "sistema", "arquivo", "processo", "sinal",
+    "pacote", "biblioteca", "diretório", "permissão", "montagem", "inode",
+    "expressão", "filtro", "redirecionamento", "inicialização", "dispositivo",
+]
+
+# Vocabulário com frequências de Zipf, como em texto real
+VOCABULARY = WORDS + [f"termo{i}" for i in range(5000)]
+CUM_WEIGHTS = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+
+def synthetic_topics(total: int, seed: int = 42):
+    """Gera `total` questões distribuídas pelos tópicos reais do banco"""
+    rng = random.Random(seed)
+    keys = [topic["topic"] for topic in load_sources()]
+    per_topic = [total // len(keys) + (1 if i < total % len(keys) else 0) for i in range(len(keys))]
+
+    topics = []
+    for key, count in zip(keys, per_topic):
+        questions = []
+        for i in range(count):
+            words = " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=8))
+            questions.append({
+                "question": f"[{key} #{i}] Qual comando trata {words}?",
+                "type": "multiple",
+                "options": [f"cmd{rng.randrange(10000)}" for _ in range(4)],
+                "correct": rng.randrange(4),
+                "explanation": f"Explicação sintética: {words}.",
+            })
+        topics.append({"topic": key, "title": f"Sintético {key}", "questions": questions})
+    return topics
+
+
+def synthetic_pack_path(total: int, seed: int = 42) -> str:
+    """Compila um pacote sintético em arquivo temporário e retorna o caminho"""
+    fd, path = tempfile.mkstemp(suffix=".qpack")
+    with os.fdopen(fd, "wb") as f:
+        f.write(build_pack(synthetic_topics(total, seed)))
+    return path
@@ -14,6 +14,12 @@ try:
 except ImportError as e:
     print("✗ Pillow ERROR:", e)
 
+try:
+    import numpy
+    print("✓ NumPy OK (correção em lote)")
+except ImportError as e:
+    print("- NumPy ausente (opcional, correção em lote):", e)
+
 print("\nSystem PATH:")
 for path in sys.path[:10]:
     print(" ", path)
@@ -0,0 +1,25 @@
+"""
+Display para benchmarks de interface
+
+Usa o DISPLAY atual ou, se não houver, inicia um Xvfb temporário.
+"""
+
+import os
+import shutil
+import subprocess
+import time
+
+XVFB_DISPLAY = ":97"
+
+
+def display_env():
+    """Retorna (ambiente com display, processo Xvfb ou None); ambiente None se não houver display"""
+    if os.environ.get("DISPLAY"):
+        return dict(os.environ), None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return None, None
+    server = subprocess.Popen([xvfb, XVFB_DISPLAY, "-screen", "0", "1280x1024x24"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    return dict(os.environ, DISPLAY=XVFB_DISPLAY), server
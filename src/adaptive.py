@@ -0,0 +1,144 @@
+"""
+Sorteio adaptativo ponderado pelas fraquezas do usuário
+
+O peso de cada questão vem da taxa de erro do usuário (suavizada) e do tempo
+desde a última tentativa, de modo que questões erradas ou esquecidas aparecem
+mais. Os sorteios usam uma tabela de alias de Vose: montá-la custa O(n), mas
+cada sorteio custa O(1), então montar uma sessão de k questões custa O(k). A
+tabela é reconstruída de forma preguiçosa, só no próximo sorteio depois que
+algum peso mudou.
+"""
+
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DAY = 24 * 60 * 60
+RECENCY_DAYS = 7  # dias para o fator de esquecimento chegar ao máximo
+MAX_RECENCY_BONUS = 2.0
+MIN_WEIGHT = 0.05
+
+
+def weakness_weight(attempts: int, correct: int, last_at: Optional[float], now: float) -> float:
+    """Peso de sorteio: taxa de erro suavizada x fator de esquecimento"""
+    error_rate = (attempts - correct + 1) / (attempts + 2)
+    if last_at is None:
+        recency = MAX_RECENCY_BONUS
+    else:
+        recency = min((now - last_at) / (RECENCY_DAYS * DAY), MAX_RECENCY_BONUS)
+    return max(MIN_WEIGHT, error_rate * (1 + recency))
+
+
+class AliasTable:
+    """Tabela de alias de Vose para sorteios ponderados em O(1)"""
+
+    __slots__ = ("prob", "alias", "size")
+
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        if size == 0:
+            raise ValueError("Tabela de alias sem pesos")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("Soma dos pesos deve ser positiva")
+
+        scaled = [w * size / total for w in weights]
+        prob = [0.0] * size
+        alias = [0] * size
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Sobras (erro de arredondamento) ficam com probabilidade 1
+        for i in large:
+            prob[i] = 1.0
+        for i in small:
+            prob[i] = 1.0
+
+        self.prob = prob
+        self.alias = alias
+        self.size = size
+
+    def draw(self, rng=random) -> int:
+        """Sorteia um índice com probabilidade proporcional ao peso"""
+        column = int(rng.random() * self.size)
+        return column if rng.random() < self.prob[column] else self.alias[column]
+
+
+class AdaptiveSampler:
+    """Sorteador adaptativo das questões de um tópico"""
+
+    def __init__(self, question_ids: List[str],
+                 stats: Optional[Dict[str, Tuple[int, int, float]]] = None,
+                 now: Optional[float] = None):
+        if now is None:
+            now = time.time()
+        stats = stats or {}
+        self.question_ids = question_ids
+        self._position = {qid: i for i, qid in enumerate(question_ids)}
+        self.attempts = [0] * len(question_ids)
+        self.correct = [0] * len(question_ids)
+        self.last_at: List[Optional[float]] = [None] * len(question_ids)
+        for qid, (attempts, correct, last_at) in stats.items():
+            i = self._position.get(qid)
+            if i is not None:
+                self.attempts[i] = attempts
+                self.correct[i] = correct
+                self.last_at[i] = last_at
+
+        self.weights = [
+            weakness_weight(self.attempts[i], self.correct[i], self.last_at[i], now)
+            for i in range(len(question_ids))
+        ]
+        self._table: Optional[AliasTable] = None
+
+    def __len__(self) -> int:
+        return len(self.question_ids)
+
+    def record(self, question_id: str, correct: bool, now: Optional[float] = None):
+        """Atualiza o peso de uma questão após uma resposta (tabela fica suja)"""
+        i = self._position.get(question_id)
+        if i is None:
+            return
+        if now is None:
+            now = time.time()
+        self.attempts[i] += 1
+        self.correct[i] += int(correct)
+        self.last_at[i] = now
+        self.weights[i] = weakness_weight(self.attempts[i], self.correct[i], now, now)
+        self._table = None
+
+    def sample(self, num: int, rng=random) -> List[int]:
+        """Sorteia `num` índices distintos, ponderados pelos pesos atuais"""
+        size = len(self.question_ids)
+        num = min(num, size)
+        if num == 0:
+            return []
+
+        # Amostra grande perto do tamanho do tópico: chaves de Efraimidis-Spirakis
+        if num * 2 > size:
+            keys = sorted(range(size), key=lambda i: rng.random() ** (1.0 / self.weights[i]),
+                          reverse=True)
+            return keys[:num]
+
+        if self._table is None:
+            self._table = AliasTable(self.weights)
+        table = self._table
+        chosen = []
+        seen = set()
+        while len(chosen) < num:
+            i = table.draw(rng)
+            if i not in seen:
+                seen.add(i)
+                chosen.append(i)
+        return chosen
@@ -0,0 +1,354 @@
+"""
+Histórico persistente de tentativas (SQLite em modo WAL)
+
+Cada resposta submetida vira uma linha em `attempts`. A gravação é feita por
+uma thread de fundo que agrupa as tentativas em lotes, então quem chama
+`record()` (o submit_answer da interface) nunca espera pelo disco. As tabelas
+`topic_stats` e `question_stats` são mantidas agregadas na mesma transação,
+de modo que as consultas por tópico e por questão são leituras por chave
+primária, independentes do tamanho do histórico. Tentativas ainda na fila do
+escritor entram nessas consultas pela memória, sem esperar pelo disco.
+
+Os exercícios práticos (terminal simulado) ficam em `exercise_attempts`, fora
+de `attempts`: não são questões e não entram nos pesos adaptativos, na revisão
+espaçada nem na análise de itens.
+"""
+
+import getpass
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_DB_PATH = os.environ.get(
+    "LPIC1_HISTORY_DB",
+    os.path.join(os.path.expanduser("~"), ".lpic1", "history.db"),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id          INTEGER PRIMARY KEY,
+    user        TEXT    NOT NULL,
+    question_id TEXT    NOT NULL,
+    topic       TEXT    NOT NULL,
+    answer      TEXT    NOT NULL,
+    correct     INTEGER NOT NULL,
+    answered_at REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_user_time ON attempts (user, answered_at);
+CREATE INDEX IF NOT EXISTS idx_attempts_user_question ON attempts (user, question_id);
+CREATE INDEX IF NOT EXISTS idx_attempts_user_topic ON attempts (user, topic);
+CREATE INDEX IF NOT EXISTS idx_attempts_question ON attempts (question_id);
+
+CREATE TABLE IF NOT EXISTS topic_stats (
+    user     TEXT    NOT NULL,
+    topic    TEXT    NOT NULL,
+    attempts INTEGER NOT NULL,
+    correct  INTEGER NOT NULL,
+    PRIMARY KEY (user, topic)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS question_stats (
+    user        TEXT    NOT NULL,
+    question_id TEXT    NOT NULL,
+    topic       TEXT    NOT NULL,
+    attempts    INTEGER NOT NULL,
+    correct     INTEGER NOT NULL,
+    last_at     REAL    NOT NULL,
+    PRIMARY KEY (user, question_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_question_stats_topic ON question_stats (user, topic);
+
+CREATE TABLE IF NOT EXISTS review_cards (
+    user        TEXT    NOT NULL,
+    question_id TEXT    NOT NULL,
+    topic       TEXT    NOT NULL,
+    ease        REAL    NOT NULL,
+    interval    REAL    NOT NULL,
+    reps        INTEGER NOT NULL,
+    due         REAL    NOT NULL,
+    PRIMARY KEY (user, question_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS exercise_attempts (
+    id           INTEGER PRIMARY KEY,
+    user         TEXT    NOT NULL,
+    exercise_id  TEXT    NOT NULL,
+    topic        TEXT    NOT NULL,
+    correct      INTEGER NOT NULL,
+    attempted_at REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_exercise_attempts_user ON exercise_attempts (user, exercise_id);
+"""
+
+# Históricos antigos gravavam os exercícios (ids "ex-...", resposta "exercicio")
+# como tentativas de questão: move-os para exercise_attempts e desfaz os agregados
+EXERCISE_ROWS = "question_id >= 'ex-' AND question_id < 'ex.' AND answer = 'exercicio'"
+MIGRATE_EXERCISES = f"""
+INSERT INTO exercise_attempts (user, exercise_id, topic, correct, attempted_at)
+    SELECT user, question_id, topic, correct, answered_at FROM attempts
+    WHERE {EXERCISE_ROWS} ORDER BY id;
+UPDATE topic_stats SET
+    attempts = attempts - (SELECT COUNT(*) FROM attempts a WHERE a.user = topic_stats.user
+                           AND a.topic = topic_stats.topic AND {EXERCISE_ROWS}),
+    correct = correct - (SELECT COALESCE(SUM(correct), 0) FROM attempts a
+                         WHERE a.user = topic_stats.user AND a.topic = topic_stats.topic
+                         AND {EXERCISE_ROWS});
+DELETE FROM topic_stats WHERE attempts <= 0;
+DELETE FROM question_stats WHERE question_id >= 'ex-' AND question_id < 'ex.';
+DELETE FROM attempts WHERE {EXERCISE_ROWS};
+"""
+
+INSERT_ATTEMPT = (
+    "INSERT INTO attempts (user, question_id, topic, answer, correct, answered_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+UPSERT_TOPIC = (
+    "INSERT INTO topic_stats (user, topic, attempts, correct) VALUES (?, ?, 1, ?) "
+    "ON CONFLICT (user, topic) DO UPDATE SET "
+    "attempts = attempts + 1, correct = correct + excluded.correct"
+)
+UPSERT_QUESTION = (
+    "INSERT INTO question_stats (user, question_id, topic, attempts, correct, last_at) "
+    "VALUES (?, ?, ?, 1, ?, ?) "
+    "ON CONFLICT (user, question_id) DO UPDATE SET "
+    "attempts = attempts + 1, correct = correct + excluded.correct, "
+    "last_at = MAX(last_at, excluded.last_at)"
+)
+INSERT_EXERCISE = (
+    "INSERT INTO exercise_attempts (user, exercise_id, topic, correct, attempted_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+UPSERT_CARD = (
+    "INSERT OR REPLACE INTO review_cards (user, question_id, topic, ease, interval, reps, due) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Tipos de item na fila do escritor
+ATTEMPT = 0
+CARD = 1
+EXERCISE = 2
+
+_STOP = object()
+
+log = logging.getLogger(__name__)
+
+
+def default_user() -> str:
+    """Usuário do sistema operacional, usado quando nenhum é informado"""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "default"
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class AttemptStore:
+    """Armazena tentativas com escrita em lote numa thread de fundo"""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, batch_size: int = 256,
+                 flush_interval: float = 0.5):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._error: Optional[sqlite3.Error] = None  # lote perdido, levantado em flush/close
+
+        # Tentativas ainda não gravadas (id da linha -> linha). O escritor só as
+        # retira depois do commit, com o lock, e as consultas leem banco e
+        # pendentes com o mesmo lock: nenhuma tentativa é contada duas vezes
+        self._pending: Dict[int, Tuple] = {}
+        self._pending_lock = threading.Lock()
+
+        # Conexão de leitura (thread de quem criou o store)
+        self._conn = _connect(path)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        if self._conn.execute(f"SELECT 1 FROM attempts WHERE {EXERCISE_ROWS} LIMIT 1").fetchone():
+            self._conn.executescript(f"BEGIN; {MIGRATE_EXERCISES} COMMIT;")
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="AttemptWriter", daemon=True)
+        self._writer.start()
+
+    def record(self, user: str, question_id: str, topic: str, answer: str,
+               correct: bool, answered_at: Optional[float] = None):
+        """Enfileira uma tentativa; retorna imediatamente"""
+        if answered_at is None:
+            answered_at = time.time()
+        row = (user, question_id, topic, answer, int(correct), answered_at)
+        self._pending[id(row)] = row
+        self._queue.put((ATTEMPT, row))
+
+    def record_card(self, user: str, card):
+        """Enfileira o estado atualizado de um cartão de revisão"""
+        self._queue.put((CARD, (user, card.question_id, card.topic, card.ease,
+                                card.interval, card.reps, card.due)))
+
+    def record_exercise(self, user: str, exercise_id: str, topic: str, correct: bool,
+                        attempted_at: Optional[float] = None):
+        """Enfileira a verificação de um exercício prático (fora das tentativas de questão)"""
+        if attempted_at is None:
+            attempted_at = time.time()
+        self._queue.put((EXERCISE, (user, exercise_id, topic, int(correct), attempted_at)))
+
+    def load_cards(self, user: str) -> List[Tuple]:
+        """Cartões de revisão salvos: (question_id, topic, ease, interval, reps, due)"""
+        return self._conn.execute(
+            "SELECT question_id, topic, ease, interval, reps, due FROM review_cards WHERE user = ?",
+            (user,),
+        ).fetchall()
+
+    def flush(self):
+        """Bloqueia até que todas as tentativas enfileiradas estejam gravadas
+
+        Levanta o sqlite3.Error de um lote que a thread não conseguiu gravar."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Grava o que falta, encerra a thread e fecha as conexões (levanta como flush)"""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._conn.close()
+        self._raise_error()
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _write_loop(self):
+        conn = _connect(self.path)
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            # Junta o que chegar até encher o lote ou passar o intervalo
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not _STOP and len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if item is not _STOP]
+            running = len(rows) == len(batch)
+            try:
+                with self._pending_lock:
+                    try:
+                        if rows:
+                            self._write_batch(conn, rows)
+                    finally:
+                        for kind, row in rows:
+                            if kind == ATTEMPT:
+                                self._pending.pop(id(row), None)
+            except sqlite3.Error as e:
+                # Sem interface nesta thread: registra e guarda para o próximo flush/close
+                log.error("histórico: lote de %d itens não gravado: %s", len(rows), e)
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    @staticmethod
+    def _write_batch(conn: sqlite3.Connection, items: List[Tuple]):
+        rows = [row for kind, row in items if kind == ATTEMPT]
+        cards = [row for kind, row in items if kind == CARD]
+        exercises = [row for kind, row in items if kind == EXERCISE]
+        with conn:
+            if cards:
+                conn.executemany(UPSERT_CARD, cards)
+            if exercises:
+                conn.executemany(INSERT_EXERCISE, exercises)
+            conn.executemany(INSERT_ATTEMPT, rows)
+            conn.executemany(UPSERT_TOPIC, [(user, topic, correct)
+                                            for user, _, topic, _, correct, _ in rows])
+            conn.executemany(UPSERT_QUESTION, [(user, qid, topic, correct, at)
+                                               for user, qid, topic, _, correct, at in rows])
+
+    def _pending_rows(self, user: str) -> List[Tuple]:
+        # Chamar com _pending_lock: o que o escritor ainda não gravou
+        return [row for row in self._pending.copy().values() if row[0] == user]
+
+    def topic_stats(self, user: str) -> Dict[str, Tuple[int, int]]:
+        """Tentativas e acertos por tópico: {tópico: (tentativas, acertos)}"""
+        with self._pending_lock:
+            rows = self._conn.execute(
+                "SELECT topic, attempts, correct FROM topic_stats WHERE user = ?", (user,)
+            ).fetchall()
+            pending = self._pending_rows(user)
+        stats = {topic: (attempts, correct) for topic, attempts, correct in rows}
+        for _, _, topic, _, correct, _ in pending:
+            attempts, total = stats.get(topic, (0, 0))
+            stats[topic] = (attempts + 1, total + correct)
+        return stats
+
+    def question_stats(self, user: str, topic: Optional[str] = None) -> Dict[str, Tuple[int, int, float]]:
+        """Tentativas, acertos e última tentativa por questão"""
+        with self._pending_lock:
+            if topic is None:
+                rows = self._conn.execute(
+                    "SELECT question_id, attempts, correct, last_at FROM question_stats "
+                    "WHERE user = ?",
+                    (user,),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT question_id, attempts, correct, last_at FROM question_stats "
+                    "WHERE user = ? AND topic = ?",
+                    (user, topic),
+                ).fetchall()
+            pending = self._pending_rows(user)
+        stats = {qid: (attempts, correct, last_at) for qid, attempts, correct, last_at in rows}
+        for _, qid, row_topic, _, correct, at in pending:
+            if topic is None or row_topic == topic:
+                attempts, total, last_at = stats.get(qid, (0, 0, at))
+                stats[qid] = (attempts + 1, total + correct, max(last_at, at))
+        return stats
+
+    def question_summary(self, user: str, question_id: str) -> Optional[Tuple[int, int, float]]:
+        """Tentativas, acertos e última tentativa de uma questão"""
+        return self._conn.execute(
+            "SELECT attempts, correct, last_at FROM question_stats WHERE user = ? AND question_id = ?",
+            (user, question_id),
+        ).fetchone()
+
+    def iter_attempts(self, after_id: int = 0) -> Iterator[Tuple]:
+        """Tentativas de todos os usuários com id maior que `after_id`, em ordem:
+        (id, user, question_id, topic, answer, correct)"""
+        return self._conn.execute(
+            "SELECT id, user, question_id, topic, answer, correct FROM attempts "
+            "WHERE id > ? ORDER BY id",
+            (after_id,),
+        )
+
+    def exercise_stats(self, user: str) -> Dict[str, Tuple[int, int]]:
+        """Verificações e acertos por exercício prático: {exercício: (tentativas, acertos)}"""
+        rows = self._conn.execute(
+            "SELECT exercise_id, COUNT(*), SUM(correct) FROM exercise_attempts "
+            "WHERE user = ? GROUP BY exercise_id",
+            (user,),
+        )
+        return {exercise_id: (attempts, correct) for exercise_id, attempts, correct in rows}
+
+    def recent_attempts(self, user: str, limit: int = 50) -> List[Tuple]:
+        """Últimas tentativas do usuário, da mais recente para a mais antiga"""
+        return self._conn.execute(
+            "SELECT question_id, topic, answer, correct, answered_at FROM attempts "
+            "WHERE user = ? ORDER BY answered_at DESC LIMIT ?",
+            (user, limit),
+        ).fetchall()
@@ -0,0 +1,429 @@
+"""
+Correção em lote de folhas de resposta (simulados aplicados offline)
+
+As folhas (JSONL ou CSV) são carregadas numa matriz de respostas
+alunos x questões e corrigidas de uma vez contra o vetor de gabarito, com
+operações vetorizadas do NumPy, em vez de chamar grade_answer questão por
+questão como o submit_answer.
+
+Cada resposta é guardada como máscara de bits das opções marcadas (opção 2 ->
+0b100), o que cobre também questões "escolha duas" (opções 0 e 2 -> 0b101):
+a resposta está certa quando a máscara é igual à do gabarito. Zero significa
+questão em branco.
+
+Formatos das folhas:
+    JSONL   {"student": "ana", "answers": {"<id da questão>": 2, "<id>": [0, 2]}}
+            (ou "answers": [2, [0, 2], null, ...] na ordem do gabarito)
+    CSV     student,<id da questão>,<id>,...
+            ana,2,0;2,,...          (várias opções separadas por ";" ou "|")
+
+Uma folha inválida (JSON malformado, opção fora do intervalo, mais respostas
+que questões no gabarito) não interrompe a correção: vira uma linha
+{"student", "error"} no resultado, na sua posição, e fica fora das
+estatísticas da turma.
+
+Arquivos grandes são lidos em blocos de folhas e corrigidos em paralelo num
+ProcessPoolExecutor (grade_file): o gabarito vai uma vez para cada processo,
+os resultados são gravados à medida que os blocos terminam e só alguns blocos
+ficam em memória por vez, qualquer que seja o tamanho do arquivo.
+
+Requer NumPy (pip install numpy).
+"""
+
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+import numpy as np
+
+from question import MULTIPLE
+
+MAX_OPTIONS = 16
+DEFAULT_CHUNK_SIZE = 5000
+MASK_DTYPE = np.uint16
+
+Answer = Union[None, int, str, Sequence[int]]
+
+# Erros que tornam uma folha inválida (json.JSONDecodeError é um ValueError)
+SHEET_ERRORS = (ValueError, TypeError, AttributeError)
+
+
+def answer_mask(answer: Answer) -> int:
+    """Máscara de bits de uma resposta: 2 -> 0b100, [0, 2] ou "0;2" -> 0b101"""
+    if isinstance(answer, list):
+        answer = tuple(answer)
+    return _answer_mask(answer)
+
+
+@lru_cache(maxsize=1024)  # as mesmas respostas ("0", "1", [0, 2]...) se repetem muito
+def _answer_mask(answer: Answer) -> int:
+    if answer is None or answer == "":
+        return 0
+    if isinstance(answer, int):
+        options = (answer,)
+    elif isinstance(answer, str):
+        options = [int(part) for part in answer.replace("|", ";").replace(",", ";").split(";")
+                   if part.strip()]
+    else:
+        options = answer
+    mask = 0
+    for option in options:
+        if not 0 <= option < MAX_OPTIONS:
+            raise ValueError(f"Opção fora do intervalo: {option}")
+        mask |= 1 << option
+    return mask
+
+
+def _mask_row(items, width: int) -> List[int]:
+    """Linha da matriz a partir de pares (coluna, resposta)"""
+    row = [0] * width
+    for column, answer in items:
+        if column is None or answer is None:
+            continue
+        row[column] = _answer_mask(tuple(answer) if isinstance(answer, list) else answer)
+    return row
+
+
+def _check_length(count: int, width: int):
+    if count > width:
+        raise ValueError(f"folha com {count} respostas, o gabarito tem {width} questões")
+
+
+class AnswerKey:
+    """Gabarito: ids, tópicos e máscara correta de cada coluna"""
+
+    def __init__(self, question_ids: List[str], topics: List[str], masks: Sequence[int]):
+        if not len(question_ids) == len(topics) == len(masks):
+            raise ValueError("Gabarito com tamanhos diferentes")
+        self.question_ids = question_ids
+        self.topics = topics
+        self.masks = np.asarray(masks, dtype=MASK_DTYPE)
+        self.column = {question_id: i for i, question_id in enumerate(question_ids)}
+        self.topic_names = list(dict.fromkeys(topics))
+        topic_position = {topic: i for i, topic in enumerate(self.topic_names)}
+        self.topic_index = np.array([topic_position[topic] for topic in topics], dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.question_ids)
+
+    @classmethod
+    def from_questions(cls, questions: Iterable) -> "AnswerKey":
+        """Gabarito de uma lista de Question (questões de texto são ignoradas)"""
+        questions = [question for question in questions if question.kind == MULTIPLE]
+        return cls(
+            [question.id for question in questions],
+            [question.topic for question in questions],
+            [1 << question.correct for question in questions],
+        )
+
+    @classmethod
+    def from_bank(cls, bank, topics: Optional[Iterable[str]] = None) -> "AnswerKey":
+        """Gabarito com todas as questões dos tópicos do banco (padrão: todos)"""
+        topics = list(topics) if topics is not None else bank.get_all_topics()
+        return cls.from_questions(
+            question for topic in topics for question in bank.get_questions(topic)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "AnswerKey":
+        """Gabarito em JSON: {"questions": [{"id", "topic", "correct": 2 ou [0, 2]}]}"""
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)["questions"]
+        return cls(
+            [entry["id"] for entry in entries],
+            [entry.get("topic", "") for entry in entries],
+            [answer_mask(entry["correct"]) for entry in entries],
+        )
+
+
+class ResponseMatrix:
+    """Respostas de vários alunos como máscaras (alunos x questões)
+
+    errors: folhas inválidas, como (posição entre as folhas lidas, aluno, mensagem)."""
+
+    def __init__(self, students: List[str], responses: np.ndarray,
+                 errors: Optional[List[Tuple[int, str, str]]] = None):
+        self.students = students
+        self.responses = responses
+        self.errors = errors or []
+
+    def __len__(self) -> int:
+        return len(self.students)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Union[Dict, str]], key: AnswerKey) -> "ResponseMatrix":
+        """Monta a matriz a partir de folhas (dicts ou linhas do JSONL)"""
+        students = []
+        rows = []
+        errors = []
+        width = len(key)
+        for position, record in enumerate(records):
+            student = str(position)
+            try:
+                if isinstance(record, str):
+                    record = json.loads(record)
+                student = str(record.get("student", position))
+                answers = record.get("answers") or {}
+                if isinstance(answers, dict):
+                    items = ((key.column.get(question_id), answer)
+                             for question_id, answer in answers.items())
+                else:
+                    _check_length(len(answers), width)
+                    items = enumerate(answers)
+                row = _mask_row(items, width)
+            except SHEET_ERRORS as error:
+                errors.append((position, student, str(error)))
+                continue
+            students.append(student)
+            rows.append(row)
+        return cls(students, np.array(rows, dtype=MASK_DTYPE).reshape(len(rows), width), errors)
+
+    @classmethod
+    def from_jsonl_lines(cls, lines: Iterable[str], key: AnswerKey) -> "ResponseMatrix":
+        return cls.from_records((line for line in lines if line.strip()), key)
+
+    @classmethod
+    def from_csv_rows(cls, header: Sequence[str], rows: Iterable[Sequence[str]],
+                      key: AnswerKey) -> "ResponseMatrix":
+        """Linhas de CSV (cabeçalho: student, ids das questões)"""
+        columns = [key.column.get(question_id) for question_id in header[1:]]
+        students = []
+        masks = []
+        errors = []
+        for position, row in enumerate(row for row in rows if row):
+            try:
+                _check_length(len(row) - 1, len(columns))
+                mask = _mask_row(zip(columns, row[1:]), len(key))
+            except SHEET_ERRORS as error:
+                errors.append((position, row[0], str(error)))
+                continue
+            students.append(row[0])
+            masks.append(mask)
+        return cls(students, np.array(masks, dtype=MASK_DTYPE).reshape(len(masks), len(key)),
+                   errors)
+
+    @classmethod
+    def load(cls, path: str, key: AnswerKey) -> "ResponseMatrix":
+        """Lê um arquivo de folhas (.jsonl ou .csv)"""
+        with open(path, encoding="utf-8", newline="") as f:
+            if path.endswith(".csv"):
+                reader = csv.reader(f)
+                return cls.from_csv_rows(next(reader), reader, key)
+            return cls.from_jsonl_lines(f, key)
+
+
+class GradeReport:
+    """Resultado da correção: acertos por aluno, por tópico e por questão"""
+
+    def __init__(self, key: AnswerKey, sheets: ResponseMatrix):
+        responses = sheets.responses
+        self.key = key
+        self.students = sheets.students
+        self.errors = sheets.errors
+        self.correct = (responses == key.masks) & (responses != 0)
+        self.answered = responses != 0
+
+        # Contagens por tópico: soma das colunas de cada tópico (alunos x tópicos)
+        topic_count = len(key.topic_names)
+        one_hot = np.zeros((len(key), topic_count), dtype=np.int32)
+        one_hot[np.arange(len(key)), key.topic_index] = 1
+        self.topic_correct = self.correct.astype(np.int32) @ one_hot
+        self.topic_totals = one_hot.sum(axis=0)
+
+        self.scores = self.correct.sum(axis=1)
+        self.question_correct = self.correct.sum(axis=0)
+        self.question_answered = self.answered.sum(axis=0)
+        # Vezes que cada opção foi marcada, por questão (questões x opções)
+        options = int(responses.max(initial=0)).bit_length()
+        self.option_counts = np.zeros((len(key), options), dtype=np.int64)
+        for bit in range(options):
+            self.option_counts[:, bit] = ((responses >> bit) & 1).sum(axis=0)
+
+    @property
+    def percentages(self) -> np.ndarray:
+        return self.scores * 100.0 / max(len(self.key), 1)
+
+    def student_results(self) -> List[Dict]:
+        """Nota e acertos por tópico de cada aluno; folhas inválidas, na sua posição,
+        como {"student", "error"}"""
+        totals = self.topic_totals.tolist()
+        results = []
+        for student, score, percentage, by_topic in zip(
+            self.students, self.scores.tolist(), self.percentages.tolist(),
+            self.topic_correct.tolist()
+        ):
+            results.append({
+                "student": student,
+                "correct": score,
+                "total": len(self.key),
+                "percentage": percentage,
+                "topics": {topic: [hits, total] for topic, hits, total
+                           in zip(self.key.topic_names, by_topic, totals)},
+            })
+        for position, student, message in self.errors:  # posições crescentes
+            results.insert(position, {"student": student, "error": message})
+        return results
+
+    def totals(self) -> "GradeTotals":
+        totals = GradeTotals(self.key)
+        totals.add_report(self)
+        return totals
+
+    def topic_results(self) -> Dict[str, Dict]:
+        return self.totals().topic_results()
+
+    def question_results(self) -> List[Dict]:
+        return self.totals().question_results()
+
+
+class GradeTotals:
+    """Contagens da turma somadas ao longo de várias correções (arquivo em blocos)"""
+
+    def __init__(self, key: AnswerKey):
+        self.key = key
+        self.students = 0
+        self.errors = 0  # folhas inválidas, fora das contagens
+        self.topic_correct = np.zeros(len(key.topic_names), dtype=np.int64)
+        self.topic_totals = np.bincount(key.topic_index, minlength=len(key.topic_names))
+        self.question_correct = np.zeros(len(key), dtype=np.int64)
+        self.question_answered = np.zeros(len(key), dtype=np.int64)
+        self.option_counts = np.zeros((len(key), MAX_OPTIONS), dtype=np.int64)
+
+    def add(self, students: int, topic_correct, question_correct, question_answered,
+            option_counts, errors: int = 0):
+        self.students += students
+        self.errors += errors
+        self.topic_correct += topic_correct
+        self.question_correct += question_correct
+        self.question_answered += question_answered
+        self.option_counts[:, :option_counts.shape[1]] += option_counts
+
+    def add_report(self, report: GradeReport):
+        self.add(len(report.students), report.topic_correct.sum(axis=0), report.question_correct,
+                 report.question_answered, report.option_counts, len(report.errors))
+
+    def topic_results(self) -> Dict[str, Dict]:
+        """Percentual médio de acerto de cada tópico na turma"""
+        students = max(self.students, 1)
+        return {
+            topic: {
+                "questions": int(total),
+                "mean_percentage": float(hits * 100.0 / (total * students)) if total else 0.0,
+            }
+            for topic, hits, total in zip(self.key.topic_names, self.topic_correct,
+                                          self.topic_totals)
+        }
+
+    def question_results(self) -> List[Dict]:
+        """Acerto, respostas e escolhas por opção de cada questão"""
+        students = max(self.students, 1)
+        used = int(self.option_counts.any(axis=0).nonzero()[0].max(initial=-1)) + 1
+        return [
+            {
+                "id": question_id,
+                "topic": topic,
+                "answered": answered,
+                "correct": correct,
+                "p_value": correct / students,
+                "options": counts[:used],
+            }
+            for question_id, topic, answered, correct, counts in zip(
+                self.key.question_ids, self.key.topics, self.question_answered.tolist(),
+                self.question_correct.tolist(), self.option_counts.tolist()
+            )
+        ]
+
+    def summary(self) -> Dict:
+        return {
+            "students": self.students,
+            "errors": self.errors,
+            "topics": self.topic_results(),
+            "questions": self.question_results(),
+        }
+
+
+def grade(key: AnswerKey, sheets: ResponseMatrix) -> GradeReport:
+    """Corrige todas as folhas de uma vez"""
+    return GradeReport(key, sheets)
+
+
+# --- Arquivos grandes: blocos em paralelo -----------------------------------
+
+_worker_key: Optional[AnswerKey] = None
+
+
+def iter_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple]:
+    """Blocos (cabeçalho CSV ou None, linhas) de até `chunk_size` folhas"""
+    with open(path, encoding="utf-8", newline="") as f:
+        header = None
+        rows: Iterator = f
+        if path.endswith(".csv"):
+            rows = csv.reader(f)
+            header = next(rows, None)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield header, chunk
+
+
+def grade_chunk(key: AnswerKey, header: Optional[Sequence[str]], rows: List) -> Tuple[str, Tuple]:
+    """Corrige um bloco; retorna (linhas JSONL por aluno, contagens para GradeTotals.add)"""
+    if header is None:
+        sheets = ResponseMatrix.from_jsonl_lines(rows, key)
+    else:
+        sheets = ResponseMatrix.from_csv_rows(header, rows, key)
+    report = grade(key, sheets)
+    text = "".join(json.dumps(result, ensure_ascii=False) + "\n"
+                   for result in report.student_results())
+    counts = (len(sheets), report.topic_correct.sum(axis=0), report.question_correct,
+              report.question_answered, report.option_counts, len(sheets.errors))
+    return text, counts
+
+
+def _init_worker(key: AnswerKey):
+    global _worker_key
+    _worker_key = key
+
+
+def _grade_chunk_in_worker(chunk: Tuple) -> Tuple[str, Tuple]:
+    header, rows = chunk
+    return grade_chunk(_worker_key, header, rows)
+
+
+def grade_file(path: str, key: AnswerKey, output: TextIO, workers: Optional[int] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               progress: Optional[Callable[[int], None]] = None) -> GradeTotals:
+    """Corrige um arquivo de folhas em blocos paralelos, gravando os resultados
+    (um JSON por aluno, na ordem do arquivo) à medida que ficam prontos"""
+    workers = workers or os.cpu_count() or 1
+    totals = GradeTotals(key)
+
+    def consume(result: Tuple[str, Tuple]):
+        text, counts = result
+        output.write(text)
+        totals.add(*counts)
+        if progress is not None:
+            progress(totals.students)
+
+    if workers == 1:
+        for header, rows in iter_chunks(path, chunk_size):
+            consume(grade_chunk(key, header, rows))
+        return totals
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(key,)) as pool:
+        # Poucos blocos em voo: a memória não depende do tamanho do arquivo
+        pending = deque()
+        for chunk in iter_chunks(path, chunk_size):
+            pending.append(pool.submit(_grade_chunk_in_worker, chunk))
+            if len(pending) >= 2 * workers:
+                consume(pending.popleft().result())
+        while pending:
+            consume(pending.popleft().result())
+    return totals
@@ -0,0 +1,214 @@
+"""
+Equivalência de comandos shell nas respostas de texto
+
+Em vez de exigir a grafia exata do gabarito, a resposta digitada é convertida
+numa forma canônica e comparada com a forma canônica das respostas aceitas:
+
+    ls -la /etc  ==  ls -al /etc  ==  ls -a -l /etc  ==  ls --all -l /etc
+
+Forma canônica de cada comando de uma linha (separados por |, ;, && ou ||):
+    comando     nome sem o caminho (/bin/ls -> ls), sem diferenciar maiúsculas;
+                é a única parte assim: ls -l e ls -L, /etc e /ETC são
+                respostas diferentes, e uma resposta de uma palavra com "/"
+                é um caminho, comparado inteiro
+    opções      agrupamentos curtos expandidos (-la -> -a -l), opções longas
+                conhecidas trocadas pela curta equivalente (--all -> -a),
+                argumento anexado ou separado unificado (-n5 == -n 5,
+                --lines=5 == -n 5), sem ordem (conjunto)
+    operandos   na ordem digitada (a ordem dos arquivos importa)
+
+O tar aceita ainda as opções sem hífen no primeiro argumento (tar czf).
+
+Só as opções com argumento e os sinônimos listados abaixo são conhecidos; para
+os demais comandos cada letra de um agrupamento vira uma opção. Comandos cujos
+argumentos são uma expressão (find, echo, printf) não são normalizados.
+
+As respostas aceitas de cada questão são compiladas uma vez (compile_answers,
+com cache) e a forma canônica das respostas digitadas também fica em cache,
+então corrigir custa uma análise da resposta e uma busca num conjunto,
+independente de quantas grafias equivalentes existam.
+"""
+
+import os
+import shlex
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple
+
+# Opções curtas que recebem argumento, por comando
+OPTION_ARGS = {
+    "head": "nc",
+    "tail": "nc",
+    "cut": "bcdf",
+    "sort": "kt",
+    "uniq": "fs",
+    "grep": "efmABC",
+    "egrep": "efmABC",
+    "fgrep": "efmABC",
+    "xargs": "nIL",
+    "tar": "fC",
+    "split": "lbn",
+    "nl": "bsw",
+    "od": "AtN",
+    "sed": "ef",
+    "awk": "Ff",
+    "useradd": "cdgGsu",
+    "usermod": "cdgGsul",
+    "kill": "s",
+    "nice": "n",
+    "renice": "npgu",
+    "mount": "to",
+    "mkfs": "t",
+    "ln": "t",
+    "cp": "t",
+    "mv": "t",
+    "ps": "opuU",
+    "journalctl": "unp",
+}
+
+# Sinônimos: opção longa (ou curta alternativa) -> opção curta canônica
+ALIASES = {
+    "ls": {"--all": "-a", "--almost-all": "-A", "--human-readable": "-h",
+           "--recursive": "-R", "--reverse": "-r", "--inode": "-i", "--directory": "-d"},
+    "rm": {"--recursive": "-r", "-R": "-r", "--force": "-f", "--interactive": "-i",
+           "--verbose": "-v"},
+    "cp": {"--recursive": "-r", "-R": "-r", "--force": "-f", "--interactive": "-i",
+           "--archive": "-a", "--preserve": "-p", "--verbose": "-v"},
+    "mv": {"--force": "-f", "--interactive": "-i", "--verbose": "-v"},
+    "mkdir": {"--parents": "-p", "--verbose": "-v", "--mode": "-m"},
+    "rmdir": {"--parents": "-p"},
+    "grep": {"--ignore-case": "-i", "--invert-match": "-v", "--count": "-c",
+             "--recursive": "-r", "--line-number": "-n", "--extended-regexp": "-E",
+             "--fixed-strings": "-F", "--files-with-matches": "-l", "--word-regexp": "-w",
+             "--regexp": "-e", "--file": "-f", "--max-count": "-m"},
+    "head": {"--lines": "-n", "--bytes": "-c"},
+    "tail": {"--lines": "-n", "--bytes": "-c", "--follow": "-f"},
+    "sort": {"--reverse": "-r", "--numeric-sort": "-n", "--unique": "-u", "--key": "-k",
+             "--field-separator": "-t", "--ignore-case": "-f"},
+    "cut": {"--delimiter": "-d", "--fields": "-f", "--characters": "-c", "--bytes": "-b"},
+    "uniq": {"--count": "-c", "--repeated": "-d", "--unique": "-u", "--ignore-case": "-i"},
+    "wc": {"--lines": "-l", "--words": "-w", "--bytes": "-c", "--chars": "-m"},
+    "tr": {"--delete": "-d", "--squeeze-repeats": "-s", "--complement": "-c"},
+    "chmod": {"--recursive": "-R", "--verbose": "-v"},
+    "chown": {"--recursive": "-R", "--verbose": "-v"},
+    "chgrp": {"--recursive": "-R", "--verbose": "-v"},
+    "tar": {"--create": "-c", "--extract": "-x", "--list": "-t", "--file": "-f",
+            "--gzip": "-z", "--bzip2": "-j", "--xz": "-J", "--verbose": "-v",
+            "--directory": "-C"},
+    "ln": {"--symbolic": "-s", "--force": "-f"},
+    "df": {"--human-readable": "-h", "--inodes": "-i"},
+    "du": {"--human-readable": "-h", "--summarize": "-s"},
+    "free": {"--human": "-h"},
+    "uname": {"--all": "-a", "--kernel-release": "-r"},
+    "kill": {"--signal": "-s"},
+}
+
+# Comandos em que "-N" é a forma curta de "-n N"
+NUMERIC_OPTION = {"head": "-n", "tail": "-n"}
+
+# Aceitam o primeiro agrupamento de opções sem o hífen (tar czf == tar -czf)
+DASHLESS_FIRST = frozenset(("tar",))
+
+# Argumentos formam uma expressão: comparados como digitados
+RAW_COMMANDS = frozenset(("find", "echo", "printf"))
+
+OPERATORS = frozenset(("|", ";", "&&", "||", "&"))
+
+Flag = Tuple[str, str]
+Segment = Tuple[str, Tuple[Flag, ...], Tuple[str, ...]]
+
+
+def tokenize(command: str) -> List[str]:
+    """Palavras e operadores da linha, com as regras de aspas do shell"""
+    lexer = shlex.shlex(command, posix=True, punctuation_chars="|;&<>")
+    lexer.whitespace_split = True
+    try:
+        return list(lexer)
+    except ValueError:  # aspas sem fechamento: separa só por espaços
+        return command.split()
+
+
+def normalize_segment(tokens: List[str]) -> Segment:
+    """Forma canônica de um comando simples"""
+    if not tokens:
+        return ("", (), ())
+    name = tokens[0]
+    if len(tokens) > 1:  # uma palavra só pode ser um caminho (/etc/fstab), não um comando
+        name = os.path.basename(name) or name
+    if "/" not in name:
+        name = name.lower()
+    if name in RAW_COMMANDS:
+        return (name, (), tuple(tokens[1:]))
+    if name in DASHLESS_FIRST and len(tokens) > 1 and not tokens[1].startswith("-"):
+        tokens = [tokens[0], "-" + tokens[1]] + tokens[2:]
+
+    with_args = OPTION_ARGS.get(name, "")
+    aliases = ALIASES.get(name, {})
+    numeric = NUMERIC_OPTION.get(name)
+    flags = set()
+    operands = []
+    end_of_options = False
+    i = 1
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if end_of_options or token == "-" or not token.startswith("-"):
+            operands.append(token)
+        elif token == "--":
+            end_of_options = True
+        elif token.startswith("--"):
+            option, equals, value = token.partition("=")
+            option = aliases.get(option, option)
+            if not equals and len(option) == 2 and option[1] in with_args and i < len(tokens):
+                value = tokens[i]
+                i += 1
+            flags.add((option, value))
+        elif numeric and token[1:].isdigit():
+            flags.add((numeric, token[1:]))
+        else:
+            for j in range(1, len(token)):
+                option = aliases.get("-" + token[j], "-" + token[j])
+                if option[1] in with_args:
+                    value = token[j + 1:]
+                    if not value and i < len(tokens):
+                        value = tokens[i]
+                        i += 1
+                    flags.add((option, value))
+                    break
+                flags.add((option, ""))
+    return (name, tuple(sorted(flags)), tuple(operands))
+
+
+@lru_cache(maxsize=65536)
+def canonical(command: str) -> Tuple:
+    """Forma canônica da linha: comandos normalizados intercalados com operadores"""
+    parts = []
+    segment: List[str] = []
+    for token in tokenize(command.strip()):
+        if token in OPERATORS:
+            parts.append(normalize_segment(segment))
+            parts.append(token)
+            segment = []
+        else:
+            segment.append(token)
+    parts.append(normalize_segment(segment))
+    return tuple(parts)
+
+
+class AnswerMatcher:
+    """Respostas aceitas de uma questão, pré-compiladas"""
+
+    __slots__ = ("literal", "forms")
+
+    def __init__(self, accepted: Tuple[str, ...]):
+        self.literal: FrozenSet[str] = frozenset(answer.strip() for answer in accepted)
+        self.forms: FrozenSet[Tuple] = frozenset(canonical(answer) for answer in accepted)
+
+    def matches(self, answer: str) -> bool:
+        """Aceita a grafia exata ou um comando equivalente"""
+        return answer.strip() in self.literal or canonical(answer) in self.forms
+
+
+@lru_cache(maxsize=4096)
+def compile_answers(accepted: Tuple[str, ...]) -> AnswerMatcher:
+    """Matcher das respostas aceitas (compilado uma vez por conjunto de respostas)"""
+    return AnswerMatcher(accepted)
@@ -0,0 +1,83 @@
+"""
+Simulado dos exames LPI 101/102
+
+Monta uma prova com questões de todos os tópicos, em quantidade proporcional
+ao peso oficial de cada objetivo (distribuição pelo método dos maiores
+restos). As questões são sorteadas sem reposição direto dos índices de cada
+tópico, sem copiar listas, de modo que o custo depende do tamanho da prova e
+não do tamanho do banco.
+"""
+
+import random
+from typing import Dict, List, Optional
+
+from question import Question
+
+EXAM_SIZE = 60
+
+# Pesos oficiais dos objetivos LPIC-1 (versão 5.0)
+OBJECTIVE_WEIGHTS = {
+    "101.1": 2, "101.2": 3, "101.3": 3,
+    "102.1": 2, "102.2": 2, "102.3": 1, "102.4": 3, "102.5": 3, "102.6": 1,
+    "103.1": 4, "103.2": 2, "103.3": 4, "103.4": 4, "103.5": 4, "103.6": 2,
+    "103.7": 3, "103.8": 3,
+    "104.1": 2, "104.2": 2, "104.3": 3, "104.5": 3, "104.6": 2, "104.7": 2,
+}
+
+
+def apportion(weights: Dict[str, float], total: int, capacity: Dict[str, int]) -> Dict[str, int]:
+    """Distribui `total` vagas proporcionalmente aos pesos (maiores restos),
+    respeitando a quantidade de questões disponível em cada tópico"""
+    counts = {topic: 0 for topic in weights}
+    remaining = min(total, sum(capacity.get(topic, 0) for topic in weights if weights[topic] > 0))
+    active = [topic for topic in weights if weights[topic] > 0 and capacity.get(topic, 0) > 0]
+
+    # Tópicos que esgotam saem da disputa e as vagas restantes são redistribuídas
+    while remaining > 0 and active:
+        weight_sum = sum(weights[topic] for topic in active)
+        quotas = {topic: remaining * weights[topic] / weight_sum for topic in active}
+        seats = {
+            topic: min(int(quotas[topic]), capacity[topic] - counts[topic])
+            for topic in active
+        }
+
+        leftover = remaining - sum(seats.values())
+        by_remainder = sorted(active, key=lambda topic: (int(quotas[topic]) - quotas[topic], topic))
+        for topic in by_remainder:
+            if leftover == 0:
+                break
+            if counts[topic] + seats[topic] < capacity[topic]:
+                seats[topic] += 1
+                leftover -= 1
+
+        for topic, seat_count in seats.items():
+            counts[topic] += seat_count
+        remaining = leftover
+        active = [topic for topic in active if counts[topic] < capacity[topic]]
+
+    return counts
+
+
+def build_exam(bank, total: int = EXAM_SIZE, weights: Optional[Dict[str, float]] = None,
+               rng: Optional[random.Random] = None) -> List[Question]:
+    """Monta um simulado com `total` questões de todos os tópicos do banco"""
+    rng = rng or random
+    weights = weights or OBJECTIVE_WEIGHTS
+    topics = bank.get_all_topics()
+
+    # Tópicos sem peso oficial entram com peso 1
+    topic_weights = {topic: weights.get(topic, 1) for topic in topics}
+    capacity = {topic: bank.get_topic_count(topic) for topic in topics}
+    counts = apportion(topic_weights, total, capacity)
+
+    exam = []
+    for topic in topics:
+        count = counts[topic]
+        if count == 0:
+            continue
+        # Sorteio sem reposição sobre o intervalo de índices (sem cópia)
+        for offset in rng.sample(range(capacity[topic]), count):
+            exam.append(bank.get_question(topic, offset))
+
+    rng.shuffle(exam)
+    return exam
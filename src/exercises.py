@@ -0,0 +1,131 @@
+"""
+Exercícios práticos do tópico 103 sobre o sistema de arquivos em memória (vfs)
+
+Cada exercício tem um enunciado, os comandos que montam a árvore inicial
+(executados como root) e uma solução de referência. A árvore inicial é
+montada uma única vez e congelada num snapshot; o estado esperado é um fork
+desse snapshot com a solução aplicada. Cada tentativa do aluno é outro fork:
+"Reiniciar" volta ao snapshot em O(1) e "Verificar" compara o estado do aluno
+com o esperado (vfs.diff), visitando só o que mudou desde o snapshot.
+"""
+
+from typing import Dict, List, Optional
+
+from vfs import FileSystem, Shell, Snapshot, diff
+
+
+class Exercise:
+    """Enunciado, árvore inicial e solução de referência"""
+
+    __slots__ = ("id", "topic", "title", "prompt", "setup", "solution", "user", "cwd")
+
+    def __init__(self, exercise_id: str, topic: str, title: str, prompt: str,
+                 setup: str, solution: str, user: str = "aluno", cwd: str = "/home/aluno"):
+        self.id = exercise_id
+        self.topic = topic
+        self.title = title
+        self.prompt = prompt
+        self.setup = setup
+        self.solution = solution
+        self.user = user
+        self.cwd = cwd
+
+
+HOME_SETUP = (
+    "mkdir -p /home/aluno /etc /tmp /var/log; chown aluno:aluno /home/aluno; "
+    "echo 'root:x:0:0:root:/root:/bin/bash' > /etc/passwd; "
+    "echo 'aluno:x:1000:1000:Aluno:/home/aluno:/bin/bash' >> /etc/passwd; "
+)
+
+EXERCISES = [
+    Exercise(
+        "ex-103.1-saudacao", "103.1", "Criando um arquivo com echo",
+        "Crie o arquivo ~/saudacao.txt contendo a linha 'Olá LPIC' e o diretório ~/bin.",
+        HOME_SETUP,
+        "echo 'Olá LPIC' > saudacao.txt; mkdir bin",
+    ),
+    Exercise(
+        "ex-103.3-logs", "103.3", "Organizando arquivos com globs",
+        "Em ~/projeto, crie o diretório logs e mova para ele todos os arquivos .log "
+        "(os demais arquivos devem continuar onde estão).",
+        HOME_SETUP + "mkdir /home/aluno/projeto; cd /home/aluno/projeto; "
+        "echo inicio > app.log; echo falha > erro.log; echo ideias > notas.txt; "
+        "echo vendas > relatorio.txt; chown -R aluno:aluno /home/aluno/projeto",
+        "cd projeto; mkdir logs; mv *.log logs",
+    ),
+    Exercise(
+        "ex-103.3-backup", "103.3", "Cópia recursiva",
+        "Faça uma cópia completa do diretório ~/config em ~/config.bak (incluindo "
+        "subdiretórios) e depois apague ~/config/cache e todo o seu conteúdo.",
+        HOME_SETUP + "mkdir -p /home/aluno/config/rede /home/aluno/config/cache; "
+        "echo 'eth0' > /home/aluno/config/rede/interfaces; echo 'x' > /home/aluno/config/cache/a.tmp; "
+        "echo 'tema=escuro' > /home/aluno/config/app.conf; chown -R aluno:aluno /home/aluno/config",
+        "cp -r config config.bak; rm -r config/cache",
+    ),
+    Exercise(
+        "ex-103.3-links", "103.3", "Links simbólicos e físicos",
+        "Em ~/versoes, crie o link simbólico 'atual' apontando para 'v2' e um link "
+        "físico ~/leiame.txt para ~/versoes/v2/LEIAME.",
+        HOME_SETUP + "mkdir -p /home/aluno/versoes/v1 /home/aluno/versoes/v2; "
+        "echo 'versão 2' > /home/aluno/versoes/v2/LEIAME; chown -R aluno:aluno /home/aluno/versoes",
+        "cd versoes; ln -s v2 atual; cd ..; ln versoes/v2/LEIAME leiame.txt",
+    ),
+    Exercise(
+        "ex-103.4-redirecao", "103.4", "Redirecionando a saída",
+        "Junte ~/parte1.txt e ~/parte2.txt (nessa ordem) em ~/completo.txt e acrescente "
+        "ao final de ~/historico.log a linha 'concluido'.",
+        HOME_SETUP + "cd /home/aluno; echo 'linha 1' > parte1.txt; echo 'linha 2' > parte2.txt; "
+        "echo 'inicio' > historico.log; chown aluno:aluno parte1.txt parte2.txt historico.log",
+        "cat parte1.txt parte2.txt > completo.txt; echo concluido >> historico.log",
+    ),
+]
+
+
+class ExerciseSession:
+    """Tentativa do aluno: shell sobre um fork da árvore inicial"""
+
+    def __init__(self, exercise: Exercise, start: Snapshot, expected: FileSystem):
+        self.exercise = exercise
+        self.start = start
+        self.expected = expected
+        self.fs = FileSystem(start)
+        self.shell = Shell(self.fs, exercise.user, exercise.cwd)
+
+    def run(self, line: str) -> str:
+        return self.shell.run(line)
+
+    def reset(self):
+        """Volta à árvore inicial (O(1))"""
+        self.fs.restore(self.start)
+        self.shell = Shell(self.fs, self.exercise.user, self.exercise.cwd)
+
+    def check(self) -> List[str]:
+        """Diferenças em relação ao estado esperado (lista vazia: correto)"""
+        return diff(self.expected, self.fs)
+
+    @property
+    def prompt(self) -> str:
+        return f"{self.exercise.user}:{self.shell.cwd_path}$ "
+
+
+_built: Dict[str, tuple] = {}
+
+
+def start_session(exercise: Exercise) -> ExerciseSession:
+    """Nova tentativa; a árvore inicial e o estado esperado são montados uma vez"""
+    built = _built.get(exercise.id)
+    if built is None:
+        fs = FileSystem()
+        Shell(fs, "root").run(exercise.setup)
+        start = fs.snapshot()
+        expected = FileSystem(start)
+        Shell(expected, exercise.user, exercise.cwd).run(exercise.solution)
+        built = _built[exercise.id] = (start, expected)
+    start, expected = built
+    return ExerciseSession(exercise, start, expected)
+
+
+def get_exercises(topic: Optional[str] = None) -> List[Exercise]:
+    """Exercícios do tópico (todos, se nenhum tópico ou se o tópico não tiver)"""
+    selected = [exercise for exercise in EXERCISES if exercise.topic == topic]
+    return selected or list(EXERCISES)
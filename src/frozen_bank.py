@@ -0,0 +1,249 @@
+"""
+Banco de questões congelado (somente leitura) para vários processos
+
+O QuestionBank decodifica o JSON de cada questão em dicts e listas próprios de
+cada processo; com N processos servindo questões, a memória cresce N vezes. O
+FrozenBank guarda todo o banco num único buffer plano, sem objetos Python por
+questão, que pode ficar num arquivo mapeado (mmap) ou em
+multiprocessing.shared_memory: todos os processos leem a mesma cópia física.
+
+Layout do buffer (little-endian):
+    cabeçalho   MAGIC (4s) | versão (H) | reservado (H) | tópicos (I) |
+                questões (I) | opções (I) | strings (I)
+    tópicos     por tópico: string da chave (I) | primeira (I) | quantidade (I)
+    registros   por questão: enunciado (I) | explicação (I) | id (I) |
+                primeira opção (I) | opções (H) | tipo (B) | correta (B)
+    opções      índices de string (I), em sequência por questão
+    offsets     (strings + 1) x Q, relativos ao início do bloco de texto
+    texto       strings utf-8 concatenadas (repetidas são guardadas uma vez)
+
+Textos são acessados como memoryview sobre o buffer (cópia zero); get_question
+monta a Question usada pelo resto do aplicativo, com a mesma interface de acesso
+do QuestionBank (get_all_topics, get_topic_count, get_question...).
+
+GERAR UM ARQUIVO CONGELADO (para FrozenBank.open):
+    python frozen_bank.py [arquivo_saida]
+"""
+
+import mmap
+import os
+import random
+import struct
+import sys
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+from question import PIPELINE, TEXT, Question
+
+FROZEN_MAGIC = b"LQFB"
+FROZEN_VERSION = 1
+
+HEADER = struct.Struct("<4sHHIIII")
+TOPIC = struct.Struct("<III")
+RECORD = struct.Struct("<IIIIHBB")
+
+NO_CORRECT = 0xFF  # questões de texto: as respostas aceitas ficam nas opções
+
+DEFAULT_FROZEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.lqfb")
+
+
+def freeze(bank) -> bytes:
+    """Serializa todas as questões de um banco (QuestionBank) no formato congelado"""
+    strings: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    topics = []
+    records = []
+    options: List[int] = []
+    for topic in bank.get_all_topics():
+        first = len(records)
+        count = bank.get_topic_count(topic)
+        for offset in range(count):
+            question = bank.get_question(topic, offset)
+            if question.kind == TEXT:
+                choices, correct = question.correct, NO_CORRECT
+            elif question.kind == PIPELINE:  # arquivos e, a partir de "correct", as referências
+                choices, correct = question.options + question.correct, len(question.options)
+            else:
+                choices, correct = question.options, question.correct
+            records.append(RECORD.pack(
+                intern(question.text),
+                intern(question.explanation),
+                intern(question.id),
+                len(options),
+                len(choices),
+                question.kind,
+                correct,
+            ))
+            options.extend(intern(choice) for choice in choices)
+        topics.append(TOPIC.pack(intern(topic), first, count))
+
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    parts = [
+        HEADER.pack(FROZEN_MAGIC, FROZEN_VERSION, 0, len(topics), len(records),
+                    len(options), len(encoded)),
+        *topics,
+        *records,
+        struct.pack(f"<{len(options)}I", *options),
+    ]
+    # Offsets alinhados em 8 bytes para o cast("Q") do memoryview
+    size = sum(len(part) for part in parts)
+    parts.append(b"\0" * (-size % 8))
+    parts.append(struct.pack(f"<{len(offsets)}Q", *offsets))
+    parts.extend(encoded)
+    return b"".join(parts)
+
+
+class FrozenBank:
+    """Visão somente leitura de um banco congelado (bytes, mmap ou memória compartilhada)"""
+
+    def __init__(self, buffer, owner=None):
+        self._owner = owner  # mmap/SharedMemory que precisa continuar aberto
+        self._buffer = memoryview(buffer)
+        magic, version, _, topic_count, question_count, option_count, string_count = (
+            HEADER.unpack_from(self._buffer, 0)
+        )
+        if magic != FROZEN_MAGIC or version != FROZEN_VERSION:
+            raise ValueError("Buffer não é um banco congelado compatível")
+
+        position = HEADER.size
+        self._topics_at = position
+        position += topic_count * TOPIC.size
+        self._records_at = position
+        position += question_count * RECORD.size
+        self._options = self._buffer[position:position + 4 * option_count].cast("I")
+        position += 4 * option_count
+        position += -position % 8
+        self._offsets = self._buffer[position:position + 8 * (string_count + 1)].cast("Q")
+        position += 8 * (string_count + 1)
+        self._text = self._buffer[position:]
+        self.question_count = question_count
+
+        self._topics: Dict[str, range] = {}
+        for i in range(topic_count):
+            key, first, count = TOPIC.unpack_from(self._buffer, self._topics_at + i * TOPIC.size)
+            self._topics[self.string(key)] = range(first, first + count)
+
+    @classmethod
+    def open(cls, path: str) -> "FrozenBank":
+        """Mapeia um arquivo congelado em memória (páginas compartilhadas pelo SO)"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, mapped)
+
+    @classmethod
+    def create_shared(cls, data: bytes, name: Optional[str] = None) -> "FrozenBank":
+        """Copia o banco para um bloco de memória compartilhada novo (chame unlink no fim)"""
+        block = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        block.buf[:len(data)] = data
+        return cls(block.buf[:len(data)], block)
+
+    @classmethod
+    def attach(cls, name: str) -> "FrozenBank":
+        """Abre um banco já publicado em memória compartilhada por outro processo"""
+        block = shared_memory.SharedMemory(name=name)
+        return cls(block.buf, block)
+
+    @property
+    def shared_name(self) -> Optional[str]:
+        return self._owner.name if isinstance(self._owner, shared_memory.SharedMemory) else None
+
+    @property
+    def nbytes(self) -> int:
+        return self._buffer.nbytes
+
+    def close(self):
+        """Libera as visões e fecha o mapeamento (os dados continuam para os outros)"""
+        for view in (self._text, self._offsets, self._options, self._buffer):
+            view.release()
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def unlink(self):
+        """Remove o bloco compartilhado (apenas o processo que o criou)"""
+        if isinstance(self._owner, shared_memory.SharedMemory):
+            self._owner.unlink()
+
+    # --- Strings -------------------------------------------------------------
+
+    def string_view(self, index: int) -> memoryview:
+        """Bytes utf-8 de uma string, sem cópia"""
+        return self._text[self._offsets[index]:self._offsets[index + 1]]
+
+    def string(self, index: int) -> str:
+        return str(self.string_view(index), "utf-8")
+
+    # --- Questões por índice global -----------------------------------------
+
+    def record(self, index: int):
+        """(enunciado, explicação, id, primeira opção, opções, tipo, correta)"""
+        if not 0 <= index < self.question_count:
+            raise IndexError(index)
+        return RECORD.unpack_from(self._buffer, self._records_at + index * RECORD.size)
+
+    def question_text(self, index: int) -> memoryview:
+        return self.string_view(self.record(index)[0])
+
+    def option_texts(self, index: int) -> List[memoryview]:
+        _, _, _, first, count, _, _ = self.record(index)
+        return [self.string_view(self._options[i]) for i in range(first, first + count)]
+
+    def correct_option(self, index: int) -> int:
+        return self.record(index)[6]
+
+    def get(self, index: int, topic: str = "") -> Question:
+        """Decodifica uma questão (Question, como no QuestionBank)"""
+        question, explanation, question_id, first, count, kind, correct = self.record(index)
+        choices = tuple(self.string(self._options[i]) for i in range(first, first + count))
+        if correct == NO_CORRECT:
+            choices, correct = (), choices
+        elif kind == PIPELINE:
+            choices, correct = choices[:correct], choices[correct:]
+        return Question(self.string(question), kind, choices, correct,
+                        self.string(explanation), self.string(question_id), topic)
+
+    # --- Interface de acesso do QuestionBank --------------------------------
+
+    def topic_range(self, topic: str) -> range:
+        return self._topics.get(topic, range(0))
+
+    def get_all_topics(self) -> List[str]:
+        return list(self._topics)
+
+    def get_topic_count(self, topic: str) -> int:
+        return len(self.topic_range(topic))
+
+    def get_question(self, topic: str, offset: int) -> Question:
+        return self.get(self.topic_range(topic)[offset], topic)
+
+    def get_questions(self, topic: str) -> List[Question]:
+        return [self.get(index, topic) for index in self.topic_range(topic)]
+
+    def get_random_questions(self, topic: str, num: int = 10) -> List[Question]:
+        indexes = self.topic_range(topic)
+        return [self.get(index, topic) for index in random.sample(indexes, min(num, len(indexes)))]
+
+
+if __name__ == "__main__":
+    from question_bank import QuestionBank
+
+    output = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_FROZEN_PATH
+    source = QuestionBank()
+    data = freeze(source)
+    source.pack.close()
+    with open(output, "wb") as f:
+        f.write(data)
+    frozen = FrozenBank.open(output)
+    print(f"{frozen.question_count} questões em {len(frozen.get_all_topics())} tópicos "
+          f"-> {output} ({len(data)} bytes)")
+    frozen.close()
@@ -0,0 +1,185 @@
+"""
+Correção tolerante a erros de digitação nas respostas de texto
+
+A resposta é normalizada (sem acentos, minúsculas, espaços colapsados) e
+aceita se estiver a no máximo 1 ou 2 edições (distância de Levenshtein) de uma
+resposta aceita: "particao" casa com "partição", "lsbk" com "lsblk". A
+tolerância cresce com o tamanho da resposta (respostas curtas demais não têm
+tolerância). Os erros só são tolerados nas palavras: opções ("-l"), números
+("755", "30") e caminhos ("/etc/fstab") precisam coincidir exatamente, antes
+da normalização, pois "ls -l" e "ls -L", "chmod 755" e "chmod 754" diferem de
+uma só letra.
+
+As respostas aceitas de cada questão ficam numa BK-tree: a desigualdade
+triangular da distância de edição descarta subárvores inteiras, então a busca
+não calcula a distância até cada alternativa. A distância usa o algoritmo bit a
+bit de Myers, com as máscaras da resposta calculadas uma vez por busca. Na
+correção em lote (grade_many) cada resposta distinta é corrigida uma única vez.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAX_TYPOS = 2
+# Tamanho mínimo (após normalizar) para tolerar 1 e 2 erros
+ONE_TYPO_LENGTH = 4
+TWO_TYPOS_LENGTH = 10
+
+_SPACES = re.compile(r"\s+")
+_LITERAL = re.compile(r"^-|[/0-9]|\.\w")
+
+
+def fold(text: str) -> str:
+    """Sem acentos, em minúsculas e com os espaços colapsados"""
+    from search_index import normalize  # aqui: o search_index fica fora da inicialização
+    return _SPACES.sub(" ", normalize(text)).strip()
+
+
+def allowed_typos(text: str, max_typos: int = MAX_TYPOS) -> int:
+    """Erros tolerados para uma resposta deste tamanho"""
+    if len(text) >= TWO_TYPOS_LENGTH:
+        return min(2, max_typos)
+    if len(text) >= ONE_TYPO_LENGTH:
+        return min(1, max_typos)
+    return 0
+
+
+def pattern_masks(text: str) -> Dict[str, int]:
+    """Máscara de bits das posições de cada caractere (entrada do algoritmo de Myers)"""
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def levenshtein(a: str, b: str, limit: Optional[int] = None,
+                masks: Optional[Dict[str, int]] = None) -> int:
+    """Distância de edição pelo algoritmo bit a bit de Myers (uma coluna da
+    tabela por operação com inteiros); com limit, respostas além dele valem
+    limit + 1. masks são as pattern_masks(a), quando já calculadas."""
+    if a == b:
+        return 0
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if not a or not b:
+        distance = len(a) or len(b)
+        return distance if limit is None else min(distance, limit + 1)
+    if masks is None:
+        masks = pattern_masks(a)
+    full = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    positive, negative, score = full, 0, len(a)
+    for char in b:
+        equal = masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        up = negative | ~(horizontal | positive)
+        down = positive & horizontal
+        if up & last:
+            score += 1
+        elif down & last:
+            score -= 1
+        up = (up << 1) | 1
+        down <<= 1
+        positive = (down | ~(vertical | up)) & full
+        negative = up & vertical & full
+    if limit is not None and score > limit:
+        return limit + 1
+    return score
+
+
+class BKTree:
+    """Árvore de Burkhard-Keller sobre a distância de edição"""
+
+    __slots__ = ("root",)
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Palavras a no máximo max_distance edições, das mais próximas às mais distantes"""
+        found = []
+        masks = pattern_masks(word)
+        pending = [self.root] if self.root is not None else []
+        while pending:
+            node_word, children = pending.pop()
+            # Acima deste corte o nó não casa e nenhum filho fica no intervalo
+            distance = levenshtein(word, node_word, max(children, default=0) + max_distance, masks)
+            if distance <= max_distance:
+                found.append((distance, node_word))
+            for edge in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    pending.append(child)
+        found.sort()
+        return found
+
+
+def literal_words(text: str) -> Tuple[str, ...]:
+    """Opções, números e caminhos da resposta, na ordem e sem normalizar"""
+    return tuple(word for word in text.split() if _LITERAL.search(word))
+
+
+class FuzzyMatcher:
+    """Respostas aceitas de uma questão indexadas para busca aproximada"""
+
+    __slots__ = ("literals", "tree")
+
+    def __init__(self, accepted: Tuple[str, ...]):
+        # resposta normalizada -> literais de cada forma aceita que a produz
+        self.literals: Dict[str, set] = {}
+        for answer in accepted:
+            self.literals.setdefault(fold(answer), set()).add(literal_words(answer))
+        self.tree = BKTree(self.literals)
+
+    def distance(self, answer: str, max_typos: int = MAX_TYPOS) -> Optional[int]:
+        """Edições até a resposta aceita mais próxima (None se nenhuma dentro do limite)"""
+        text = fold(answer)
+        exact = literal_words(answer)
+        if exact in self.literals.get(text, ()):
+            return 0
+        limit = allowed_typos(text, max_typos)
+        if limit == 0:
+            return None
+        for distance, candidate in self.tree.search(text, limit):
+            if exact in self.literals[candidate]:
+                return distance
+        return None
+
+    def matches(self, answer: str, max_typos: int = MAX_TYPOS) -> bool:
+        return self.distance(answer, max_typos) is not None
+
+    def grade_many(self, answers: Iterable[str], max_typos: int = MAX_TYPOS) -> List[bool]:
+        """Corrige muitas respostas, calculando cada resposta distinta uma vez"""
+        memo: Dict[str, bool] = {}
+        results = []
+        for answer in answers:
+            result = memo.get(answer)
+            if result is None:
+                result = memo[answer] = self.matches(answer, max_typos)
+            results.append(result)
+        return results
+
+
+@lru_cache(maxsize=4096)
+def compile_fuzzy(accepted: Tuple[str, ...]) -> FuzzyMatcher:
+    """Índice aproximado das respostas aceitas (construído uma vez por conjunto)"""
+    return FuzzyMatcher(accepted)
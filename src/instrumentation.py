@@ -0,0 +1,155 @@
+"""
+Instrumentação opcional dos caminhos críticos do LPIC-1
+
+Quando ativada, troca métodos de uma instância (callbacks do LPIC1StudyApp,
+acessos do QuestionBank) por versões que medem a latência com o relógio
+monotônico (perf_counter_ns) e a registram em histogramas de buckets fixos no
+estilo HDR: 16 sub-buckets por potência de dois, ~6% de precisão, memória
+constante e registro em O(1). Desativada, nada é trocado e o custo é zero.
+
+Ativação: LPIC1_INSTRUMENT=1 (ou instrument=True no LPIC1StudyApp).
+"""
+
+import functools
+import json
+import os
+import time
+from typing import Dict, Iterable, List
+
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+MAX_BITS = 42  # ~73 minutos em nanossegundos
+BUCKET_COUNT = (MAX_BITS - SUB_BUCKET_BITS - 1) * SUB_BUCKETS + 2 * SUB_BUCKETS
+
+DEFAULT_REPORT_PATH = os.path.join(os.path.expanduser("~"), ".lpic1", "latency.json")
+
+
+def bucket_index(value: int) -> int:
+    """Bucket de um valor: exato abaixo de 16, depois 16 por potência de dois"""
+    if value < SUB_BUCKETS:
+        return max(value, 0)
+    shift = value.bit_length() - (SUB_BUCKET_BITS + 1)
+    return min(shift * SUB_BUCKETS + (value >> shift), BUCKET_COUNT - 1)
+
+
+def bucket_value(index: int) -> int:
+    """Valor representativo (meio do intervalo) de um bucket"""
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    lower = (index - shift * SUB_BUCKETS) << shift
+    return lower + ((1 << shift) >> 1)
+
+
+class LatencyHistogram:
+    """Histograma de latências em nanossegundos com buckets fixos"""
+
+    __slots__ = ("counts", "total", "max_ns", "sum_ns")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.total = 0
+        self.max_ns = 0
+        self.sum_ns = 0
+
+    def record(self, value_ns: int):
+        self.counts[bucket_index(value_ns)] += 1
+        self.total += 1
+        self.sum_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, p: float) -> int:
+        """Valor (ns) abaixo do qual estão `p`% das medições"""
+        if self.total == 0:
+            return 0
+        target = max(1, int(self.total * p / 100 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(bucket_value(index), self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, float]:
+        """Contagem, média e percentis em milissegundos"""
+        return {
+            "count": self.total,
+            "mean_ms": (self.sum_ns / self.total / 1e6) if self.total else 0.0,
+            "p50_ms": self.percentile(50) / 1e6,
+            "p95_ms": self.percentile(95) / 1e6,
+            "p99_ms": self.percentile(99) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+
+class Instrumentation:
+    """Registro de histogramas e instrumentação de métodos"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        return histogram
+
+    def instrument(self, obj, method_names: Iterable[str], prefix: str):
+        """Troca os métodos da instância por versões cronometradas (se ativado)"""
+        if not self.enabled:
+            return
+        for name in method_names:
+            method = getattr(obj, name)
+            setattr(obj, name, self._timed(method, self.histogram(f"{prefix}.{name}")))
+
+    @staticmethod
+    def _timed(method, histogram: LatencyHistogram):
+        clock = time.perf_counter_ns
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.record(clock() - start)
+
+        return wrapper
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Resumo de todos os histogramas com medições"""
+        return {
+            name: histogram.summary()
+            for name, histogram in sorted(self.histograms.items())
+            if histogram.total
+        }
+
+    def status_line(self, limit: int = 3) -> str:
+        """Resumo curto para a barra de status: os callbacks de maior p99"""
+        report = self.report()
+        if not report:
+            return "Latência: sem medições"
+        slowest = sorted(report.items(), key=lambda item: item[1]["p99_ms"], reverse=True)
+        parts = [
+            f"{name.split('.')[-1]} p50 {stats['p50_ms']:.2f}/p95 {stats['p95_ms']:.2f}/"
+            f"p99 {stats['p99_ms']:.2f} ms"
+            for name, stats in slowest[:limit]
+        ]
+        return "Latência: " + " | ".join(parts)
+
+    def report_lines(self) -> List[str]:
+        lines = [f"{'callback':40} {'n':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+        for name, stats in self.report().items():
+            lines.append(
+                f"{name:40} {stats['count']:7d} {stats['p50_ms']:9.3f} {stats['p95_ms']:9.3f} "
+                f"{stats['p99_ms']:9.3f} {stats['max_ms']:9.3f}"
+            )
+        return lines
+
+    def dump(self, path: str = DEFAULT_REPORT_PATH):
+        """Grava o resumo em JSON"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
@@ -0,0 +1,360 @@
+"""
+Teoria de resposta ao item (TRI) e teste adaptativo computadorizado
+
+Calibração
+    Modelos logísticos de 2 e 3 parâmetros, P(acerto | θ) = c + (1 - c) σ(aθ + d),
+    com discriminação a, dificuldade b = -d/a e acerto ao acaso c (3PL).
+    Os parâmetros são estimados por máxima verossimilhança marginal com o
+    algoritmo EM de Bock-Aitkin: a habilidade θ é integrada numa grade de
+    quadratura, o passo E soma as posteriores de cada aluno por questão com
+    np.bincount (em blocos de respostas, memória limitada) e o passo M faz
+    passos de Fisher scoring para todas as questões ao mesmo tempo (matrizes
+    2x2 ou 3x3 resolvidas em lote). Priors fracos mantêm questões com poucas
+    respostas em valores razoáveis.
+
+Teste adaptativo
+    A cada resposta a habilidade é reestimada (EAP: a verossimilhança na grade
+    é atualizada em O(grade)) e a próxima questão é a de maior informação de
+    Fisher na habilidade atual. O InformationIndex guarda, para cada ponto de
+    uma grade de θ, as questões ordenadas pela informação, então a escolha
+    custa O(questões já aplicadas) mesmo em bancos grandes. O teste termina
+    quando o erro padrão fica abaixo do limite.
+
+Calibrar a partir do histórico (salva em ~/.lpic1/irt.json):
+    python irt.py [history.db] [2PL|3PL]
+
+Requer NumPy (pip install numpy).
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_PARAMS_PATH = os.path.join(os.path.expanduser("~"), ".lpic1", "irt.json")
+
+QUADRATURE = np.linspace(-4.0, 4.0, 41)
+CHUNK = 200000  # respostas por bloco no passo E
+
+# Parâmetros de questões ainda não calibradas
+DEFAULT_A = 1.0
+DEFAULT_B = 0.0
+
+# Priors do passo M: a ~ N(1, 1), d ~ N(0, 2²), c ~ Beta(5, 17) (média ~0,23)
+PRIOR_A_VAR = 1.0
+PRIOR_D_VAR = 4.0
+PRIOR_C = (5.0, 17.0)
+
+# Teste adaptativo
+SE_TARGET = 0.35
+MIN_ITEMS = 5
+MAX_ITEMS = 30
+
+
+def normal_prior(grid: np.ndarray) -> np.ndarray:
+    weights = np.exp(-0.5 * grid ** 2)
+    return weights / weights.sum()
+
+
+def probability(a: np.ndarray, d: np.ndarray, c: np.ndarray, theta) -> np.ndarray:
+    """P(acerto) de cada questão (linhas) em cada θ (colunas)"""
+    z = np.outer(a, theta) + d[:, None]
+    return c[:, None] + (1 - c[:, None]) / (1 + np.exp(-z))
+
+
+def fisher_information(a: np.ndarray, d: np.ndarray, c: np.ndarray, theta) -> np.ndarray:
+    """Informação de Fisher de cada questão (linhas) em cada θ (colunas)"""
+    p = np.clip(probability(a, d, c, theta), 1e-9, 1 - 1e-9)
+    cc = c[:, None]
+    return (a[:, None] ** 2) * ((p - cc) / (1 - cc)) ** 2 * (1 - p) / p
+
+
+class ItemParameters:
+    """Parâmetros calibrados (a, d, c) das questões, indexados pelo id"""
+
+    def __init__(self, question_ids: List[str], a: np.ndarray, d: np.ndarray, c: np.ndarray,
+                 model: str = "2PL"):
+        self.question_ids = question_ids
+        self.a = np.asarray(a, dtype=np.float64)
+        self.d = np.asarray(d, dtype=np.float64)
+        self.c = np.asarray(c, dtype=np.float64)
+        self.model = model
+        self.position = {question_id: i for i, question_id in enumerate(question_ids)}
+
+    def __len__(self) -> int:
+        return len(self.question_ids)
+
+    @property
+    def b(self) -> np.ndarray:
+        return -self.d / self.a
+
+    def for_questions(self, question_ids: Sequence[str], guessing: float = 0.0) -> "ItemParameters":
+        """Parâmetros na ordem pedida; questões não calibradas recebem os padrões"""
+        a = np.full(len(question_ids), DEFAULT_A)
+        d = np.full(len(question_ids), -DEFAULT_A * DEFAULT_B)
+        c = np.full(len(question_ids), guessing if self.model == "3PL" else 0.0)
+        for i, question_id in enumerate(question_ids):
+            j = self.position.get(question_id)
+            if j is not None:
+                a[i], d[i], c[i] = self.a[j], self.d[j], self.c[j]
+        return ItemParameters(list(question_ids), a, d, c, self.model)
+
+    def save(self, path: str = DEFAULT_PARAMS_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        data = {
+            "model": self.model,
+            "items": {
+                question_id: [round(float(a), 5), round(float(d), 5), round(float(c), 5)]
+                for question_id, a, d, c in zip(self.question_ids, self.a, self.d, self.c)
+            },
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PARAMS_PATH) -> "ItemParameters":
+        """Parâmetros salvos; vazio (tudo padrão) se o arquivo não existir"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls([], np.zeros(0), np.zeros(0), np.zeros(0))
+        items = data.get("items", {})
+        values = np.array(list(items.values()), dtype=np.float64).reshape(len(items), 3)
+        return cls(list(items), values[:, 0], values[:, 1], values[:, 2], data.get("model", "2PL"))
+
+
+# --- Calibração (EM) ---------------------------------------------------------
+
+def _chunks(size: int):
+    for start in range(0, size, CHUNK):
+        yield slice(start, min(start + CHUNK, size))
+
+
+def _segment_sums(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Soma as colunas de values por trecho de chaves iguais (keys ordenado)"""
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return keys[starts], np.add.reduceat(values, starts, axis=1)
+
+
+def _sorted_by(keys: np.ndarray, *columns: np.ndarray) -> Tuple[np.ndarray, ...]:
+    order = np.argsort(keys, kind="stable")
+    return tuple(column[order] for column in (keys,) + columns)
+
+
+def _e_step(by_user, by_item, log_p, log_q, log_prior, users_n, items_n):
+    """Posteriores por aluno na grade e contagens esperadas por questão
+
+    by_user e by_item são as respostas ordenadas por aluno e por questão, de
+    modo que cada bloco se reduz com np.add.reduceat. As matrizes ficam com a
+    grade nas linhas (grade x respostas), layout em que a redução é contígua."""
+    log_p, log_q = np.ascontiguousarray(log_p.T), np.ascontiguousarray(log_q.T)
+    users, items, correct = by_user
+    loglik = np.repeat(log_prior[:, None], users_n, axis=1)
+    for part in _chunks(len(users)):
+        contrib = np.where(correct[part].astype(bool), log_p[:, items[part]], log_q[:, items[part]])
+        keys, sums = _segment_sums(users[part], contrib)
+        loglik[:, keys] += sums
+
+    peak = loglik.max(axis=0)
+    posterior = np.exp(loglik - peak)
+    totals = posterior.sum(axis=0)
+    posterior /= totals
+    marginal = float((np.log(totals) + peak).sum())
+
+    items, users, correct = by_item
+    expected = np.zeros((len(log_prior), items_n))
+    expected_correct = np.zeros_like(expected)
+    for part in _chunks(len(items)):
+        weights = posterior[:, users[part]]
+        keys, sums = _segment_sums(items[part], weights)
+        expected[:, keys] += sums
+        keys, sums = _segment_sums(items[part], weights * correct[part])
+        expected_correct[:, keys] += sums
+    return expected.T, expected_correct.T, marginal
+
+
+def _m_step(a, d, c, expected, expected_correct, grid, estimate_c: bool, steps: int = 4):
+    """Passos de Fisher scoring em lote para todas as questões"""
+    alpha, beta = PRIOR_C
+    for _ in range(steps):
+        s = 1 / (1 + np.exp(-(np.outer(a, grid) + d[:, None])))
+        p = np.clip(c[:, None] + (1 - c[:, None]) * s, 1e-9, 1 - 1e-9)
+        weight = (expected_correct - expected * p) / (p * (1 - p))
+        info_weight = expected / (p * (1 - p))
+        slope = (1 - c[:, None]) * s * (1 - s)
+        derivatives = [slope * grid, slope]
+        if estimate_c:
+            derivatives.append(1 - s)
+
+        k = len(derivatives)
+        gradient = np.stack([(weight * dp).sum(axis=1) for dp in derivatives], axis=1)
+        information = np.empty((len(a), k, k))
+        for i in range(k):
+            for j in range(i, k):
+                information[:, i, j] = information[:, j, i] = (
+                    info_weight * derivatives[i] * derivatives[j]
+                ).sum(axis=1)
+
+        gradient[:, 0] -= (a - 1) / PRIOR_A_VAR
+        information[:, 0, 0] += 1 / PRIOR_A_VAR
+        gradient[:, 1] -= d / PRIOR_D_VAR
+        information[:, 1, 1] += 1 / PRIOR_D_VAR
+        if estimate_c:
+            gradient[:, 2] += (alpha - 1) / c - (beta - 1) / (1 - c)
+            information[:, 2, 2] += (alpha - 1) / c ** 2 + (beta - 1) / (1 - c) ** 2
+
+        step = np.linalg.solve(information, gradient[:, :, None])[:, :, 0]
+        step = np.clip(step, -1.0, 1.0)
+        a = np.clip(a + step[:, 0], 0.1, 5.0)
+        d = np.clip(d + step[:, 1], -10.0, 10.0)
+        if estimate_c:
+            c = np.clip(c + step[:, 2], 0.01, 0.5)
+    return a, d, c
+
+
+def calibrate(users: np.ndarray, items: np.ndarray, correct: np.ndarray,
+              question_ids: List[str], model: str = "2PL", iterations: int = 100,
+              tolerance: float = 1e-6, grid: np.ndarray = QUADRATURE) -> ItemParameters:
+    """Calibra os parâmetros por EM a partir das respostas (aluno, questão, acerto)"""
+    if model not in ("2PL", "3PL"):
+        raise ValueError(f"Modelo desconhecido: {model}")
+    users = np.asarray(users, dtype=np.int64)
+    items = np.asarray(items, dtype=np.int64)
+    correct = np.asarray(correct, dtype=np.int8)
+    users_n = int(users.max()) + 1 if len(users) else 0
+    items_n = len(question_ids)
+    estimate_c = model == "3PL"
+    log_prior = np.log(normal_prior(grid))
+
+    # Ponto de partida: dificuldade pela proporção de acertos
+    n = np.bincount(items, minlength=items_n)
+    hits = np.bincount(items, weights=correct, minlength=items_n)
+    p_value = np.clip((hits + 0.5) / (n + 1.0), 0.02, 0.98)
+    a = np.full(items_n, DEFAULT_A)
+    c = np.full(items_n, 0.2 if estimate_c else 0.0)
+    d = np.log((p_value - c) / (1 - p_value)).clip(-4, 4) if estimate_c else np.log(p_value / (1 - p_value))
+    d = np.nan_to_num(d)
+
+    by_user = _sorted_by(users, items, correct)
+    by_item = _sorted_by(items, users, correct)
+    previous = -np.inf
+    for _ in range(iterations):
+        p = np.clip(probability(a, d, c, grid), 1e-9, 1 - 1e-9)
+        expected, expected_correct, marginal = _e_step(
+            by_user, by_item, np.log(p), np.log(1 - p), log_prior, users_n, items_n
+        )
+        a, d, c = _m_step(a, d, c, expected, expected_correct, grid, estimate_c)
+        if abs(marginal - previous) < tolerance * abs(marginal):
+            break
+        previous = marginal
+    return ItemParameters(list(question_ids), a, d, c, model)
+
+
+# --- Teste adaptativo --------------------------------------------------------
+
+class InformationIndex:
+    """Questões ordenadas pela informação em cada ponto de uma grade de θ"""
+
+    def __init__(self, params: ItemParameters, grid: Optional[np.ndarray] = None,
+                 top_k: int = 256):
+        self.params = params
+        self.grid = grid if grid is not None else np.linspace(-3.0, 3.0, 25)
+        top_k = min(top_k, len(params))
+        order = np.empty((len(self.grid), top_k), dtype=np.int64)
+        for g, theta in enumerate(self.grid):
+            info = fisher_information(params.a, params.d, params.c, [theta])[:, 0]
+            best = np.argpartition(-info, top_k - 1)[:top_k] if top_k < len(info) else np.arange(len(info))
+            order[g] = best[np.argsort(-info[best], kind="stable")]
+        self.order = order
+
+    def select(self, theta: float, used) -> Optional[int]:
+        """Questão não aplicada de maior informação em θ (None se acabaram)"""
+        g = int(np.abs(self.grid - theta).argmin())
+        for item in self.order[g]:
+            if item not in used:
+                return int(item)
+        # Todas as melhores já aplicadas: busca completa
+        if len(used) >= len(self.params):
+            return None
+        info = fisher_information(self.params.a, self.params.d, self.params.c, [theta])[:, 0]
+        info[list(used)] = -np.inf
+        return int(info.argmax())
+
+
+class AdaptiveTest:
+    """Sessão de teste adaptativo: estimativa EAP de θ e escolha da próxima questão"""
+
+    def __init__(self, index: InformationIndex, se_target: float = SE_TARGET,
+                 min_items: int = MIN_ITEMS, max_items: int = MAX_ITEMS,
+                 grid: np.ndarray = np.linspace(-4.0, 4.0, 81)):
+        self.index = index
+        self.params = index.params
+        self.se_target = se_target
+        self.min_items = min_items
+        self.max_items = min(max_items, len(self.params))
+        self.grid = grid
+        self.loglik = np.log(normal_prior(grid))
+        self.used: Dict[int, bool] = {}
+        self.theta = 0.0
+        self.se = float(np.sqrt((normal_prior(grid) * grid ** 2).sum()))
+
+    def next_item(self) -> Optional[int]:
+        """Índice (nos parâmetros) da próxima questão, ou None se o teste acabou"""
+        if self.finished:
+            return None
+        return self.index.select(self.theta, self.used)
+
+    def record(self, item: int, correct: bool):
+        """Registra a resposta e reestima θ e o erro padrão"""
+        p = np.clip(probability(self.params.a[item:item + 1], self.params.d[item:item + 1],
+                                self.params.c[item:item + 1], self.grid)[0], 1e-9, 1 - 1e-9)
+        self.loglik += np.log(p if correct else 1 - p)
+        self.used[item] = bool(correct)
+        posterior = np.exp(self.loglik - self.loglik.max())
+        posterior /= posterior.sum()
+        self.theta = float((posterior * self.grid).sum())
+        self.se = float(np.sqrt((posterior * (self.grid - self.theta) ** 2).sum()))
+
+    @property
+    def finished(self) -> bool:
+        answered = len(self.used)
+        if answered >= self.max_items:
+            return True
+        return answered >= self.min_items and self.se < self.se_target
+
+
+def responses_from_history(rows: Iterable[Tuple]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """Primeira tentativa de cada aluno em cada questão, codificada para calibrate"""
+    from item_analysis import ItemAnalysis
+
+    analysis = ItemAnalysis()
+    analysis.add_attempts(rows)
+    users, items, correct, _ = analysis.arrays()
+    return users, items, correct, analysis.item_ids
+
+
+def main():
+    from attempt_store import DEFAULT_DB_PATH, AttemptStore
+
+    store = AttemptStore(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_PATH)
+    model = sys.argv[2] if len(sys.argv) > 2 else "2PL"
+    try:
+        users, items, correct, question_ids = responses_from_history(store.iter_attempts())
+    finally:
+        store.close()
+    if not question_ids:
+        print("Histórico vazio: nada para calibrar")
+        return
+    params = calibrate(users, items, correct, question_ids, model)
+    params.save()
+    print(f"{len(params)} questões calibradas ({model}) com {len(users)} respostas "
+          f"-> {DEFAULT_PARAMS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Análise de itens (teoria clássica dos testes) a partir do histórico
+
+Para cada questão calcula, sobre as tentativas gravadas no AttemptStore:
+    dificuldade     índice p: proporção de acertos
+    discriminação   correlação ponto-bisserial entre acertar a questão e o
+                    desempenho do aluno nas demais questões (escore corrigido)
+    distratores     taxa de escolha de cada opção e o escore médio de quem a
+                    escolheu (um distrator que atrai os melhores alunos indica
+                    questão ambígua ou gabarito errado)
+
+Cada aluno conta uma vez por questão (a primeira tentativa, antes de estudar a
+explicação). As respostas ficam em arrays NumPy (aluno, questão, acerto,
+opção) e todas as estatísticas saem de somas por questão com np.bincount, de
+modo que recalcular milhões de respostas leva poucos segundos. No modo
+incremental (update) só as tentativas novas são lidas do banco; as somas são
+refeitas sobre os arrays já em memória, pois o escore de um aluno muda a
+cada nova resposta.
+
+Também mostra o equilíbrio do gabarito (em que posição fica a opção correta),
+hoje concentrado nas opções 0 e 3.
+
+Uso: python item_analysis.py [history.db]
+Requer NumPy (pip install numpy).
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from attempt_store import DEFAULT_DB_PATH, AttemptStore
+from question import MULTIPLE
+
+MAX_OPTIONS = 16
+NO_OPTION = -1
+
+# Limites para sinalizar questões
+EASY_P = 0.90
+HARD_P = 0.20
+LOW_DISCRIMINATION = 0.15
+MIN_RESPONSES = 20
+
+
+class ItemAnalysis:
+    """Respostas acumuladas e estatísticas clássicas por questão"""
+
+    def __init__(self):
+        self.user_codes: Dict[str, int] = {}
+        self.item_codes: Dict[str, int] = {}
+        self.item_ids: List[str] = []
+        self.item_topics: List[str] = []
+        self.last_attempt_id = 0
+        self._seen = set()  # pares (aluno, questão) já contados
+        self._chunks: List[Tuple[np.ndarray, ...]] = []
+        self._arrays: Optional[Tuple[np.ndarray, ...]] = None
+
+    def __len__(self) -> int:
+        users, _, _, _ = self.arrays()
+        return len(users)
+
+    # --- Ingestão ------------------------------------------------------------
+
+    def _item(self, question_id: str, topic: str) -> int:
+        code = self.item_codes.get(question_id)
+        if code is None:
+            code = self.item_codes[question_id] = len(self.item_ids)
+            self.item_ids.append(question_id)
+            self.item_topics.append(topic)
+        return code
+
+    def add_attempts(self, rows: Iterable[Tuple]) -> int:
+        """Acrescenta tentativas (id, user, question_id, topic, answer, correct);
+        retorna quantas respostas novas foram contadas"""
+        users, items, correct, options = [], [], [], []
+        user_codes = self.user_codes
+        seen = self._seen
+        for attempt_id, user, question_id, topic, answer, is_correct in rows:
+            self.last_attempt_id = max(self.last_attempt_id, attempt_id)
+            user_code = user_codes.get(user)
+            if user_code is None:
+                user_code = user_codes[user] = len(user_codes)
+            item = self._item(question_id, topic)
+            if (user_code, item) in seen:
+                continue
+            seen.add((user_code, item))
+            users.append(user_code)
+            items.append(item)
+            correct.append(is_correct)
+            options.append(int(answer) if answer.isdecimal() and int(answer) < MAX_OPTIONS
+                           else NO_OPTION)
+        if users:
+            self.add_responses(np.array(users, dtype=np.int32), np.array(items, dtype=np.int32),
+                               np.array(correct, dtype=np.int8), np.array(options, dtype=np.int8))
+        return len(users)
+
+    def add_responses(self, users: np.ndarray, items: np.ndarray, correct: np.ndarray,
+                      options: np.ndarray):
+        """Acrescenta respostas já codificadas (uma por aluno e questão)"""
+        self._chunks.append((users, items, correct, options))
+        self._arrays = None
+
+    def update(self, store: AttemptStore) -> int:
+        """Modo incremental: lê só as tentativas gravadas desde a última leitura"""
+        return self.add_attempts(store.iter_attempts(self.last_attempt_id))
+
+    @classmethod
+    def from_store(cls, store: AttemptStore) -> "ItemAnalysis":
+        analysis = cls()
+        analysis.update(store)
+        return analysis
+
+    def arrays(self) -> Tuple[np.ndarray, ...]:
+        """(alunos, questões, acertos, opções) de todas as respostas"""
+        if self._arrays is None:
+            if not self._chunks:
+                empty = np.zeros(0, dtype=np.int32)
+                return empty, empty, empty.astype(np.int8), empty.astype(np.int8)
+            self._arrays = tuple(np.concatenate(column) for column in zip(*self._chunks))
+            self._chunks = [self._arrays]
+        return self._arrays
+
+    # --- Estatísticas --------------------------------------------------------
+
+    def compute(self, item_count: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Estatísticas de todas as questões (arrays indexados pelo código da questão)"""
+        users, items, correct, options = self.arrays()
+        items_n = item_count or len(self.item_ids)
+        users_n = len(self.user_codes)
+        x = correct.astype(np.float64)
+
+        # Escore corrigido: acertos do aluno nas outras questões / outras respostas
+        user_answered = np.bincount(users, minlength=users_n).astype(np.float64)
+        user_correct = np.bincount(users, weights=x, minlength=users_n)
+        others = user_answered[users] - 1
+        valid = others > 0
+        rest = np.divide(user_correct[users] - x, others, out=np.zeros_like(x), where=valid)
+
+        n = np.bincount(items, minlength=items_n).astype(np.float64)
+        hits = np.bincount(items, weights=x, minlength=items_n)
+        p_value = np.divide(hits, n, out=np.full(items_n, np.nan), where=n > 0)
+
+        # Ponto-bisserial: (M1 - M0) / S * sqrt(p q), sobre quem tem escore corrigido
+        scored_items = items[valid]
+        scored_x = x[valid]
+        scored = rest[valid]
+        m = np.bincount(scored_items, minlength=items_n).astype(np.float64)
+        m1 = np.bincount(scored_items, weights=scored_x, minlength=items_n)
+        sum_s = np.bincount(scored_items, weights=scored, minlength=items_n)
+        sum_s2 = np.bincount(scored_items, weights=scored * scored, minlength=items_n)
+        sum_s1 = np.bincount(scored_items, weights=scored * scored_x, minlength=items_n)
+        m0 = m - m1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean1 = sum_s1 / m1
+            mean0 = (sum_s - sum_s1) / m0
+            variance = sum_s2 / m - (sum_s / m) ** 2
+            p = m1 / m
+            discrimination = (mean1 - mean0) / np.sqrt(variance) * np.sqrt(p * (1 - p))
+        discrimination[(m1 == 0) | (m0 == 0) | ~(variance > 1e-12)] = np.nan
+
+        # Escolha de cada opção e escore médio de quem a escolheu
+        chosen = options >= 0
+        cells = items[chosen].astype(np.int64) * MAX_OPTIONS + options[chosen]
+        option_counts = np.bincount(cells, minlength=items_n * MAX_OPTIONS).reshape(
+            items_n, MAX_OPTIONS)
+        option_score = np.bincount(cells, weights=rest[chosen],
+                                   minlength=items_n * MAX_OPTIONS).reshape(items_n, MAX_OPTIONS)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            option_rates = option_counts / n[:, None]
+            option_mean_score = option_score / option_counts
+
+        return {
+            "responses": n,
+            "p_value": p_value,
+            "discrimination": discrimination,
+            "option_counts": option_counts,
+            "option_rates": option_rates,
+            "option_mean_score": option_mean_score,
+        }
+
+    def report(self, bank=None, min_responses: int = MIN_RESPONSES) -> List[Dict]:
+        """Uma linha por questão, com alertas; usa o banco para o gabarito e as opções"""
+        stats = self.compute()
+        rows = []
+        for code, question_id in enumerate(self.item_ids):
+            topic = self.item_topics[code]
+            question = bank.get_question_by_id(question_id, topic) if bank is not None else None
+            option_total = len(question.options) if question is not None and question.options else 4
+            rates = stats["option_rates"][code, :option_total]
+            row = {
+                "id": question_id,
+                "topic": topic,
+                "responses": int(stats["responses"][code]),
+                "p_value": float(stats["p_value"][code]),
+                "discrimination": float(stats["discrimination"][code]),
+                "option_rates": [float(rate) for rate in np.nan_to_num(rates)],
+                "option_mean_score": [
+                    None if np.isnan(score) else float(score)
+                    for score in stats["option_mean_score"][code, :option_total]
+                ],
+                "flags": [],
+            }
+            if row["responses"] >= min_responses:
+                row["flags"] = self._flags(row, question)
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _flags(row: Dict, question) -> List[str]:
+        flags = []
+        p_value = row["p_value"]
+        discrimination = row["discrimination"]
+        if p_value >= EASY_P:
+            flags.append("fácil demais")
+        elif p_value <= HARD_P:
+            flags.append("difícil demais")
+        if discrimination < 0:
+            flags.append("discriminação negativa (gabarito?)")
+        elif discrimination < LOW_DISCRIMINATION:
+            flags.append("discriminação baixa")
+        if question is not None and question.kind == MULTIPLE:
+            rates = row["option_rates"]
+            scores = row["option_mean_score"]
+            key_score = scores[question.correct]
+            for option, rate in enumerate(rates):
+                if option == question.correct:
+                    continue
+                if rate > rates[question.correct]:
+                    flags.append(f"opção {option} mais escolhida que a correta")
+                elif scores[option] is not None and key_score is not None \
+                        and scores[option] > key_score and rate >= 0.1:
+                    flags.append(f"opção {option} atrai os melhores alunos")
+        return flags
+
+
+def key_balance(bank) -> Dict[str, List[int]]:
+    """Quantas questões de cada tópico têm a resposta correta em cada posição"""
+    balance = {}
+    for topic in bank.get_all_topics():
+        counts = [0, 0, 0, 0]
+        for question in bank.get_questions(topic):
+            if question.kind == MULTIPLE:
+                if question.correct >= len(counts):
+                    counts.extend([0] * (question.correct + 1 - len(counts)))
+                counts[question.correct] += 1
+        balance[topic] = counts
+    return balance
+
+
+def main():
+    from question_bank import QuestionBank
+
+    store = AttemptStore(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_PATH)
+    bank = QuestionBank()
+    try:
+        analysis = ItemAnalysis.from_store(store)
+        print(f"{len(analysis)} respostas de {len(analysis.user_codes)} aluno(s) "
+              f"em {len(analysis.item_ids)} questões\n")
+        for row in sorted(analysis.report(bank), key=lambda row: row["p_value"]):
+            flags = "; ".join(row["flags"])
+            rates = " ".join(f"{rate:.2f}" for rate in row["option_rates"])
+            print(f"{row['id']:20} n={row['responses']:<6} p={row['p_value']:.2f} "
+                  f"r={row['discrimination']:+.2f} opções [{rates}] {flags}")
+
+        balance = list(key_balance(bank).values())
+        totals = [0] * max(len(counts) for counts in balance)
+        for counts in balance:
+            for option, count in enumerate(counts):
+                totals[option] += count
+        print("\nPosição da resposta correta no banco: " +
+              ", ".join(f"opção {i}: {count}" for i, count in enumerate(totals)))
+    finally:
+        bank.pack.close()
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,717 @@
+"""
+Avaliador de pipelines de filtros de texto (tópico 103.2)
+
+Questões do tipo "pipeline" pedem um comando como
+
+    cut -d: -f1 /etc/passwd | sort | uniq -c | sort -rn | head
+
+e são corrigidas executando a resposta sobre arquivos de exemplo (fixtures)
+e comparando a saída com a do pipeline de referência. Respostas equivalentes
+na forma (command_match.canonical) nem chegam a ser executadas.
+
+Cada comando (cat, cut, sort, uniq, wc, head, tail, tr, grep) é um gerador
+que consome as linhas do estágio anterior, então os dados atravessam o
+pipeline em fluxo e a memória não depende do tamanho da entrada: head para
+de ler assim que tem as linhas pedidas, tail guarda só as últimas N, e sort
+ordena blocos de até SORT_CHUNK_LINES linhas, grava cada bloco ordenado num
+arquivo temporário e intercala os blocos (ordenação externa). As saídas são
+comparadas por um resumo BLAKE2 calculado em fluxo; o da referência é
+calculado uma vez por questão e fica em cache.
+
+A resposta é código do aluno: cada estágio pode produzir no máximo
+MAX_STAGE_LINES linhas (cat /var/log/access.log repetido mil vezes não
+passa disso), e grade/preview executam o pipeline no processo de trabalho
+(timed_worker), interrompido após PIPELINE_TIMEOUT segundos, para não travar
+o mainloop do Tk nem o laço do quiz_server. Qualquer erro conta como errado.
+
+Os fixtures são gerados de forma determinística (FIXTURES: caminho ->
+gerador de linhas); na questão, as "opções" são os caminhos disponíveis.
+"""
+
+import hashlib
+import heapq
+import itertools
+import random
+import re
+import sys
+import tempfile
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from command_match import canonical
+from timed_worker import WorkerError, shared
+from vfs import VFSError, split_words
+
+SORT_CHUNK_LINES = 100000
+PREVIEW_LINES = 5
+MAX_STAGE_LINES = 1000000
+PIPELINE_TIMEOUT = 5.0
+
+
+class PipelineError(Exception):
+    """Pipeline inválido (comando desconhecido, opção ou arquivo inexistente)"""
+
+
+class Unterminated(str):
+    """Última linha sem \\n no final (tr -d '\\n'); o wc -c não conta a quebra"""
+
+
+# --- Fixtures ----------------------------------------------------------------
+
+SHELLS = ("/bin/bash", "/bin/bash", "/bin/sh", "/usr/sbin/nologin", "/bin/false")
+NAMES = ("ana", "bruno", "carla", "diego", "elisa", "fabio", "gabi", "heitor", "iris", "joao")
+PAGES = ("/", "/index.html", "/login", "/api/dados", "/img/logo.png", "/sobre", "/contato")
+STATUSES = (200, 200, 200, 200, 301, 304, 404, 404, 500)
+
+
+def passwd_lines() -> Iterator[str]:
+    yield "root:x:0:0:root:/root:/bin/bash"
+    for uid, name in enumerate(("daemon", "bin", "sys", "sync", "games", "man", "lp", "mail"), 1):
+        yield f"{name}:x:{uid}:{uid}:{name}:/usr/sbin:/usr/sbin/nologin"
+    rng = random.Random(103)
+    for uid, name in enumerate(NAMES, 1000):
+        yield f"{name}:x:{uid}:{uid}:{name.title()}:/home/{name}:{rng.choice(SHELLS)}"
+
+
+ADDRESSES = tuple(f"192.168.{net}.{host}" for net in range(4) for host in range(1, 60))
+SIZES = range(200, 9000)
+LOG_BLOCK = 10000
+
+
+def access_log_lines(count: int = 50000) -> Iterator[str]:
+    """Log de acesso no formato do Apache (grande, para pipelines em fluxo)"""
+    rng = random.Random(1032)
+    for block in range(0, count, LOG_BLOCK):
+        size = min(LOG_BLOCK, count - block)
+        # Sorteios em lote (random.choices) custam bem menos que um randrange por campo
+        fields = zip(range(block, block + size), rng.choices(ADDRESSES, k=size),
+                     rng.choices(PAGES, k=size), rng.choices(STATUSES, k=size),
+                     rng.choices(SIZES, k=size))
+        for i, address, page, status, length in fields:
+            yield (f'{address} - - [18/Out/2026:{(i // 3600) % 24:02d}:{(i // 60) % 60:02d}:{i % 60:02d} '
+                   f'-0300] "GET {page} HTTP/1.1" {status} {length}')
+
+
+def words_lines() -> Iterator[str]:
+    rng = random.Random(7)
+    vocabulary = ("linux", "kernel", "shell", "grep", "sed", "awk", "pipe", "filtro", "Linux", "Shell")
+    for _ in range(300):
+        yield " ".join(rng.choice(vocabulary) for _ in range(rng.randrange(1, 8)))
+
+
+FIXTURES: Dict[str, Callable[[], Iterator[str]]] = {
+    "/etc/passwd": passwd_lines,
+    "/var/log/access.log": access_log_lines,
+    "/tmp/palavras.txt": words_lines,
+}
+
+
+# --- Estágios ------------------------------------------------------------------
+
+Stage = Callable[[List[str], Iterator[str], "Files"], Iterator[str]]
+
+
+class Files:
+    """Arquivos visíveis ao pipeline (caminho -> gerador de linhas)"""
+
+    def __init__(self, paths: Iterable[str], fixtures: Dict[str, Callable] = FIXTURES):
+        self.sources = {path: fixtures[path] for path in paths if path in fixtures}
+
+    def lines(self, path: str) -> Iterator[str]:
+        source = self.sources.get(path)
+        if source is None:
+            raise PipelineError(f"{path}: Arquivo ou diretório inexistente")
+        return source()
+
+
+def parse_options(args: List[str], flags: str, with_value: str = "",
+                  repeat: str = "") -> Tuple[Dict[str, object], List[str]]:
+    """Opções curtas (as de with_value recebem argumento; as de repeat acumulam numa lista) e operandos"""
+    options: Dict[str, object] = {}
+    operands: List[str] = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        i += 1
+        if arg.startswith("-") and len(arg) > 1 and not operands:
+            if arg[1:].isdigit() and "n" in with_value:  # head -5
+                options["n"] = arg[1:]
+                continue
+            for j in range(1, len(arg)):
+                flag = arg[j]
+                if flag in with_value:
+                    value = arg[j + 1:]
+                    if not value:
+                        if i >= len(args):
+                            raise PipelineError(f"a opção requer um argumento -- '{flag}'")
+                        value = args[i]
+                        i += 1
+                    if flag in repeat:
+                        options.setdefault(flag, []).append(value)
+                    else:
+                        options[flag] = value
+                    break
+                if flag not in flags:
+                    raise PipelineError(f"opção inválida -- '{flag}'")
+                options[flag] = ""
+        else:
+            operands.append(arg)
+    return options, operands
+
+
+def _input(operands: List[str], upstream: Iterator[str], files: Files) -> Iterator[str]:
+    if not operands:
+        return upstream
+    return itertools.chain.from_iterable(files.lines(path) for path in operands)
+
+
+def _count(value: str) -> int:
+    try:
+        count = int(value)
+    except ValueError:
+        raise PipelineError(f"número de linhas inválido: '{value}'")
+    if count < 0:
+        raise PipelineError(f"número de linhas inválido: '{value}'")
+    return min(count, sys.maxsize)  # islice e deque não aceitam mais que isso
+
+
+def _all_but_last(lines: Iterator[str], count: int) -> Iterator[str]:
+    """head -n -N: tudo menos as últimas N linhas (guarda só N em memória)"""
+    pending: deque = deque()
+    for line in lines:
+        pending.append(line)
+        if len(pending) > count:
+            yield pending.popleft()
+
+
+def stage_cat(args, upstream, files):
+    options, operands = parse_options(args, "n")
+    lines = _input(operands, upstream, files)
+    if "n" in options:
+        return (f"{number:6d}\t{line}" for number, line in enumerate(lines, 1))
+    return lines
+
+
+def stage_head(args, upstream, files):
+    options, operands = parse_options(args, "", "n")
+    value = options.get("n", "10")
+    lines = _input(operands, upstream, files)
+    if value.startswith("-"):
+        return _all_but_last(lines, _count(value[1:]))
+    return itertools.islice(lines, _count(value))
+
+
+def stage_tail(args, upstream, files):
+    options, operands = parse_options(args, "", "n")
+    value = options.get("n", "10")
+    lines = _input(operands, upstream, files)
+    if value.startswith("+"):
+        return itertools.islice(lines, max(_count(value[1:]) - 1, 0), None)
+    return iter(deque(lines, maxlen=_count(value[1:] if value.startswith("-") else value)))
+
+
+def parse_ranges(spec: str) -> List[Tuple[int, Optional[int]]]:
+    """Lista do cut (1,3-5,7-) em intervalos fechados, base 1"""
+    ranges = []
+    for part in spec.split(","):
+        start, dash, end = part.partition("-")
+        try:
+            first = int(start) if start else 1
+            last = (int(end) if end else None) if dash else first
+        except ValueError:
+            raise PipelineError(f"lista inválida: '{spec}'")
+        if first < 1:
+            raise PipelineError("os campos são numerados a partir de 1")
+        ranges.append((first, last))
+    return ranges
+
+
+def selector(ranges) -> Callable[[List[str]], List[str]]:
+    """Itens selecionados pela lista do cut; os índices são calculados uma vez por tamanho"""
+    indices: Dict[int, Tuple[int, ...]] = {}
+
+    def select(items: List[str]) -> List[str]:
+        chosen = indices.get(len(items))
+        if chosen is None:
+            chosen = indices[len(items)] = tuple(
+                index for index in range(len(items))
+                if any(first <= index + 1 and (last is None or index < last) for first, last in ranges)
+            )
+        return [items[index] for index in chosen]
+
+    return select
+
+
+def stage_cut(args, upstream, files):
+    options, operands = parse_options(args, "s", "dfc")
+    lines = _input(operands, upstream, files)
+    if "c" in options:
+        select = selector(parse_ranges(options["c"]))
+        return ("".join(select(list(line))) for line in lines)
+    if "f" not in options:
+        raise PipelineError("você deve especificar uma lista de caracteres ou campos")
+    delimiter = options.get("d", "\t")
+    if len(delimiter) != 1:
+        raise PipelineError("o delimitador deve ser um único caractere")
+    select = selector(parse_ranges(options["f"]))
+    only_delimited = "s" in options
+    return (
+        delimiter.join(select(line.split(delimiter))) if delimiter in line else line
+        for line in lines if not only_delimited or delimiter in line
+    )
+
+
+class Descending:
+    """Inverte a comparação de um componente da chave (sort -k2,2r)"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other) -> bool:
+        return self.value == other.value
+
+
+NUMBER = re.compile(r"\s*(-?\d+(?:\.\d+)?)")
+
+
+def parse_key(spec: str, options: Dict[str, object]) -> Tuple[int, Optional[int], bool, bool, bool]:
+    """-k INÍCIO[,FIM][nrf]: campos (base 0, fim exclusivo), numérica, reversa, sem caixa"""
+    start, _, end = spec.partition(",")
+    modifiers = "".join(char for char in start + end if char.isalpha())
+    try:
+        first = int(start.rstrip("nrfb")) - 1
+        last = int(end.rstrip("nrfb")) if end else None
+    except ValueError:
+        raise PipelineError(f"chave inválida: '{spec}'")
+    if first < 0 or any(char not in "nrfb" for char in modifiers):
+        raise PipelineError(f"chave inválida: '{spec}'")
+    if not modifiers.replace("b", ""):  # sem modificadores: valem as opções globais
+        modifiers = "".join(flag for flag in "nrf" if flag in options)
+    return first, last, "n" in modifiers, "r" in modifiers, "f" in modifiers
+
+
+def sort_key(options: Dict[str, object]) -> Optional[Callable[[str], tuple]]:
+    """Chave do sort: as chaves -k em ordem e, como no GNU sort, a linha inteira no desempate"""
+    separator = options.get("t") or None
+    reverse = "r" in options
+    keys = [parse_key(spec, options) for spec in options.get("k", ())]
+    if not keys:
+        if not ("n" in options or "f" in options):
+            return None
+        keys = [(0, None, "n" in options, reverse, "f" in options)]
+        separator = "\n"  # a linha inteira é o único campo
+
+    def key(line: str) -> tuple:
+        fields = line.split(separator)
+        parts = []
+        for first, last, numeric, descending, fold in keys:
+            text = (separator or " ").join(fields[first:last])
+            if numeric:
+                match = NUMBER.match(text)
+                value = float(match.group(1)) if match else 0.0
+                parts.append(-value if descending else value)
+                continue
+            value = text.lower() if fold else text
+            parts.append(Descending(value) if descending else value)
+        return tuple(parts)
+
+    return key
+
+
+def external_sort(lines: Iterator[str], key, reverse: bool) -> Iterator[str]:
+    """Ordena em blocos gravados em arquivos temporários e intercala (heapq.merge)"""
+    chunk = sorted(itertools.islice(lines, SORT_CHUNK_LINES), key=key, reverse=reverse)
+    if len(chunk) < SORT_CHUNK_LINES:
+        yield from chunk
+        return
+    runs = []
+    try:
+        while chunk:
+            run = tempfile.TemporaryFile("w+", encoding="utf-8")
+            run.writelines(line + "\n" for line in chunk)
+            run.seek(0)
+            runs.append(run)
+            chunk = sorted(itertools.islice(lines, SORT_CHUNK_LINES), key=key, reverse=reverse)
+        streams = [(line[:-1] for line in run) for run in runs]
+        yield from heapq.merge(*streams, key=key, reverse=reverse)
+    finally:
+        for run in runs:
+            run.close()
+
+
+def stage_sort(args, upstream, files):
+    options, operands = parse_options(args, "nrufb", "kt", repeat="k")
+    key = sort_key(options)
+    lines = _input(operands, upstream, files)
+    reverse = "r" in options
+    if key is None:
+        lines = external_sort(lines, None, reverse)
+        return (line for line, _ in itertools.groupby(lines)) if "u" in options else lines
+    if "u" in options:
+        # -u compara só as chaves (sem desempate): fica a primeira linha de cada grupo
+        return (next(group) for _, group in itertools.groupby(external_sort(lines, key, False), key=key))
+    tiebreak = Descending if reverse else str
+    return external_sort(lines, lambda line: (key(line), tiebreak(line)), False)
+
+
+def stage_uniq(args, upstream, files):
+    options, operands = parse_options(args, "cdui")
+    fold = "i" in options
+    groups = itertools.groupby(_input(operands, upstream, files),
+                               key=(lambda line: line.lower()) if fold else None)
+    for _, group in groups:
+        first = next(group)
+        count = 1 + sum(1 for _ in group)
+        if ("d" in options and count < 2) or ("u" in options and count > 1):
+            continue
+        yield f"{count:7d} {first}" if "c" in options else first
+
+
+def stage_wc(args, upstream, files):
+    options, operands = parse_options(args, "lwc")
+    selected = [flag for flag in "lwc" if flag in options] or ["l", "w", "c"]
+    sources = [(path, files.lines(path)) for path in operands] or [("", upstream)]
+    totals = {"l": 0, "w": 0, "c": 0}
+    rows = []
+    for name, lines in sources:
+        counts = {"l": 0, "w": 0, "c": 0}
+        for line in lines:
+            counts["l"] += 1
+            counts["w"] += len(line.split())
+            counts["c"] += len(line.encode("utf-8")) + (not isinstance(line, Unterminated))
+        for flag in totals:
+            totals[flag] += counts[flag]
+        rows.append((name, counts))
+    if len(rows) > 1:
+        rows.append(("total", totals))
+    # Largura das colunas como no GNU wc: a do total de bytes para arquivos, 7 para a entrada padrão
+    if len(selected) == 1 and len(rows) == 1:
+        width = 1
+    else:
+        width = len(str(totals["c"])) if operands else 7
+    for name, counts in rows:
+        text = " ".join(f"{counts[flag]:{width}d}" for flag in selected)
+        yield f"{text} {name}" if name else text
+
+
+TR_CLASSES = {
+    "[:upper:]": "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "[:lower:]": "abcdefghijklmnopqrstuvwxyz",
+    "[:digit:]": "0123456789",
+    "[:space:]": " \t\n\r\f\v",
+    "[:blank:]": " \t",
+    "[:punct:]": "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~",
+}
+TR_CLASSES["[:alpha:]"] = TR_CLASSES["[:upper:]"] + TR_CLASSES["[:lower:]"]
+TR_CLASSES["[:alnum:]"] = TR_CLASSES["[:alpha:]"] + TR_CLASSES["[:digit:]"]
+TR_ESCAPES = {"n": "\n", "t": "\t", "\\": "\\"}
+
+
+def expand_set(spec: str) -> str:
+    """Conjunto do tr: classes [:upper:], intervalos a-z e escapes \\n \\t"""
+    chars = []
+    i = 0
+    while i < len(spec):
+        name = next((name for name in TR_CLASSES if spec.startswith(name, i)), None)
+        if name:
+            chars.append(TR_CLASSES[name])
+            i += len(name)
+            continue
+        char = spec[i]
+        if char == "\\" and i + 1 < len(spec):
+            char = TR_ESCAPES.get(spec[i + 1], spec[i + 1])
+            i += 1
+        if i + 2 < len(spec) and spec[i + 1] == "-":
+            chars.extend(chr(code) for code in range(ord(char), ord(spec[i + 2]) + 1))
+            i += 3
+        else:
+            chars.append(char)
+            i += 1
+    return "".join(chars)
+
+
+def _squeeze_first(match) -> str:
+    return match.group(0)[0]
+
+
+def stage_tr(args, upstream, files):
+    options, operands = parse_options(args, "ds")
+    if not operands or len(operands) > 2:
+        raise PipelineError("tr: número de operandos inválido (tr não lê arquivos, use < ou |)")
+    first = expand_set(operands[0])
+    squeeze = ""
+    if "d" in options:
+        table = {ord(char): None for char in first}
+        if len(operands) > 1:
+            squeeze = expand_set(operands[1])
+    elif len(operands) == 2:
+        second = expand_set(operands[1])
+        if not second:
+            raise PipelineError("tr: o conjunto 2 não pode ser vazio")
+        second += second[-1] * (len(first) - len(second))
+        table = {ord(a): b for a, b in zip(first, second)}
+        if "s" in options:
+            squeeze = second
+    elif "s" in options:
+        table, squeeze = {}, first
+    else:
+        raise PipelineError("tr: falta o operando")
+    squeezer = re.compile("|".join(f"{re.escape(char)}+" for char in set(squeeze))) if squeeze else None
+
+    # Trabalha sobre caracteres (o \n também pode ser traduzido) e refaz as linhas
+    pending: List[str] = []
+    last = ""
+    for line in upstream:
+        text = (line + "\n").translate(table)
+        if squeezer is not None:
+            text = squeezer.sub(_squeeze_first, last + text)[len(last):]
+        if not text:
+            continue
+        last = text[-1]
+        *complete, rest = text.split("\n")
+        if complete:
+            pending.append(complete[0])
+            yield "".join(pending)
+            yield from complete[1:]
+            pending = []
+        if rest:
+            pending.append(rest)
+    if pending:
+        yield Unterminated("".join(pending))
+
+
+REGEX_CLASSES = {
+    "[:alpha:]": "a-zA-Z", "[:digit:]": "0-9", "[:alnum:]": "a-zA-Z0-9",
+    "[:upper:]": "A-Z", "[:lower:]": "a-z", "[:space:]": r"\s", "[:blank:]": r" \t",
+    "[:punct:]": r"!-/:-@\[-`{-~", "[:xdigit:]": "0-9A-Fa-f",
+}
+
+
+def posix_regex(pattern: str, extended: bool = False) -> str:
+    """Converte uma expressão POSIX (BRE do grep, ERE do grep -E) para a sintaxe do re"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "[":
+            # Lista entre colchetes: ] logo no início é literal, \\ é literal
+            out.append("[")
+            i += 1
+            if pattern.startswith("^", i):
+                out.append("^")
+                i += 1
+            if pattern.startswith("]", i):
+                out.append(r"\]")
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                name = next((name for name in REGEX_CLASSES if pattern.startswith(name, i)), None)
+                if name:
+                    out.append(REGEX_CLASSES[name])
+                    i += len(name)
+                    continue
+                out.append("\\" + pattern[i] if pattern[i] in "\\[" else pattern[i])
+                i += 1
+            if i >= len(pattern):
+                raise PipelineError("[ sem o ] correspondente")
+            out.append("]")
+        elif char == "\\" and i + 1 < len(pattern):
+            following = pattern[i + 1]
+            i += 1
+            if not extended and following in "+?|(){}":
+                out.append(following)  # \+ \| \( ... são operadores na BRE
+            elif following in "<>":
+                out.append(r"\b")
+            else:
+                out.append("\\" + following)
+        elif not extended and char in "+?|(){}":
+            out.append("\\" + char)  # literais na BRE
+        elif char == "*" and (not out or out[-1] in ("^", "(")):
+            out.append(r"\*")  # * no início do padrão é literal
+        else:
+            out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def regex_source(pattern: str, extended: bool = False, fixed: bool = False,
+                 word: bool = False, whole_line: bool = False) -> str:
+    """Padrão do grep (com -E, -F, -w, -x) na sintaxe do re"""
+    source = re.escape(pattern) if fixed else posix_regex(pattern, extended)
+    if word:
+        source = rf"\b(?:{source})\b"
+    if whole_line:
+        source = f"^(?:{source})$"
+    return source
+
+
+@lru_cache(maxsize=256)
+def compile_regex(pattern: str, extended: bool = False, fixed: bool = False,
+                  ignore_case: bool = False, word: bool = False, whole_line: bool = False):
+    """Expressão compilada (cache LRU: a mesma resposta é corrigida muitas vezes)"""
+    source = regex_source(pattern, extended, fixed, word, whole_line)
+    try:
+        return re.compile(source, re.IGNORECASE if ignore_case else 0)
+    except re.error as error:
+        raise PipelineError(f"expressão regular inválida: {error}")
+
+
+def stage_grep(args, upstream, files, extended: bool = False):
+    options, operands = parse_options(args, "iEFvcnwx", "e")
+    pattern = options.get("e")
+    if pattern is None:
+        if not operands:
+            raise PipelineError("uso: grep [OPÇÃO]... PADRÃO [ARQUIVO]...")
+        pattern, operands = operands[0], operands[1:]
+    regex = compile_regex(pattern, extended or "E" in options, "F" in options,
+                          "i" in options, "w" in options, "x" in options)
+    invert = "v" in options
+    matched = ((number, line) for number, line in enumerate(_input(operands, upstream, files), 1)
+               if (regex.search(line) is None) == invert)
+    if "c" in options:
+        return iter([str(sum(1 for _ in matched))])
+    if "n" in options:
+        return (f"{number}:{line}" for number, line in matched)
+    return (line for _, line in matched)
+
+
+PUNCTUATION_WORDS = frozenset((";", "&&", "||", "&", ">", ">>", "<", "|&"))
+
+STAGES: Dict[str, Stage] = {
+    "cat": stage_cat,
+    "head": stage_head,
+    "tail": stage_tail,
+    "cut": stage_cut,
+    "sort": stage_sort,
+    "uniq": stage_uniq,
+    "wc": stage_wc,
+    "tr": stage_tr,
+    "grep": stage_grep,
+    "egrep": lambda args, upstream, files: stage_grep(args, upstream, files, True),
+}
+
+
+# --- Execução e correção -------------------------------------------------------
+
+@lru_cache(maxsize=1024)
+def parse(text: str) -> Tuple[Tuple[str, ...], ...]:
+    """Palavras de cada estágio do pipeline"""
+    try:
+        words = split_words(text)
+    except VFSError as error:
+        raise PipelineError(str(error))
+    stages, current = [], []
+    redirect = None
+    for index, (word, quoted) in enumerate(words):
+        if quoted:
+            current.append(word)
+        elif word == "|":
+            stages.append(tuple(current))
+            current = []
+        elif word == "<" and not stages and index + 1 < len(words):
+            redirect = words[index + 1][0]  # cmd < arquivo equivale a cat arquivo | cmd
+        elif word in PUNCTUATION_WORDS:
+            raise PipelineError(f"'{word}' não é permitido: use apenas comandos ligados por |")
+        elif not (redirect is not None and index and words[index - 1] == ("<", False)):
+            current.append(word)
+    stages.append(tuple(current))
+    if redirect is not None:
+        stages.insert(0, ("cat", redirect))
+    for stage in stages:
+        if not stage:
+            raise PipelineError("erro de sintaxe próximo a '|'")
+        if stage[0] not in STAGES:
+            raise PipelineError(f"{stage[0]}: comando não disponível "
+                                f"(use {', '.join(sorted(STAGES))})")
+    return tuple(stages)
+
+
+def _overflow(lines: Iterator[str], command: str) -> Iterator[str]:
+    """Não produz nada; falha se o estágio ainda tiver linhas depois do limite"""
+    if next(lines, None) is not None:
+        raise PipelineError(f"{command}: mais de {MAX_STAGE_LINES:,} linhas de saída")
+    return
+    yield
+
+
+def run(text: str, files: Files) -> Iterator[str]:
+    """Linhas de saída do pipeline (geradas sob demanda)"""
+    lines: Iterator[str] = iter(())
+    for words in parse(text):
+        stage = iter(STAGES[words[0]](list(words[1:]), lines, files))
+        # islice/chain limitam o estágio sem um laço Python por linha
+        lines = itertools.chain(itertools.islice(stage, MAX_STAGE_LINES), _overflow(stage, words[0]))
+    return lines
+
+
+def output_digest(text: str, paths: Tuple[str, ...]) -> bytes:
+    """Resumo (BLAKE2) dos bytes de saída, calculado em fluxo"""
+    digest = hashlib.blake2b(digest_size=16)
+    for line in run(text, Files(paths)):
+        digest.update(line.encode("utf-8"))
+        if not isinstance(line, Unterminated):
+            digest.update(b"\n")
+    return digest.digest()
+
+
+@lru_cache(maxsize=256)
+def reference_digests(references: Tuple[str, ...], paths: Tuple[str, ...]) -> FrozenSet[bytes]:
+    """Saídas de referência de uma questão, executadas uma única vez"""
+    return frozenset(output_digest(reference, paths) for reference in references)
+
+
+def grade_output(answer: str, references: Tuple[str, ...], paths: Tuple[str, ...]) -> bool:
+    """Executa a resposta e compara com as referências (no processo de trabalho)"""
+    try:
+        return output_digest(answer, paths) in reference_digests(references, paths)
+    except Exception:  # qualquer falha do avaliador conta como resposta errada
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _grade(answer: str, references: Tuple[str, ...], paths: Tuple[str, ...]) -> bool:
+    # WorkerError (tempo esgotado) é levantado e não fica no cache
+    try:
+        if canonical(answer) in {canonical(reference) for reference in references}:
+            return True
+        parse(answer)  # erro de sintaxe: nem chega a executar as referências
+    except Exception:
+        return False
+    return shared().call(grade_output, answer, references, paths, timeout=PIPELINE_TIMEOUT)
+
+
+def grade(answer: str, references: Tuple[str, ...], paths: Tuple[str, ...]) -> bool:
+    """Correta se a saída for igual à de algum pipeline de referência"""
+    try:
+        return _grade(answer, references, paths)
+    except WorkerError:
+        return False
+
+
+def preview_output(text: str, paths: Tuple[str, ...], count: int = PREVIEW_LINES) -> str:
+    """Primeiras linhas da saída (ou a mensagem de erro), no processo atual"""
+    try:
+        lines = list(itertools.islice(run(text, Files(paths)), count + 1))
+    except Exception as error:
+        return f"erro: {error}"
+    shown = "\n".join(lines[:count])
+    return shown + ("\n..." if len(lines) > count else "") if lines else "(saída vazia)"
+
+
+@lru_cache(maxsize=256)
+def _preview(text: str, paths: Tuple[str, ...], count: int) -> str:
+    # A saída esperada de uma questão é executada uma vez só; WorkerError não fica no cache
+    return shared().call(preview_output, text, paths, count, timeout=PIPELINE_TIMEOUT)
+
+
+def preview(text: str, paths: Iterable[str], count: int = PREVIEW_LINES) -> str:
+    """Primeiras linhas da saída (ou a mensagem de erro), para o feedback"""
+    try:
+        return _preview(text, tuple(paths), count)
+    except WorkerError as error:
+        return f"erro: {error}"
@@ -0,0 +1,100 @@
+"""
+Representação compacta de uma questão LPIC-1
+
+Um dict por questão (cinco chaves, mais "id" e "topic") e uma lista de opções
+custam várias centenas de bytes além do próprio texto. A Question usa
+__slots__ (sem __dict__ por instância), guarda o tipo como um inteiro pequeno,
+as opções numa tupla e interna as strings que se repetem entre questões
+(tópico, opções como "Nenhuma das anteriores"), que passam a existir uma única
+vez na memória.
+
+As fontes JSON e o pacote compilado continuam usando dicts; a conversão
+acontece na leitura (Question.from_dict) e, quando necessário, na volta
+(to_dict).
+"""
+
+import sys
+from typing import Dict, Tuple, Union
+
+MULTIPLE = 0
+TEXT = 1
+PIPELINE = 2  # opções: arquivos de exemplo; gabarito: pipelines de referência
+REGEX = 3  # opções: linhas "match" seguidas das "reject"; gabarito: quantas são "match"
+TYPE_CODES = {"multiple": MULTIPLE, "text": TEXT, "pipeline": PIPELINE, "regex": REGEX}
+TYPE_NAMES = ("multiple", "text", "pipeline", "regex")
+
+_intern = sys.intern
+
+
+class Question:
+    """Questão imutável na prática: enunciado, opções, gabarito e explicação"""
+
+    __slots__ = ("id", "topic", "text", "kind", "options", "correct", "explanation")
+
+    def __init__(self, text: str, kind: int, options: Tuple[str, ...],
+                 correct: Union[int, Tuple[str, ...]], explanation: str = "",
+                 question_id: str = "", topic: str = ""):
+        self.id = question_id
+        self.topic = _intern(topic)
+        self.text = text
+        self.kind = kind
+        self.options = options
+        self.correct = correct  # índice da opção, respostas aceitas (TEXT, PIPELINE) ou nº de "match" (REGEX)
+        self.explanation = explanation
+
+    @classmethod
+    def from_dict(cls, data: Dict, topic: str = "") -> "Question":
+        """Converte um registro do pacote/fonte JSON"""
+        kind = TYPE_CODES[data["type"]]
+        options = data.get("options", ())
+        if kind == REGEX:
+            options = data["match"] + data["reject"]
+            correct = len(data["match"])
+        elif kind != MULTIPLE:
+            correct = tuple(_intern(answer) for answer in data["correct"])
+        else:
+            correct = data["correct"]
+        return cls(
+            data["question"],
+            kind,
+            tuple(_intern(option) for option in options),
+            correct,
+            data.get("explanation", ""),
+            data.get("id", ""),
+            data.get("topic", topic),
+        )
+
+    def to_dict(self) -> Dict:
+        """Registro no formato das fontes JSON"""
+        data = {
+            "id": self.id,
+            "question": self.text,
+            "type": self.type,
+            "explanation": self.explanation,
+        }
+        if self.kind == REGEX:
+            data["match"] = list(self.options[:self.correct])
+            data["reject"] = list(self.options[self.correct:])
+        else:
+            data["correct"] = self.correct if self.kind == MULTIPLE else list(self.correct)
+        if self.kind in (MULTIPLE, PIPELINE):
+            data["options"] = list(self.options)
+        if self.topic:
+            data["topic"] = self.topic
+        return data
+
+    @property
+    def type(self) -> str:
+        return TYPE_NAMES[self.kind]
+
+    @property
+    def is_multiple(self) -> bool:
+        return self.kind == MULTIPLE
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Question):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Question({self.id!r}, {self.type}, {self.text[:40]!r})"
@@ -0,0 +1,129 @@
+"""
+Banco de questões LPIC-1 (sem interface gráfica)
+
+O QuestionBank lê as questões do pacote compilado (questions.qpack) sob demanda:
+cada tópico é decodificado no primeiro acesso e mantido num cache LRU de
+tópicos. Fica fora do LPIC1.py para que o servidor, a correção em lote e os
+benchmarks usem o banco sem importar o Tkinter.
+"""
+
+import random
+import sys
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from question import Question
+from question_pack import load_pack
+
+
+def estimate_size(obj) -> int:
+    """Estima em bytes a memória de uma estrutura de questões (listas, dicts, strings)"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, Question):
+        size += sum(estimate_size(getattr(obj, slot)) for slot in Question.__slots__)
+    elif isinstance(obj, dict):
+        size += sum(estimate_size(key) + estimate_size(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(estimate_size(item) for item in obj)
+    return size
+
+
+class QuestionBank:
+    """Banco de questões LPIC-1 baseado no conteúdo oficial"""
+    
+    def __init__(self, pack_path: Optional[str] = None, max_cached_topics: int = 32):
+        # Questões ficam no pacote compilado (questions.qpack), lidas sob demanda
+        self.pack = load_pack(pack_path)
+        
+        # Registro de tópicos: nada é construído até o primeiro uso
+        self._builders: Dict[str, Callable[[], List[Dict]]] = {
+            topic: partial(self.pack.get_topic, topic) for topic in self.pack.topics()
+        }
+        
+        # Cache LRU de tópicos materializados
+        self.max_cached_topics = max_cached_topics
+        self._cache: "OrderedDict[str, List[Question]]" = OrderedDict()
+        
+        # Índice id -> questão, montado por tópico quando necessário e
+        # descartado junto com o tópico (senão manteria as questões vivas)
+        self._id_index: Dict[str, Dict[str, Question]] = {}
+        
+        # Tempo (s) e memória (bytes) da construção de cada tópico
+        self.build_stats: Dict[str, Dict[str, float]] = {}
+    
+    def get_questions(self, topic: str) -> List[Question]:
+        """Retorna as questões de um tópico, construindo-as no primeiro acesso"""
+        if topic in self._cache:
+            self._cache.move_to_end(topic)
+            return self._cache[topic]
+        
+        builder = self._builders.get(topic)
+        if builder is None:
+            return []
+        
+        start = time.perf_counter()
+        questions = [
+            record if isinstance(record, Question) else Question.from_dict(record, topic)
+            for record in builder()
+        ]
+        elapsed = time.perf_counter() - start
+        self.build_stats[topic] = {
+            "seconds": elapsed,
+            "bytes": estimate_size(questions),
+            "questions": len(questions),
+        }
+        
+        self._cache[topic] = questions
+        while len(self._cache) > self.max_cached_topics:
+            evicted, _ = self._cache.popitem(last=False)
+            self._id_index.pop(evicted, None)
+        return questions
+    
+    def get_topic_count(self, topic: str) -> int:
+        """Número de questões de um tópico, sem materializá-lo"""
+        if topic in self._cache:
+            return len(self._cache[topic])
+        if topic not in self._builders:
+            return 0
+        return len(self.pack.topic_range(topic))
+    
+    def get_question(self, topic: str, offset: int) -> Question:
+        """Retorna uma questão pela posição dentro do tópico"""
+        if topic in self._cache:
+            return self._cache[topic][offset]
+        return Question.from_dict(self.pack.get(self.pack.topic_range(topic)[offset]), topic)
+    
+    def get_question_by_id(self, question_id: str, topic: str) -> Optional[Question]:
+        """Procura uma questão pelo id dentro do tópico informado"""
+        index = self._id_index.get(topic)
+        if index is None:
+            index = {question.id: question for question in self.get_questions(topic)}
+            self._id_index[topic] = index
+        return index.get(question_id)
+    
+    def get_random_questions(self, topic: str, num: int = 10) -> List[Question]:
+        """Retorna questões aleatórias de um tópico específico"""
+        available = self.get_questions(topic)
+        if num > len(available):
+            num = len(available)
+        return random.sample(available, num)
+    
+    def get_all_topics(self) -> List[str]:
+        """Retorna lista de todos os tópicos disponíveis"""
+        return list(self._builders)
+    
+    def get_build_report(self) -> str:
+        """Relatório de tempo e memória dos tópicos já construídos"""
+        lines = []
+        for topic, stats in self.build_stats.items():
+            cached = "cache" if topic in self._cache else "descartado"
+            lines.append(
+                f"{topic}: {stats['questions']} questões, "
+                f"{stats['seconds'] * 1000:.2f} ms, "
+                f"{stats['bytes'] / 1024:.1f} KiB ({cached})"
+            )
+        built = len(self.build_stats)
+        lines.append(f"Tópicos construídos: {built} de {len(self._builders)}")
+        return "\n".join(lines)
@@ -0,0 +1,240 @@
+"""
+Pacote de questões LPIC-1 (.qpack)
+
+As questões são mantidas como fontes JSON, um arquivo por tópico em
+src/questions/<tópico>.json, e compiladas num arquivo binário indexado que o
+QuestionBank mapeia em memória (mmap) e decodifica sob demanda.
+
+Layout do arquivo compilado (little-endian):
+    cabeçalho   MAGIC (4s) | versão (H) | reservado (H) | tópicos (I) | questões (I)
+    tópicos     por tópico: chave (H + utf-8) | título (H + utf-8) | primeira (I) | quantidade (I)
+    offsets     (questões + 1) x Q, relativos ao início da área de dados
+    dados       registros JSON utf-8 concatenados, um por questão
+
+Cada registro recebe um campo "id" estável (derivado do tópico e do enunciado)
+quando a fonte não define um, usado pelo histórico de tentativas.
+
+COMPILAR AS FONTES:
+    python question_pack.py [pasta_fontes] [arquivo_saida]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+PACK_MAGIC = b"LQPK"
+PACK_VERSION = 1
+
+HEADER = struct.Struct("<4sHHII")
+TOPIC_COUNTS = struct.Struct("<II")
+LENGTH = struct.Struct("<H")
+OFFSET = struct.Struct("<Q")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOURCE_DIR = os.path.join(BASE_DIR, "questions")
+DEFAULT_PACK_PATH = os.path.join(BASE_DIR, "questions.qpack")
+
+
+def topic_sort_key(topic: str) -> Tuple:
+    """Ordena tópicos numericamente (101.2 antes de 101.10)"""
+    return tuple(int(part) if part.isdigit() else part for part in topic.split("."))
+
+
+def question_id(topic: str, question: Dict) -> str:
+    """Identificador estável de uma questão (campo "id" ou hash do enunciado)"""
+    if "id" in question:
+        return question["id"]
+    digest = hashlib.sha1(f"{topic}\n{question['question']}".encode("utf-8"))
+    return f"{topic}-{digest.hexdigest()[:10]}"
+
+
+def load_sources(source_dir: str = DEFAULT_SOURCE_DIR) -> List[Dict]:
+    """Lê os arquivos JSON de cada tópico, em ordem de tópico"""
+    topics = []
+    for name in os.listdir(source_dir):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(source_dir, name), encoding="utf-8") as f:
+            data = json.load(f)
+        if "topic" not in data or "questions" not in data:
+            raise ValueError(f"Fonte de questões inválida: {name}")
+        topics.append(data)
+    topics.sort(key=lambda data: topic_sort_key(data["topic"]))
+    return topics
+
+
+def build_pack(topics: List[Dict]) -> bytes:
+    """Compila a lista de tópicos no formato binário do pacote"""
+    topic_table = bytearray()
+    offsets = bytearray()
+    data = bytearray()
+    total = 0
+
+    for topic in topics:
+        questions = topic["questions"]
+        for key in (topic["topic"], topic.get("title", "")):
+            encoded = key.encode("utf-8")
+            topic_table += LENGTH.pack(len(encoded)) + encoded
+        topic_table += TOPIC_COUNTS.pack(total, len(questions))
+
+        for question in questions:
+            record = dict(question, id=question_id(topic["topic"], question))
+            offsets += OFFSET.pack(len(data))
+            data += json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        total += len(questions)
+
+    offsets += OFFSET.pack(len(data))
+    header = HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(topics), total)
+    return header + bytes(topic_table) + bytes(offsets) + bytes(data)
+
+
+def compile_pack(source_dir: str = DEFAULT_SOURCE_DIR, pack_path: str = DEFAULT_PACK_PATH) -> int:
+    """Compila as fontes em disco e retorna o número de questões gravadas"""
+    topics = load_sources(source_dir)
+    payload = build_pack(topics)
+
+    # Grava em arquivo temporário e troca atomicamente
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, pack_path)
+    return sum(len(topic["questions"]) for topic in topics)
+
+
+class QuestionPack:
+    """Acesso somente leitura a um pacote compilado, decodificando sob demanda"""
+
+    def __init__(self, buffer):
+        self._file = None
+        self._buffer = buffer
+
+        magic, version, _, topic_count, question_count = HEADER.unpack_from(buffer, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("Arquivo não é um pacote de questões LPIC-1")
+        if version != PACK_VERSION:
+            raise ValueError(f"Versão de pacote não suportada: {version}")
+
+        self.question_count = question_count
+        self.titles = {}
+        self._ranges = {}
+
+        # Tabela de tópicos (pequena, lida inteira na abertura)
+        pos = HEADER.size
+        for _ in range(topic_count):
+            fields = []
+            for _ in range(2):
+                (length,) = LENGTH.unpack_from(buffer, pos)
+                pos += LENGTH.size
+                fields.append(bytes(buffer[pos:pos + length]).decode("utf-8"))
+                pos += length
+            first, count = TOPIC_COUNTS.unpack_from(buffer, pos)
+            pos += TOPIC_COUNTS.size
+            self.titles[fields[0]] = fields[1]
+            self._ranges[fields[0]] = range(first, first + count)
+
+        self._offsets_pos = pos
+        self._data_pos = pos + (question_count + 1) * OFFSET.size
+
+    @classmethod
+    def open(cls, path: str) -> "QuestionPack":
+        """Abre um pacote em disco via mmap"""
+        f = open(path, "rb")
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            f.close()
+            raise
+        pack = cls(buffer)
+        pack._file = f
+        return pack
+
+    def close(self):
+        """Libera o mapeamento e o arquivo"""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return self.question_count
+
+    def __contains__(self, topic: str) -> bool:
+        return topic in self._ranges
+
+    def topics(self) -> List[str]:
+        """Chaves dos tópicos na ordem do pacote"""
+        return list(self._ranges)
+
+    def topic_range(self, topic: str) -> range:
+        """Índices globais das questões de um tópico"""
+        return self._ranges.get(topic, range(0))
+
+    def record(self, index: int) -> bytes:
+        """Bytes brutos (JSON) da questão de índice global"""
+        if not 0 <= index < self.question_count:
+            raise IndexError(index)
+        pos = self._offsets_pos + index * OFFSET.size
+        (start,) = OFFSET.unpack_from(self._buffer, pos)
+        (end,) = OFFSET.unpack_from(self._buffer, pos + OFFSET.size)
+        return self._buffer[self._data_pos + start:self._data_pos + end]
+
+    def get(self, index: int) -> Dict:
+        """Decodifica a questão de índice global"""
+        return json.loads(self.record(index))
+
+    def signature(self) -> str:
+        """Hash SHA-1 do conteúdo do pacote (identifica índices derivados)"""
+        return hashlib.sha1(self._buffer).hexdigest()
+
+    def get_topic(self, topic: str) -> List[Dict]:
+        """Decodifica todas as questões de um tópico"""
+        return [self.get(i) for i in self.topic_range(topic)]
+
+
+def _sources_newer(source_dir: str, pack_path: str) -> bool:
+    """Verifica se alguma fonte foi alterada depois da compilação"""
+    if not os.path.isdir(source_dir):
+        return False
+    pack_mtime = os.path.getmtime(pack_path)
+    for entry in os.scandir(source_dir):
+        if entry.name.endswith(".json") and entry.stat().st_mtime > pack_mtime:
+            return True
+    return False
+
+
+def load_pack(pack_path: Optional[str] = None, source_dir: Optional[str] = None) -> QuestionPack:
+    """Abre o pacote, recompilando a partir das fontes se estiver ausente ou desatualizado"""
+    if pack_path is None:
+        pack_path = DEFAULT_PACK_PATH
+        source_dir = source_dir or DEFAULT_SOURCE_DIR
+
+    # Pacote informado sem fontes: apenas abre
+    if source_dir is None:
+        return QuestionPack.open(pack_path)
+
+    if os.path.exists(pack_path) and not _sources_newer(source_dir, pack_path):
+        return QuestionPack.open(pack_path)
+
+    try:
+        compile_pack(source_dir, pack_path)
+    except OSError:
+        # Instalação somente leitura: compila em memória
+        return QuestionPack(build_pack(load_sources(source_dir)))
+    return QuestionPack.open(pack_path)
+
+
+def main():
+    """Compila as fontes de questões a partir da linha de comando"""
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOURCE_DIR
+    pack_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PACK_PATH
+    total = compile_pack(source_dir, pack_path)
+    print(f"{total} questões compiladas em {pack_path}")
+
+
+if __name__ == "__main__":
+    main()
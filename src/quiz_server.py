@@ -0,0 +1,352 @@
+"""
+Servidor HTTP/JSON local para turmas (várias sessões de teste simultâneas)
+
+Expõe o QuestionBank para navegadores ou scripts de uma sala de aula, sem
+instalar o aplicativo Tk em cada máquina. Roda num único processo asyncio, com
+um parser HTTP/1.1 mínimo e conexões keep-alive.
+
+Cada sessão guarda apenas o tópico, as posições das questões (array de
+inteiros) e as respostas (bytearray), algumas dezenas de bytes por questão; o
+conteúdo das questões vem do pacote compartilhado e o JSON público de cada
+questão é cacheado. Sessões inativas expiram após SESSION_TTL segundos.
+
+Rotas:
+    GET    /topics                         tópicos e número de questões
+    POST   /sessions                       {"topic": "...", "num": 10} -> sessão
+    GET    /sessions/<id>/questions/<i>    enunciado e opções (sem gabarito)
+    POST   /sessions/<id>/answers          {"index": i, "answer": "2"} -> correção
+    GET    /sessions/<id>/results          resumo (equivale ao finish_test)
+    DELETE /sessions/<id>                  encerra a sessão
+
+Uso: python quiz_server.py [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import secrets
+import time
+from array import array
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from question import PIPELINE, REGEX, TEXT
+from question_bank import QuestionBank
+from quiz_session import grade_answer, performance_rating
+import timed_worker
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+SESSION_TTL = 2 * 60 * 60
+SWEEP_INTERVAL = 60
+MAX_SESSION_QUESTIONS = 100
+MAX_BODY = 64 * 1024
+NO_ANSWER = 0xFF
+
+REASONS = {
+    200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """Erro a ser devolvido ao cliente como resposta JSON"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ServerSession:
+    """Estado compacto de uma sessão de teste no servidor"""
+
+    __slots__ = ("topic", "offsets", "answers", "correct", "answered", "last_seen")
+
+    def __init__(self, topic: str, offsets, now: float):
+        self.topic = topic
+        self.offsets = array("I", offsets)
+        self.answers = bytearray([NO_ANSWER]) * len(self.offsets)
+        self.correct = 0
+        self.answered = 0
+        self.last_seen = now
+
+
+class QuizServer:
+    """Sessões de teste em memória servidas por HTTP"""
+
+    def __init__(self, bank: Optional[QuestionBank] = None, ttl: float = SESSION_TTL):
+        self.bank = bank or QuestionBank()
+        self.ttl = ttl
+        self.sessions: Dict[str, ServerSession] = {}
+        self.requests = 0
+        self._topics_body = json.dumps({
+            "topics": [
+                {"topic": topic, "count": self.bank.get_topic_count(topic)}
+                for topic in self.bank.get_all_topics()
+            ]
+        }).encode()
+        self._public_question = lru_cache(maxsize=8192)(self._encode_question)
+
+    # --- Sessões -------------------------------------------------------------
+
+    def create_session(self, topic: str, num: int = 10) -> Tuple[str, ServerSession]:
+        """Sorteia as questões de um tópico (equivale ao start_test)"""
+        count = self.bank.get_topic_count(topic)
+        if count == 0:
+            raise HTTPError(404, f"Tópico desconhecido: {topic}")
+        num = max(1, min(num, count, MAX_SESSION_QUESTIONS))
+        session = ServerSession(topic, random.sample(range(count), num), time.monotonic())
+        session_id = secrets.token_urlsafe(12)
+        self.sessions[session_id] = session
+        return session_id, session
+
+    def get_session(self, session_id: str) -> ServerSession:
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise HTTPError(404, "Sessão não encontrada ou expirada")
+        session.last_seen = time.monotonic()
+        return session
+
+    def expire_sessions(self, now: Optional[float] = None) -> int:
+        """Remove sessões inativas há mais de `ttl` segundos"""
+        if now is None:
+            now = time.monotonic()
+        limit = now - self.ttl
+        expired = [sid for sid, session in self.sessions.items() if session.last_seen < limit]
+        for session_id in expired:
+            del self.sessions[session_id]
+        return len(expired)
+
+    def _encode_question(self, topic: str, offset: int) -> bytes:
+        """Enunciado e opções em JSON, sem gabarito nem explicação"""
+        question = self.bank.get_question(topic, offset)
+        public = {
+            "id": question.id,
+            "type": question.type,
+            "question": question.text,
+        }
+        if question.kind == REGEX:
+            public["match"] = question.options[:question.correct]
+            public["reject"] = question.options[question.correct:]
+        elif question.kind != TEXT:  # alternativas, ou arquivos de um pipeline
+            public["options"] = question.options
+        return json.dumps(public, ensure_ascii=False).encode()
+
+    def question_body(self, session: ServerSession, index: int) -> bytes:
+        if not 0 <= index < len(session.offsets):
+            raise HTTPError(404, f"Questão inexistente: {index}")
+        question = self._public_question(session.topic, session.offsets[index])
+        answered = session.answers[index] != NO_ANSWER
+        return b'{"index":%d,"total":%d,"answered":%s,"question":%s}' % (
+            index, len(session.offsets), b"true" if answered else b"false", question
+        )
+
+    async def answer(self, session: ServerSession, index: int, user_answer: str) -> Dict:
+        """Corrige e registra a resposta de uma questão da sessão"""
+        if not 0 <= index < len(session.offsets):
+            raise HTTPError(404, f"Questão inexistente: {index}")
+        if session.answers[index] != NO_ANSWER:
+            raise HTTPError(409, "Questão já respondida")
+        if not isinstance(user_answer, str):  # null, 123, ["ls"]: não gasta a questão
+            raise HTTPError(400, "A resposta deve ser um texto")
+        user_answer = user_answer.strip()
+        if not user_answer:
+            raise HTTPError(400, "Resposta vazia")
+
+        question = self.bank.get_question(session.topic, session.offsets[index])
+        # A questão é reservada durante a correção (uma 2ª requisição recebe 409)
+        # e liberada se a correção falhar, para o aluno poder responder de novo
+        session.answers[index] = NO_ANSWER - 1
+        try:
+            if question.kind in (PIPELINE, REGEX):
+                # Código do aluno roda no processo de trabalho; a espera fica numa
+                # thread do executor para o laço continuar atendendo as outras sessões
+                loop = asyncio.get_running_loop()
+                is_correct = await loop.run_in_executor(None, grade_answer, question, user_answer)
+            else:
+                is_correct = grade_answer(question, user_answer)
+        except BaseException:
+            session.answers[index] = NO_ANSWER
+            raise
+        option = int(user_answer) if user_answer.isdecimal() else NO_ANSWER
+        session.answers[index] = option if option < NO_ANSWER else NO_ANSWER - 1
+        session.answered += 1
+        session.correct += is_correct
+        return {
+            "index": index,
+            "correct": is_correct,
+            "answer": question.correct,
+            "explanation": question.explanation,
+        }
+
+    def results(self, session: ServerSession) -> Dict:
+        """Resumo da sessão (equivale ao finish_test)"""
+        total = len(session.offsets)
+        percentage = (session.correct / total * 100) if total else 0
+        performance, message = performance_rating(percentage)
+        return {
+            "topic": session.topic,
+            "total": total,
+            "answered": session.answered,
+            "correct": session.correct,
+            "percentage": percentage,
+            "performance": performance,
+            "message": message,
+        }
+
+    # --- HTTP ----------------------------------------------------------------
+
+    async def route(self, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        """Despacha uma requisição; retorna (status, corpo JSON)"""
+        parts = path.split("?", 1)[0].strip("/").split("/")
+
+        if parts == ["topics"]:
+            if method != "GET":
+                raise HTTPError(405, "Use GET")
+            return 200, self._topics_body
+
+        if parts[0] != "sessions":
+            raise HTTPError(404, "Rota inexistente")
+
+        if len(parts) == 1:
+            if method != "POST":
+                raise HTTPError(405, "Use POST")
+            data = parse_json(body)
+            session_id, session = self.create_session(str(data.get("topic", "")),
+                                                      to_int(data.get("num", 10)))
+            return 201, json.dumps({"session": session_id, "topic": session.topic,
+                                    "total": len(session.offsets)}).encode()
+
+        session_id = parts[1]
+        if len(parts) == 2:
+            if method != "DELETE":
+                raise HTTPError(405, "Use DELETE")
+            if self.sessions.pop(session_id, None) is None:
+                raise HTTPError(404, "Sessão não encontrada ou expirada")
+            return 200, b'{"deleted":true}'
+
+        session = self.get_session(session_id)
+        action = parts[2]
+        if action == "questions" and len(parts) == 4 and method == "GET":
+            return 200, self.question_body(session, to_int(parts[3]))
+        if action == "answers" and len(parts) == 3 and method == "POST":
+            data = parse_json(body)
+            result = await self.answer(session, to_int(data.get("index")), data.get("answer", ""))
+            return 200, json.dumps(result, ensure_ascii=False).encode()
+        if action == "results" and len(parts) == 3 and method == "GET":
+            return 200, json.dumps(self.results(session), ensure_ascii=False).encode()
+        raise HTTPError(404, "Rota inexistente")
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter):
+        """Atende as requisições de uma conexão (keep-alive)"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, path, version = lines[0].split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version == "HTTP/1.1")
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                try:
+                    if length < 0:
+                        raise HTTPError(400, "Content-Length inválido")
+                    if length > MAX_BODY:
+                        raise HTTPError(413, "Corpo muito grande")
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self.route(method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, json.dumps({"error": str(e)}, ensure_ascii=False).encode()
+                    if length < 0 or length > MAX_BODY:  # corpo não lido: a conexão não pode continuar
+                        keep_alive = False
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as e:  # falha do servidor, não da requisição
+                    status, payload = 500, json.dumps({"error": f"Erro interno: {e!r}"},
+                                                      ensure_ascii=False).encode()
+                self.requests += 1
+
+                writer.write(b"HTTP/1.1 %d %s\r\nContent-Type: application/json; charset=utf-8\r\n"
+                             b"Content-Length: %d\r\nConnection: %s\r\n\r\n%s" % (
+                                 status, REASONS.get(status, "").encode(), len(payload),
+                                 b"keep-alive" if keep_alive else b"close", payload))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def sweep(self):
+        """Expira sessões inativas periodicamente"""
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            self.expire_sessions()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        timed_worker.shared().start()  # regex/pipelines: o spawn acontece antes da 1ª correção
+        sweeper = asyncio.create_task(self.sweep())
+        address = server.sockets[0].getsockname()
+        print(f"Servidor LPIC-1 em http://{address[0]}:{address[1]}/ "
+              f"({len(self.bank.get_all_topics())} tópicos)", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+
+
+def parse_json(body: bytes) -> Dict:
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        raise HTTPError(400, "JSON inválido")
+    if not isinstance(data, dict):
+        raise HTTPError(400, "Esperado um objeto JSON")
+    return data
+
+
+def to_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"Número inválido: {value!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor HTTP/JSON de testes LPIC-1")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    quiz_server = QuizServer()
+    try:
+        asyncio.run(quiz_server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        quiz_server.bank.pack.close()
+        timed_worker.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Motor de sessão de teste LPIC-1, independente do Tkinter
+
+Guarda o estado de uma sessão (questões, respostas, resultados, pontuação) e
+faz a correção. A interface gráfica apenas lê e alimenta este objeto, o que
+permite rodar sessões sem display (testes de carga, correção em lote, outras
+interfaces).
+"""
+
+from typing import Dict, List, Optional
+
+from command_match import compile_answers
+from fuzzy_match import compile_fuzzy
+from pipeline import grade as grade_pipeline
+from question import MULTIPLE, PIPELINE, REGEX, TEXT, Question
+from regex_match import grade as grade_regex
+
+
+def grade_answer(question: Question, user_answer: str, typos: int = 0) -> bool:
+    """Verifica se a resposta do usuário está correta
+
+    typos > 0 aceita respostas de texto com até esse número de erros de digitação."""
+    if question.kind == MULTIPLE:
+        return user_answer.isdecimal() and int(user_answer) == question.correct
+    if question.kind == TEXT:
+        if compile_answers(question.correct).matches(user_answer):
+            return True
+        return typos > 0 and compile_fuzzy(question.correct).matches(user_answer, typos)
+    if question.kind == PIPELINE:
+        return grade_pipeline(user_answer.strip(), question.correct, question.options)
+    if question.kind == REGEX:
+        return grade_regex(user_answer.strip(), question.options, question.correct)
+    return False
+
+
+def performance_rating(percentage: float):
+    """Retorna (desempenho, mensagem) para uma porcentagem de acerto"""
+    if percentage >= 90:
+        return "Excelente!", "Você domina completamente este tópico."
+    if percentage >= 70:
+        return "Bom!", "Você tem um bom conhecimento, mas pode melhorar em alguns pontos."
+    if percentage >= 50:
+        return "Regular", "Recomenda-se estudar mais o material antes do exame."
+    return "Precisa melhorar", "É necessário revisar completamente este tópico."
+
+
+class SessionStats:
+    """Contadores da sessão, atualizados em O(1) a cada resposta"""
+
+    __slots__ = ("total", "answered", "correct", "topics", "options")
+
+    def __init__(self, total: int = 0):
+        self.total = total
+        self.answered = 0
+        self.correct = 0
+        self.topics: Dict[str, List[int]] = {}  # tópico -> [respondidas, corretas]
+        self.options: Dict[int, int] = {}  # opção escolhida -> vezes
+
+    def record(self, topic: str, option: Optional[int], is_correct: bool):
+        """Contabiliza uma resposta"""
+        self.answered += 1
+        tally = self.topics.get(topic)
+        if tally is None:
+            tally = self.topics[topic] = [0, 0]
+        tally[0] += 1
+        if is_correct:
+            self.correct += 1
+            tally[1] += 1
+        if option is not None:
+            self.options[option] = self.options.get(option, 0) + 1
+
+    @property
+    def wrong(self) -> int:
+        return self.answered - self.correct
+
+    @property
+    def remaining(self) -> int:
+        return self.total - self.answered
+
+    @property
+    def percentage(self) -> float:
+        """Acertos sobre o total de questões da sessão"""
+        return (self.correct / self.total * 100) if self.total > 0 else 0
+
+    @property
+    def accuracy(self) -> float:
+        """Acertos sobre as questões já respondidas"""
+        return (self.correct / self.answered * 100) if self.answered > 0 else 0
+
+    def topic_percentage(self, topic: str) -> float:
+        answered, correct = self.topics.get(topic, (0, 0))
+        return (correct / answered * 100) if answered > 0 else 0
+
+
+class QuizSession:
+    """Sessão de teste: navegação, respostas e correção"""
+
+    def __init__(self, questions: Optional[List[Question]] = None, topic: str = ""):
+        self.start(questions or [], topic)
+
+    def start(self, questions: List[Question], topic: str = ""):
+        """Inicia (ou reinicia) a sessão com as questões informadas"""
+        self.topic = topic
+        self.questions = questions
+        self.current_index = 0
+        self.stats = SessionStats(len(questions))
+        self.user_answers: Dict[int, str] = {}
+        self.question_results: Dict[int, bool] = {}
+        self.finished = False
+
+    def extend(self, question: Question):
+        """Acrescenta uma questão ao fim da sessão (teste adaptativo)"""
+        self.questions.append(question)
+        self.stats.total += 1
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.questions)
+
+    @property
+    def current_question(self) -> Optional[Question]:
+        if self.current_index < len(self.questions):
+            return self.questions[self.current_index]
+        return None
+
+    @property
+    def score(self) -> int:
+        return self.stats.correct
+
+    @property
+    def percentage(self) -> float:
+        return self.stats.percentage
+
+    def is_answered(self, index: Optional[int] = None) -> bool:
+        """Indica se a questão (padrão: atual) já foi respondida"""
+        if index is None:
+            index = self.current_index
+        return index in self.user_answers
+
+    def answer(self, user_answer: str, typos: int = 0, is_correct: Optional[bool] = None) -> bool:
+        """Registra e corrige a resposta da questão atual (typos: erros de digitação tolerados)
+
+        is_correct: correção já feita fora da sessão (pipelines e regex são
+        corrigidos numa thread pela interface); só é registrada."""
+        question = self.current_question
+        if question is None:
+            raise IndexError("Nenhuma questão ativa")
+        user_answer = user_answer.strip()
+        if not user_answer:
+            raise ValueError("Resposta vazia")
+        if self.current_index in self.user_answers:
+            raise ValueError("Questão já respondida")
+
+        if is_correct is None:
+            is_correct = grade_answer(question, user_answer, typos)
+        self.user_answers[self.current_index] = user_answer
+        self.question_results[self.current_index] = is_correct
+        option = int(user_answer) if question.kind == MULTIPLE and user_answer.isdecimal() else None
+        self.stats.record(question.topic or self.topic, option, is_correct)
+        return is_correct
+
+    def has_prev(self) -> bool:
+        return self.current_index > 0
+
+    def has_next(self) -> bool:
+        return self.current_index < len(self.questions) - 1
+
+    def prev(self) -> bool:
+        """Vai para a questão anterior; retorna False se já está na primeira"""
+        if self.has_prev():
+            self.current_index -= 1
+            return True
+        return False
+
+    def next(self) -> bool:
+        """Vai para a próxima questão; retorna False se já está na última"""
+        if self.has_next():
+            self.current_index += 1
+            return True
+        return False
+
+    def go_to(self, index: int):
+        """Vai diretamente para a questão de índice informado"""
+        if not 0 <= index < len(self.questions):
+            raise IndexError(index)
+        self.current_index = index
+
+    def finish(self) -> Dict:
+        """Finaliza a sessão e retorna o resumo dos resultados"""
+        self.finished = True
+        stats = self.stats
+        percentage = stats.percentage
+        performance, message = performance_rating(percentage)
+        return {
+            "topic": self.topic,
+            "total": stats.total,
+            "answered": stats.answered,
+            "correct": stats.correct,
+            "percentage": percentage,
+            "performance": performance,
+            "message": message,
+        }
@@ -0,0 +1,186 @@
+"""
+Exercícios de expressões regulares (grep/sed) com processo isolado
+
+Numa questão do tipo "regex" o aluno escreve um padrão que deve casar com
+todas as linhas de "match" e com nenhuma de "reject". A resposta pode ser o
+padrão puro (lido como ERE, igual ao grep -E) ou um comando:
+
+    grep -i '^root'        grep -E 'a|b'        sed -n '/^#/p'
+
+A avaliação acontece no processo de trabalho (timed_worker), porque o re do
+Python faz backtracking: um padrão como (a+)+$ leva tempo exponencial e
+congelaria o mainloop do Tk. Se o processo não responder a tempo ele é
+encerrado (e recriado na próxima avaliação) e a resposta conta como errada,
+sem ir para o cache: a mesma resposta é reavaliada na próxima tentativa.
+Dentro do processo os padrões compilados ficam num cache LRU e as linhas de
+teste são avaliadas de uma vez, com map(regex.search, linhas) e
+itertools.compress (o laço roda em C, sem bytecode Python por linha).
+"""
+
+import re
+from functools import lru_cache
+from itertools import compress
+from typing import FrozenSet, List, Optional, Tuple
+
+from pipeline import PipelineError, parse_options, regex_source
+from timed_worker import WorkerError, WorkerTimeout, shared
+from vfs import VFSError, split_words
+
+# (padrão, estendida, fixa, sem caixa, palavra, linha inteira, invertida)
+Spec = Tuple[str, bool, bool, bool, bool, bool, bool]
+# (linhas selecionadas, "") ou (None, mensagem de erro)
+Outcome = Tuple[Optional[FrozenSet[int]], str]
+
+SED_SCRIPT = re.compile(r"^/((?:[^/\\]|\\.)*)/(!?)([pd])$")
+
+
+class RegexError(Exception):
+    """Resposta que não é um padrão válido (comando, opção ou expressão)"""
+
+
+# --- Resposta do aluno ---------------------------------------------------------
+
+def _grep_spec(words: List[str]) -> Spec:
+    options, operands = parse_options(words[1:], "iEFvcnwx", "e")
+    pattern = options.get("e")
+    if pattern is None:
+        if not operands:
+            raise RegexError("informe o padrão: grep 'PADRÃO'")
+        pattern, operands = operands[0], operands[1:]
+    if operands:
+        raise RegexError("não informe arquivos: as linhas do exercício são a entrada")
+    return (pattern, words[0] == "egrep" or "E" in options, words[0] == "fgrep" or "F" in options,
+            "i" in options, "w" in options, "x" in options, "v" in options)
+
+
+def _sed_spec(words: List[str]) -> Spec:
+    options, operands = parse_options(words[1:], "nEr", "e")
+    script = options.get("e")
+    if script is None:
+        if not operands:
+            raise RegexError("informe o script: sed -n '/PADRÃO/p'")
+        script, operands = operands[0], operands[1:]
+    if operands:
+        raise RegexError("não informe arquivos: as linhas do exercício são a entrada")
+    match = SED_SCRIPT.match(script)
+    if match is None:
+        raise RegexError("use a forma /PADRÃO/p, /PADRÃO/d ou /PADRÃO/!d")
+    pattern, negate, command = match.groups()
+    if command == "p" and "n" not in options:
+        raise RegexError("sem -n o sed imprime todas as linhas: use sed -n '/PADRÃO/p'")
+    if command == "d" and "n" in options:
+        raise RegexError("com -n e d o sed não imprime nada: use sed '/PADRÃO/d'")
+    invert = (command == "d") != bool(negate)
+    return (pattern.replace("\\/", "/"), "E" in options or "r" in options, False,
+            False, False, False, invert)
+
+
+@lru_cache(maxsize=1024)
+def parse_answer(answer: str) -> Spec:
+    """Padrão e opções de uma resposta (padrão puro, grep ou sed)"""
+    text = answer.strip()
+    command = text.split(None, 1)[0] if text else ""
+    if command not in ("grep", "egrep", "fgrep", "sed"):
+        if len(text) > 1 and text[0] == text[-1] and text[0] in "'\"":
+            text = text[1:-1]  # 'padrão' entre aspas, como na linha de comando
+        return (text, True, False, False, False, False, False)
+    try:
+        words = split_words(text)
+    except VFSError as error:
+        raise RegexError(str(error))
+    if any(not quoted and word[0] in "|;&<>" for word, quoted in words):
+        raise RegexError("use um único comando, sem pipes nem redirecionamentos")
+    names = [word for word, _ in words]
+    try:
+        return _sed_spec(names) if command == "sed" else _grep_spec(names)
+    except PipelineError as error:
+        raise RegexError(str(error))
+
+
+# --- Avaliação (no processo de trabalho) --------------------------------------
+
+@lru_cache(maxsize=512)
+def compile_spec(spec: Spec):
+    """Padrão compilado (cache LRU: a mesma resposta chega muitas vezes)"""
+    pattern, extended, fixed, ignore_case, word, whole_line, _ = spec
+    flags = re.IGNORECASE if ignore_case else 0
+    try:
+        return re.compile(regex_source(pattern, extended, fixed, word, whole_line), flags)
+    except (re.error, PipelineError) as error:
+        raise RegexError(f"expressão regular inválida: {error}")
+
+
+def selected_lines(spec: Spec, lines: Tuple[str, ...]) -> FrozenSet[int]:
+    """Índices das linhas que o grep/sed imprimiria"""
+    regex = compile_spec(spec)
+    # map/compress percorrem as linhas em C, sem um laço Python por linha
+    matched = frozenset(compress(range(len(lines)), map(regex.search, lines)))
+    if spec[6]:
+        return frozenset(range(len(lines))) - matched
+    return matched
+
+
+# --- Correção ---------------------------------------------------------------------
+
+def evaluate_spec(spec: Spec, lines: Tuple[str, ...]) -> Outcome:
+    """selected_lines no processo de trabalho; padrão inválido vira (None, mensagem)"""
+    try:
+        return selected_lines(spec, lines), ""
+    except RegexError as error:
+        return None, str(error)
+
+
+@lru_cache(maxsize=4096)
+def _evaluate(answer: str, lines: Tuple[str, ...]) -> Outcome:
+    # Só resultados determinísticos chegam ao cache: WorkerError (tempo esgotado,
+    # processo que não iniciou) é levantado e o lru_cache não guarda exceções
+    try:
+        spec = parse_answer(answer)
+    except RegexError as error:
+        return None, str(error)
+    return shared().call(evaluate_spec, spec, lines)
+
+
+def evaluate(answer: str, lines: Tuple[str, ...]) -> Outcome:
+    """(linhas selecionadas, "") ou (None, mensagem de erro)"""
+    try:
+        return _evaluate(answer, lines)
+    except WorkerTimeout as error:
+        return None, f"{error} (backtracking catastrófico? evite repetições aninhadas como (a+)+)"
+    except WorkerError as error:
+        return None, str(error)
+
+
+def grade(answer: str, lines: Tuple[str, ...], positives: int,
+          outcome: Optional[Outcome] = None) -> bool:
+    """Correta se selecionar exatamente as `positives` primeiras linhas
+
+    outcome: resultado de evaluate() já obtido (não vai de novo ao processo)."""
+    selected, _ = evaluate(answer, lines) if outcome is None else outcome
+    return selected == frozenset(range(positives))
+
+
+def feedback(answer: str, lines: Tuple[str, ...], positives: int,
+             outcome: Optional[Outcome] = None) -> List[str]:
+    """Linhas que deveriam casar e não casaram, e as que casaram sem dever
+
+    Passe o outcome da correção: um padrão que estourou o tempo não é
+    reavaliado (nem o processo de trabalho recriado) só para o feedback."""
+    selected, error = evaluate(answer, lines) if outcome is None else outcome
+    if selected is None:
+        return [f"Erro: {error}"]
+    report = []
+    missed = [lines[i] for i in range(positives) if i not in selected]
+    extra = [lines[i] for i in sorted(selected) if i >= positives]
+    if missed:
+        report.append("Deveriam casar e não casaram: " + ", ".join(repr(line) for line in missed))
+    if extra:
+        report.append("Casaram sem dever: " + ", ".join(repr(line) for line in extra))
+    return report
+
+
+def describe(lines: Tuple[str, ...], positives: int) -> str:
+    """Linhas de teste para mostrar abaixo do enunciado"""
+    match = "\n".join(f"    {line}" for line in lines[:positives])
+    reject = "\n".join(f"    {line}" for line in lines[positives:])
+    return f"\n\nDeve casar com:\n{match}\n\nNão deve casar com:\n{reject}"
@@ -0,0 +1,109 @@
+"""
+Revisão espaçada (SM-2) das questões LPIC-1
+
+Cada questão já respondida vira um cartão com facilidade, intervalo e data de
+revisão. Os cartões ficam numa fila de prioridade (heap) ordenada pela data de
+revisão: buscar os próximos k cartões custa O(k log n) e atualizar um cartão
+após uma resposta custa O(log n). Entradas antigas no heap são descartadas de
+forma preguiçosa e o heap é compactado quando elas passam a dominar.
+"""
+
+import heapq
+import time
+from typing import Iterable, List, Optional
+
+DAY = 24 * 60 * 60
+MIN_EASE = 1.3
+DEFAULT_EASE = 2.5
+
+# Qualidade SM-2 atribuída a respostas certas e erradas
+QUALITY_CORRECT = 4
+QUALITY_WRONG = 1
+
+
+class Card:
+    """Estado de revisão de uma questão para um usuário"""
+
+    __slots__ = ("question_id", "topic", "ease", "interval", "reps", "due")
+
+    def __init__(self, question_id: str, topic: str, ease: float = DEFAULT_EASE,
+                 interval: float = 0.0, reps: int = 0, due: float = 0.0):
+        self.question_id = question_id
+        self.topic = topic
+        self.ease = ease
+        self.interval = interval  # dias
+        self.reps = reps
+        self.due = due  # timestamp
+
+    def review(self, quality: int, now: float):
+        """Aplica uma revisão SM-2 com nota `quality` (0 a 5)"""
+        if quality >= 3:
+            if self.reps == 0:
+                self.interval = 1
+            elif self.reps == 1:
+                self.interval = 6
+            else:
+                self.interval = round(self.interval * self.ease)
+            self.reps += 1
+        else:
+            self.reps = 0
+            self.interval = 1
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.due = now + self.interval * DAY
+
+
+class ReviewScheduler:
+    """Fila de cartões de um usuário ordenada pela data de revisão"""
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self.cards = {card.question_id: card for card in cards}
+        self._heap = [(card.due, card.question_id) for card in self.cards.values()]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def __contains__(self, question_id: str) -> bool:
+        return question_id in self.cards
+
+    def _is_current(self, entry) -> bool:
+        card = self.cards.get(entry[1])
+        return card is not None and card.due == entry[0]
+
+    def next_due(self, num: int, now: Optional[float] = None) -> List[Card]:
+        """Até `num` cartões vencidos até `now`, do mais atrasado ao mais recente"""
+        if now is None:
+            now = time.time()
+        heap = self._heap
+        found = []
+        while heap and len(found) < num and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if self._is_current(entry):
+                found.append(entry)
+        # Os cartões continuam na fila até serem revisados
+        for entry in found:
+            heapq.heappush(heap, entry)
+        return [self.cards[question_id] for _, question_id in found]
+
+    def due_count(self, now: Optional[float] = None) -> int:
+        """Quantidade de cartões vencidos (varre os cartões: O(n))"""
+        if now is None:
+            now = time.time()
+        return sum(1 for card in self.cards.values() if card.due <= now)
+
+    def review(self, question_id: str, topic: str, correct: bool,
+               now: Optional[float] = None) -> Card:
+        """Atualiza o cartão após uma resposta e o reposiciona na fila"""
+        if now is None:
+            now = time.time()
+        card = self.cards.get(question_id)
+        if card is None:
+            card = self.cards[question_id] = Card(question_id, topic)
+        card.review(QUALITY_CORRECT if correct else QUALITY_WRONG, now)
+        heapq.heappush(self._heap, (card.due, question_id))
+
+        # Compacta quando as entradas antigas passam do dobro das válidas
+        if len(self._heap) > 2 * len(self.cards) + 64:
+            self._heap = [(card.due, card.question_id) for card in self.cards.values()]
+            heapq.heapify(self._heap)
+        return card
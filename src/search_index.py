@@ -0,0 +1,279 @@
+"""
+Busca textual nas questões LPIC-1
+
+Índice invertido em memória sobre enunciado, opções e explicação de todas as
+questões do banco. A normalização remove acentos e caixa ("partição" casa com
+"particao"), e cada termo guarda sua lista de documentos já ordenada pelo peso
+BM25, de modo que uma busca de um termo só lê os primeiros resultados.
+
+Termos que não existem no vocabulário são tratados como busca por trecho:
+um índice de trigramas sobre o vocabulário encontra os termos que contêm o
+trecho ("interrupt" acha "interrupts"), e as listas desses termos são unidas.
+Buscas com vários termos usam o algoritmo de limiar de Fagin sobre as listas
+ordenadas, parando assim que o top-k está garantido.
+
+O índice pode ser salvo em disco junto com a assinatura do pacote de
+questões, evitando reconstruí-lo a cada inicialização.
+"""
+
+import heapq
+import math
+import os
+import pickle
+import re
+import unicodedata
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from question import Question
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".lpic1", "search.idx")
+
+# Peso de cada campo na contagem de termos
+FIELD_WEIGHTS = (("text", 2.0), ("options", 1.0), ("explanation", 1.0))
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+STOPWORDS = {
+    "a", "o", "as", "os", "e", "de", "da", "do", "das", "dos", "em", "no", "na",
+    "nos", "nas", "um", "uma", "para", "por", "com", "que", "qual", "quais",
+    "se", "ao", "ou", "como", "é", "the", "of",
+}
+
+TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+# Termos exatos com ao menos este tamanho também casam com suas variações
+MIN_PREFIX_LENGTH = 4
+MAX_SUFFIX_LENGTH = 3
+
+
+def normalize(text: str) -> str:
+    """Remove acentos e converte para minúsculas"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Termos normalizados do texto, sem palavras vazias"""
+    return [token for token in TOKEN_RE.findall(normalize(text)) if token not in STOPWORDS]
+
+
+def is_inflection(suffix: str) -> bool:
+    """Sufixo curto só de letras (plural, gênero: "s", "es", "is"...)"""
+    return len(suffix) <= MAX_SUFFIX_LENGTH and suffix.isalpha()
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f" {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def question_fields(question: Question) -> Iterable[Tuple[str, float]]:
+    """Textos indexáveis de uma questão com o peso do campo"""
+    for field, weight in FIELD_WEIGHTS:
+        value = getattr(question, field)
+        if isinstance(value, tuple):
+            value = " ".join(str(item) for item in value)
+        if value:
+            yield str(value), weight
+
+
+class SearchIndex:
+    """Índice invertido com ranking BM25 e busca por trecho via trigramas"""
+
+    def __init__(self):
+        self.doc_refs: List[Tuple[str, int]] = []  # documento -> (tópico, posição)
+        self.postings: Dict[str, Tuple[array, array]] = {}  # termo -> (docs, pesos)
+        self.signature = ""
+        self._trigrams: Optional[Dict[str, Set[str]]] = None
+        self._lookup: Dict[str, Dict[int, float]] = {}
+
+    @classmethod
+    def build(cls, bank, signature: str = "") -> "SearchIndex":
+        """Indexa todas as questões de todos os tópicos do banco"""
+        index = cls()
+        index.signature = signature
+        term_freqs: Dict[str, Dict[int, float]] = {}
+        lengths = []
+
+        for topic in bank.get_all_topics():
+            for offset in range(bank.get_topic_count(topic)):
+                doc = len(index.doc_refs)
+                index.doc_refs.append((topic, offset))
+                length = 0.0
+                for text, weight in question_fields(bank.get_question(topic, offset)):
+                    for token in tokenize(text):
+                        postings = term_freqs.setdefault(token, {})
+                        postings[doc] = postings.get(doc, 0.0) + weight
+                        length += weight
+                lengths.append(length)
+
+        # Pesos BM25 pré-calculados; listas ordenadas do maior para o menor peso
+        doc_count = len(lengths)
+        avg_length = (sum(lengths) / doc_count) if doc_count else 1.0
+        for term, postings in term_freqs.items():
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            scored = sorted(
+                (
+                    idf * tf * (BM25_K1 + 1)
+                    / (tf + BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc] / avg_length)),
+                    doc,
+                )
+                for doc, tf in postings.items()
+            )
+            scored.reverse()
+            index.postings[term] = (
+                array("I", [doc for _, doc in scored]),
+                array("f", [score for score, _ in scored]),
+            )
+        return index
+
+    def __len__(self) -> int:
+        return len(self.doc_refs)
+
+    def save(self, path: str):
+        """Grava o índice em disco"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        payload = (INDEX_VERSION, self.signature, self.doc_refs, self.postings)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, signature: str = "") -> Optional["SearchIndex"]:
+        """Carrega um índice salvo; None se ausente, inválido ou de outro pacote"""
+        try:
+            with open(path, "rb") as f:
+                version, saved_signature, doc_refs, postings = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+        if version != INDEX_VERSION or saved_signature != signature:
+            return None
+        index = cls()
+        index.signature = saved_signature
+        index.doc_refs = doc_refs
+        index.postings = postings
+        return index
+
+    @classmethod
+    def for_bank(cls, bank, path: str = DEFAULT_INDEX_PATH) -> "SearchIndex":
+        """Carrega o índice salvo do banco ou o reconstrói (e salva)"""
+        signature = bank.pack.signature()
+        index = cls.load(path, signature)
+        if index is None:
+            index = cls.build(bank, signature)
+            try:
+                index.save(path)
+            except OSError:
+                pass
+        return index
+
+    def _trigram_index(self) -> Dict[str, Set[str]]:
+        """Trigramas do vocabulário, montados no primeiro uso"""
+        if self._trigrams is None:
+            grams: Dict[str, Set[str]] = {}
+            for term in self.postings:
+                for gram in trigrams(term):
+                    grams.setdefault(gram, set()).add(term)
+            self._trigrams = grams
+        return self._trigrams
+
+    def expand(self, token: str) -> List[str]:
+        """Termos do vocabulário que casam com o token: o próprio termo e suas
+        variações ("modulo" -> "modulos"), ou qualquer termo que contenha o trecho"""
+        exact = token in self.postings
+        if len(token) < (MIN_PREFIX_LENGTH if exact else 3):
+            return [token] if exact else []
+        grams = self._trigram_index()
+        # Trigramas internos (sem as bordas), pois o trecho pode estar no meio do termo
+        inner = [token[i:i + 3] for i in range(len(token) - 2)]
+        sets = sorted((grams.get(gram, set()) for gram in inner), key=len)
+        if not sets or not sets[0]:
+            return []
+        candidates = set(sets[0]).intersection(*sets[1:])
+        if exact:
+            return [token] + [
+                term for term in candidates
+                if term != token and term.startswith(token) and is_inflection(term[len(token):])
+            ]
+        return [term for term in candidates if token in term]
+
+    def _weights(self, term: str) -> Dict[int, float]:
+        """Mapa documento -> peso do termo (cacheado)"""
+        lookup = self._lookup.get(term)
+        if lookup is None:
+            docs, scores = self.postings[term]
+            lookup = self._lookup[term] = dict(zip(docs, scores))
+        return lookup
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, int, float]]:
+        """Busca (todos os termos devem casar); retorna [(tópico, posição, score)]"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        groups = []
+        for token in dict.fromkeys(tokens):
+            terms = self.expand(token)
+            if not terms:
+                return []
+            groups.append(terms)
+
+        # Caso comum: um único termo exato -> lista já ordenada por peso
+        if len(groups) == 1 and len(groups[0]) == 1:
+            docs, scores = self.postings[groups[0][0]]
+            return [
+                (*self.doc_refs[doc], score)
+                for doc, score in zip(docs[:limit], scores[:limit])
+            ]
+
+        # Cada grupo vira (docs, pesos) em ordem decrescente + mapa doc -> peso
+        lists = []
+        for terms in groups:
+            if len(terms) == 1:
+                docs, scores = self.postings[terms[0]]
+                lists.append((docs, scores, self._weights(terms[0])))
+            else:
+                merged: Dict[int, float] = {}
+                for term in terms:
+                    for doc, score in self._weights(term).items():
+                        if score > merged.get(doc, 0.0):
+                            merged[doc] = score
+                ordered = sorted(merged.items(), key=lambda item: item[1], reverse=True)
+                lists.append(([doc for doc, _ in ordered], [score for _, score in ordered], merged))
+        return self._top_k(lists, limit)
+
+    def _top_k(self, lists, limit: int) -> List[Tuple[str, int, float]]:
+        """Algoritmo de limiar (Fagin): percorre as listas ordenadas em paralelo
+        e para quando nenhum documento ainda não visto pode entrar no top-k"""
+        heap: List[Tuple[float, int]] = []
+        seen = set()
+        shortest = min(len(docs) for docs, _, _ in lists)
+
+        for depth in range(shortest):
+            threshold = 0.0
+            for docs, scores, _ in lists:
+                threshold += scores[depth]
+                doc = docs[depth]
+                if doc in seen:
+                    continue
+                seen.add(doc)
+                total = 0.0
+                for _, _, weights in lists:
+                    score = weights.get(doc)
+                    if score is None:
+                        break
+                    total += score
+                else:
+                    if len(heap) < limit:
+                        heapq.heappush(heap, (total, doc))
+                    elif total > heap[0][0]:
+                        heapq.heapreplace(heap, (total, doc))
+            if len(heap) >= limit and heap[0][0] >= threshold:
+                break
+
+        heap.sort(reverse=True)
+        return [(*self.doc_refs[doc], score) for score, doc in heap]
@@ -0,0 +1,125 @@
+"""
+Processo de trabalho com limite de tempo para código do aluno
+
+Padrões de expressão regular (regex_match) e pipelines (pipeline) escritos
+pelo aluno podem levar tempo arbitrário: backtracking catastrófico, sort
+encadeado sobre o log inteiro. Executá-los no mainloop do Tk ou no laço
+asyncio do quiz_server congelaria a interface ou todas as sessões da turma.
+
+TimedWorker mantém um processo filho (método spawn, igual no Windows) que
+executa funções de módulo (call(função, *args)). Se a resposta não chegar em
+`timeout` segundos, o processo é encerrado e recriado na próxima chamada, e
+call() levanta WorkerTimeout. Exceções da própria função voltam ao chamador.
+Um lock serializa chamadas vindas de várias threads (executor do servidor).
+"""
+
+import multiprocessing
+import threading
+from typing import Callable, Optional
+
+TIMEOUT = 1.0
+STARTUP_TIMEOUT = 10.0
+
+
+class WorkerError(Exception):
+    """Falha do processo de trabalho (não iniciou ou terminou), não da função"""
+
+
+class WorkerTimeout(WorkerError):
+    """A função não terminou dentro do limite de tempo"""
+
+
+def _serve(connection):
+    """Laço do processo filho: (função, args) -> ("ok", resultado) ou ("erro", exceção)"""
+    connection.send(("pronto", None))
+    while True:
+        try:
+            function, args = connection.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            result = ("ok", function(*args))
+        except Exception as error:
+            result = ("erro", error)
+        try:
+            connection.send(result)
+        except Exception as error:  # resultado ou exceção que não se serializa
+            connection.send(("erro", WorkerError(f"resultado inválido: {error}")))
+
+
+class TimedWorker:
+    """Processo filho reaproveitado entre chamadas, encerrado se passar do tempo"""
+
+    def __init__(self, timeout: float = TIMEOUT):
+        self.timeout = timeout
+        self.process = None
+        self.connection = None
+        self.ready = False
+        self.lock = threading.Lock()
+
+    def start(self):
+        """Inicia o processo sem esperar por ele (chamar cedo esconde o custo do spawn)"""
+        if self.process is not None:
+            if self.process.is_alive():
+                return
+            self.stop()
+        context = multiprocessing.get_context("spawn")
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.ready = False
+
+    def stop(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.join()
+            self.connection.close()
+        self.process = self.connection = None
+        self.ready = False
+
+    def _receive(self, timeout: float):
+        if not self.connection.poll(timeout):
+            return None
+        try:
+            return self.connection.recv()
+        except (EOFError, OSError):
+            self.stop()
+            raise WorkerError("o processo de avaliação terminou inesperadamente")
+
+    def call(self, function: Callable, *args, timeout: Optional[float] = None):
+        """function(*args) no processo filho, em no máximo `timeout` segundos"""
+        limit = self.timeout if timeout is None else timeout
+        with self.lock:
+            self.start()
+            if not self.ready:
+                if self._receive(STARTUP_TIMEOUT) is None:
+                    self.stop()
+                    raise WorkerError("o processo de avaliação não iniciou")
+                self.ready = True
+            self.connection.send((function, args))
+            reply = self._receive(limit)
+            if reply is None:
+                self.stop()
+                raise WorkerTimeout(f"a avaliação passou de {limit:g} s")
+        status, value = reply
+        if status == "erro":
+            raise value
+        return value
+
+
+_shared: Optional[TimedWorker] = None
+
+
+def shared() -> TimedWorker:
+    """Processo de trabalho único do aplicativo/servidor"""
+    global _shared
+    if _shared is None:
+        _shared = TimedWorker()
+    return _shared
+
+
+def shutdown():
+    """Encerra o processo de trabalho (ao fechar o aplicativo)"""
+    if _shared is not None:
+        _shared.stop()
@@ -0,0 +1,955 @@
+"""
+Sistema de arquivos em memória para os exercícios práticos do tópico 103
+
+FileSystem
+    Tabela de inodes (arquivo, diretório, link simbólico) com permissões, dono,
+    grupo e contagem de links; diretórios mapeiam nome -> número do inode.
+    A tabela é uma pilha de camadas: as de baixo estão congeladas e as
+    escritas vão para a camada do topo, copiando antes o inode alterado
+    (copy-on-write por inode). snapshot() congela o topo e restore() descarta
+    o que veio depois, ambos em O(1) independente do tamanho da árvore;
+    fork() cria outro sistema de arquivos que compartilha as camadas.
+    Caminhos absolutos já resolvidos ficam num cache, invalidado quando a
+    árvore de nomes muda.
+
+diff
+    Compara duas árvores (estado esperado x estado do aluno). Quando ambas
+    vêm do mesmo snapshot, só os inodes das camadas posteriores (e os
+    diretórios acima deles) são visitados: a correção custa O(alterações), e
+    não O(tamanho da árvore).
+
+Shell
+    Interpretador mínimo dos comandos do tópico 103 (cd, pwd, ls, mkdir, rmdir,
+    touch, cat, echo, cp, mv, rm, ln, chmod, chown, find), com ~ e ~usuário,
+    globs (*, ?, [ ]), redirecionamento (>, >>, <), | entre comandos e sequências com ; e &&.
+"""
+
+import fnmatch
+import posixpath
+from typing import Dict, Iterator, List, Optional, Tuple
+
+FILE = "-"
+DIR = "d"
+LINK = "l"
+
+ROOT = 1
+MAX_SYMLINKS = 40
+MAX_LAYERS = 16
+
+USERS = {"root": 0, "aluno": 1000, "professor": 1001}
+GROUPS = {"root": 0, "aluno": 1000, "professor": 1001, "users": 100}
+USER_NAMES = {uid: name for name, uid in USERS.items()}
+GROUP_NAMES = {gid: name for name, gid in GROUPS.items()}
+# Grupos de cada uid (primário e suplementares), como em /etc/group
+MEMBERSHIP = {0: frozenset({0}), 1000: frozenset({1000, 100}), 1001: frozenset({1001, 100})}
+
+
+def home_of(user: str) -> str:
+    """Diretório pessoal (/root ou /home/usuário)"""
+    return "/root" if user == "root" else f"/home/{user}"
+
+READ, WRITE, EXECUTE = 4, 2, 1
+
+
+class VFSError(Exception):
+    """Erro de uma operação, com mensagem no estilo do coreutils"""
+
+
+class Inode:
+    """Arquivo, diretório ou link simbólico"""
+
+    __slots__ = ("kind", "mode", "uid", "gid", "nlink", "data", "parent", "name", "mtime")
+
+    def __init__(self, kind: str, mode: int, uid: int, gid: int, data,
+                 parent: int = ROOT, name: str = "", mtime: int = 0):
+        self.kind = kind
+        self.mode = mode
+        self.uid = uid
+        self.gid = gid
+        self.nlink = 2 if kind == DIR else 1
+        self.data = data  # texto (arquivo), nome -> inode (diretório) ou destino (link)
+        self.parent = parent  # diretório do último link criado (para reconstruir o caminho)
+        self.name = name
+        self.mtime = mtime
+
+    def copy(self) -> "Inode":
+        clone = Inode(self.kind, self.mode, self.uid, self.gid,
+                      dict(self.data) if self.kind == DIR else self.data,
+                      self.parent, self.name, self.mtime)
+        clone.nlink = self.nlink
+        return clone
+
+    @property
+    def size(self) -> int:
+        if self.kind == DIR:
+            return 4096
+        return len(self.data.encode("utf-8"))
+
+    def mode_string(self) -> str:
+        bits = "".join(
+            flag if self.mode & (1 << shift) else "-"
+            for shift, flag in zip(range(8, -1, -1), "rwxrwxrwx")
+        )
+        return self.kind + bits
+
+
+class Snapshot:
+    """Estado congelado de um FileSystem (camadas imutáveis)"""
+
+    __slots__ = ("layers", "next_ino", "clock")
+
+    def __init__(self, layers: Tuple[Dict, ...], next_ino: int, clock: int):
+        self.layers = layers
+        self.next_ino = next_ino
+        self.clock = clock
+
+
+class FileSystem:
+    """Árvore de inodes em camadas copy-on-write"""
+
+    def __init__(self, snapshot: Optional[Snapshot] = None):
+        if snapshot is not None:
+            self.layers: List[Dict[int, Optional[Inode]]] = list(snapshot.layers)
+            self.next_ino = snapshot.next_ino
+            self.clock = snapshot.clock
+            self.top: Dict[int, Optional[Inode]] = {}
+        else:
+            self.layers = []
+            self.next_ino = ROOT + 1
+            self.clock = 0
+            self.top = {ROOT: Inode(DIR, 0o755, 0, 0, {}, ROOT, "")}
+        self._paths: Dict[Tuple[int, str], int] = {}  # (uid, caminho absoluto) -> inode
+
+    # --- Camadas e snapshots -------------------------------------------------
+
+    def get(self, ino: int) -> Optional[Inode]:
+        inode = self.top.get(ino, _MISSING)
+        if inode is not _MISSING:
+            return inode
+        for layer in reversed(self.layers):
+            inode = layer.get(ino, _MISSING)
+            if inode is not _MISSING:
+                return inode
+        return None
+
+    def _mut(self, ino: int) -> Inode:
+        """Inode para escrita: copiado para o topo na primeira alteração"""
+        inode = self.top.get(ino)
+        if inode is None:
+            inode = self.get(ino).copy()
+            self.top[ino] = inode
+        return inode
+
+    def _new(self, inode: Inode) -> int:
+        ino = self.next_ino
+        self.next_ino += 1
+        self.top[ino] = inode
+        return ino
+
+    def snapshot(self) -> Snapshot:
+        """Congela o estado atual (O(1)); as próximas escritas vão para uma camada nova"""
+        if self.top:
+            self.layers.append(self.top)
+            self.top = {}
+            if len(self.layers) > MAX_LAYERS:
+                self.compact()
+        return Snapshot(tuple(self.layers), self.next_ino, self.clock)
+
+    def restore(self, snapshot: Snapshot):
+        """Volta ao estado do snapshot (O(1): descarta as camadas posteriores)"""
+        self.layers = list(snapshot.layers)
+        self.next_ino = snapshot.next_ino
+        self.clock = snapshot.clock
+        self.top = {}
+        self._paths.clear()
+
+    def fork(self) -> "FileSystem":
+        """Outro sistema de arquivos a partir do estado atual, compartilhando as camadas"""
+        return FileSystem(self.snapshot())
+
+    def compact(self):
+        """Funde as camadas congeladas numa só (O(n); snapshots antigos continuam válidos)"""
+        merged: Dict[int, Optional[Inode]] = {}
+        for layer in self.layers:
+            merged.update(layer)
+        self.layers = [{ino: inode for ino, inode in merged.items() if inode is not None}]
+
+    # --- Caminhos ------------------------------------------------------------
+
+    def lookup(self, path: str, cwd: int = ROOT, follow: bool = True, uid: int = 0) -> int:
+        """Número do inode do caminho (segue links simbólicos, inclusive o último se follow)"""
+        cached = path.startswith("/") and follow
+        if cached:
+            ino = self._paths.get((uid, path))
+            if ino is not None:
+                return ino
+        ino = self._walk(path, cwd, follow, uid, 0)
+        if cached:
+            self._paths[(uid, path)] = ino
+        return ino
+
+    def _walk(self, path: str, cwd: int, follow: bool, uid: int, depth: int) -> int:
+        ino = ROOT if path.startswith("/") else cwd
+        parts = [part for part in path.split("/") if part and part != "."]
+        for position, part in enumerate(parts):
+            directory = self.get(ino)
+            if directory.kind != DIR:
+                raise VFSError(f"{path}: Não é um diretório")
+            self._check(directory, uid, EXECUTE, path)
+            if part == "..":
+                ino = directory.parent
+                continue
+            child = directory.data.get(part)
+            if child is None:
+                raise VFSError(f"{path}: Arquivo ou diretório inexistente")
+            inode = self.get(child)
+            if inode.kind == LINK and (follow or position < len(parts) - 1):
+                if depth >= MAX_SYMLINKS:
+                    raise VFSError(f"{path}: Muitos níveis de links simbólicos")
+                child = self._walk(inode.data, ino, True, uid, depth + 1)
+            ino = child
+        return ino
+
+    def _parent(self, path: str, cwd: int, uid: int) -> Tuple[int, str]:
+        """(diretório, nome) da última parte do caminho"""
+        head, name = posixpath.split(path.rstrip("/") or "/")
+        if not name or name in (".", ".."):
+            raise VFSError(f"{path}: Nome inválido")
+        directory = self.lookup(head or ".", cwd, True, uid) if head else cwd
+        if self.get(directory).kind != DIR:
+            raise VFSError(f"{path}: Não é um diretório")
+        return directory, name
+
+    def path_of(self, ino: int) -> str:
+        """Caminho absoluto pelo último link do inode"""
+        parts = []
+        while ino != ROOT:
+            inode = self.get(ino)
+            parts.append(inode.name)
+            ino = inode.parent
+        return "/" + "/".join(reversed(parts))
+
+    def exists(self, path: str, cwd: int = ROOT) -> bool:
+        try:
+            self.lookup(path, cwd)
+            return True
+        except VFSError:
+            return False
+
+    def _check(self, inode: Inode, uid: int, bit: int, path: str):
+        if uid == 0:
+            return
+        if inode.uid == uid:
+            allowed = inode.mode >> 6
+        elif inode.gid in MEMBERSHIP.get(uid, ()):
+            allowed = inode.mode >> 3
+        else:
+            allowed = inode.mode
+        if not allowed & bit:
+            raise VFSError(f"{path}: Permissão negada")
+
+    # --- Operações -----------------------------------------------------------
+
+    def _link_entry(self, directory: int, name: str, ino: int, uid: int, path: str):
+        self._check(self.get(directory), uid, WRITE, path)
+        parent = self._mut(directory)
+        parent.data[name] = ino
+        self.clock += 1
+        parent.mtime = self.clock
+        inode = self._mut(ino)
+        inode.parent = directory
+        inode.name = name
+        if inode.kind == DIR:
+            parent.nlink += 1
+        self._paths.clear()
+
+    def _create(self, path: str, inode: Inode, cwd: int, uid: int) -> int:
+        directory, name = self._parent(path, cwd, uid)
+        if name in self.get(directory).data:
+            raise VFSError(f"{path}: Arquivo existe")
+        inode.mtime = self.clock
+        ino = self._new(inode)
+        self._link_entry(directory, name, ino, uid, path)
+        return ino
+
+    def mkdir(self, path: str, mode: int = 0o755, parents: bool = False,
+              cwd: int = ROOT, uid: int = 0) -> int:
+        if parents:
+            if self.exists(path, cwd):
+                ino = self.lookup(path, cwd)
+                if self.get(ino).kind != DIR:
+                    raise VFSError(f"{path}: Arquivo existe")
+                return ino
+            head = posixpath.dirname(path.rstrip("/"))
+            if head and head != "/" and not self.exists(head, cwd):
+                self.mkdir(head, mode, True, cwd, uid)
+        return self._create(path, Inode(DIR, mode, uid, uid, {}), cwd, uid)
+
+    def write_file(self, path: str, text: str, append: bool = False, mode: int = 0o644,
+                   cwd: int = ROOT, uid: int = 0) -> int:
+        """Cria ou sobrescreve (ou acrescenta a) um arquivo"""
+        try:
+            ino = self.lookup(path, cwd, True, uid)
+        except VFSError:
+            return self._create(path, Inode(FILE, mode, uid, uid, text), cwd, uid)
+        inode = self.get(ino)
+        if inode.kind == DIR:
+            raise VFSError(f"{path}: É um diretório")
+        self._check(inode, uid, WRITE, path)
+        inode = self._mut(ino)
+        inode.data = inode.data + text if append else text
+        self.clock += 1
+        inode.mtime = self.clock
+        return ino
+
+    def touch(self, path: str, cwd: int = ROOT, uid: int = 0) -> int:
+        try:
+            ino = self.lookup(path, cwd, True, uid)
+        except VFSError:
+            return self._create(path, Inode(FILE, 0o644, uid, uid, ""), cwd, uid)
+        self.clock += 1
+        self._mut(ino).mtime = self.clock
+        return ino
+
+    def read_file(self, path: str, cwd: int = ROOT, uid: int = 0) -> str:
+        inode = self.get(self.lookup(path, cwd, True, uid))
+        if inode.kind == DIR:
+            raise VFSError(f"{path}: É um diretório")
+        self._check(inode, uid, READ, path)
+        return inode.data
+
+    def stat(self, path: str, cwd: int = ROOT, follow: bool = True, uid: int = 0) -> Inode:
+        return self.get(self.lookup(path, cwd, follow, uid))
+
+    def listdir(self, path: str = "/", cwd: int = ROOT, uid: int = 0) -> List[str]:
+        inode = self.get(self.lookup(path, cwd, True, uid))
+        if inode.kind != DIR:
+            raise VFSError(f"{path}: Não é um diretório")
+        self._check(inode, uid, READ, path)
+        return sorted(inode.data)
+
+    def _unlink_entry(self, directory: int, name: str, uid: int, path: str):
+        self._check(self.get(directory), uid, WRITE, path)
+        parent = self._mut(directory)
+        ino = parent.data.pop(name)
+        self.clock += 1
+        parent.mtime = self.clock
+        inode = self._mut(ino)
+        inode.nlink -= 1
+        if inode.kind == DIR:
+            parent.nlink -= 1
+            inode.nlink = 0
+        if inode.nlink <= 0:
+            self.top[ino] = None
+        elif inode.parent == directory and inode.name == name:
+            inode.parent, inode.name = self._other_link(ino)
+        self._paths.clear()
+
+    def _other_link(self, ino: int) -> Tuple[int, str]:
+        """Algum outro link do inode (para path_of depois de remover o principal)"""
+        pending = [ROOT]
+        while pending:
+            directory = pending.pop()
+            for name, child in self.get(directory).data.items():
+                if child == ino:
+                    return directory, name
+                if self.get(child).kind == DIR:
+                    pending.append(child)
+        return ROOT, ""
+
+    def unlink(self, path: str, cwd: int = ROOT, uid: int = 0):
+        directory, name = self._parent(path, cwd, uid)
+        ino = self.get(directory).data.get(name)
+        if ino is None:
+            raise VFSError(f"{path}: Arquivo ou diretório inexistente")
+        if self.get(ino).kind == DIR:
+            raise VFSError(f"{path}: É um diretório")
+        self._unlink_entry(directory, name, uid, path)
+
+    def rmdir(self, path: str, cwd: int = ROOT, uid: int = 0):
+        directory, name = self._parent(path, cwd, uid)
+        ino = self.get(directory).data.get(name)
+        if ino is None:
+            raise VFSError(f"{path}: Arquivo ou diretório inexistente")
+        inode = self.get(ino)
+        if inode.kind != DIR:
+            raise VFSError(f"{path}: Não é um diretório")
+        if inode.data:
+            raise VFSError(f"{path}: Diretório não vazio")
+        self._unlink_entry(directory, name, uid, path)
+
+    def remove_tree(self, path: str, cwd: int = ROOT, uid: int = 0):
+        """rm -r"""
+        directory, name = self._parent(path, cwd, uid)
+        ino = self.get(directory).data.get(name)
+        if ino is None:
+            raise VFSError(f"{path}: Arquivo ou diretório inexistente")
+        inode = self.get(ino)
+        if inode.kind == DIR:
+            for child in list(inode.data):
+                self.remove_tree(f"{path.rstrip('/')}/{child}", cwd, uid)
+        self._unlink_entry(directory, name, uid, path)
+
+    def rename(self, source: str, target: str, cwd: int = ROOT, uid: int = 0):
+        """mv: move/renomeia; se o destino é um diretório, move para dentro dele"""
+        src_dir, src_name = self._parent(source, cwd, uid)
+        ino = self.get(src_dir).data.get(src_name)
+        if ino is None:
+            raise VFSError(f"{source}: Arquivo ou diretório inexistente")
+        target_ino = self._maybe(target, cwd, uid)
+        if target_ino is not None and self.get(target_ino).kind == DIR:
+            target = f"{target.rstrip('/')}/{src_name}"
+            target_ino = self._maybe(target, cwd, uid)
+        dst_dir, dst_name = self._parent(target, cwd, uid)
+        if self.get(ino).kind == DIR and self._inside(dst_dir, ino):
+            raise VFSError(f"{source}: não é possível mover para um subdiretório de si mesmo")
+        if target_ino is not None:
+            if target_ino == ino:
+                return
+            if self.get(target_ino).kind == DIR:
+                raise VFSError(f"{target}: É um diretório")
+            self._unlink_entry(dst_dir, dst_name, uid, target)
+        self._check(self.get(src_dir), uid, WRITE, source)
+        parent = self._mut(src_dir)
+        del parent.data[src_name]
+        if self.get(ino).kind == DIR:
+            parent.nlink -= 1
+        self._link_entry(dst_dir, dst_name, ino, uid, target)
+
+    def _inside(self, directory: int, ancestor: int) -> bool:
+        """Se directory é ancestor ou está abaixo dele"""
+        while directory != ancestor:
+            if directory == ROOT:
+                return False
+            directory = self.get(directory).parent
+        return True
+
+    def _maybe(self, path: str, cwd: int, uid: int) -> Optional[int]:
+        try:
+            return self.lookup(path, cwd, True, uid)
+        except VFSError:
+            return None
+
+    def link(self, source: str, target: str, cwd: int = ROOT, uid: int = 0):
+        """ln (link físico)"""
+        ino = self.lookup(source, cwd, False, uid)
+        if self.get(ino).kind == DIR:
+            raise VFSError(f"{source}: links físicos não são permitidos para diretórios")
+        directory, name = self._parent(target, cwd, uid)
+        if name in self.get(directory).data:
+            raise VFSError(f"{target}: Arquivo existe")
+        self._mut(ino).nlink += 1
+        self._link_entry(directory, name, ino, uid, target)
+
+    def symlink(self, destination: str, path: str, cwd: int = ROOT, uid: int = 0) -> int:
+        """ln -s"""
+        return self._create(path, Inode(LINK, 0o777, uid, uid, destination), cwd, uid)
+
+    def chmod(self, path: str, mode: int, cwd: int = ROOT, uid: int = 0):
+        ino = self.lookup(path, cwd, True, uid)
+        inode = self.get(ino)
+        if uid not in (0, inode.uid):
+            raise VFSError(f"{path}: Operação não permitida")
+        self._mut(ino).mode = mode & 0o7777
+        self._paths.clear()
+
+    def chown(self, path: str, owner: Optional[int], group: Optional[int] = None,
+              cwd: int = ROOT, uid: int = 0):
+        if uid != 0:
+            raise VFSError(f"{path}: Operação não permitida")
+        inode = self._mut(self.lookup(path, cwd, True, uid))
+        if owner is not None:
+            inode.uid = owner
+        if group is not None:
+            inode.gid = group
+        self._paths.clear()
+
+    def copy(self, source: str, target: str, recursive: bool = False,
+             cwd: int = ROOT, uid: int = 0):
+        """cp; se o destino é um diretório, copia para dentro dele"""
+        ino = self.lookup(source, cwd, True, uid)
+        inode = self.get(ino)
+        target_ino = self._maybe(target, cwd, uid)
+        if target_ino is not None and self.get(target_ino).kind == DIR:
+            target = f"{target.rstrip('/')}/{posixpath.basename(source.rstrip('/'))}"
+        if inode.kind == DIR:
+            if not recursive:
+                raise VFSError(f"{source}: omitindo diretório (use -r)")
+            if self._inside(self._parent(target, cwd, uid)[0], ino):
+                raise VFSError(f"não é possível copiar o diretório '{source}' "
+                               f"para dentro dele mesmo, '{target}'")
+            if self._maybe(target, cwd, uid) is None:
+                self.mkdir(target, inode.mode, cwd=cwd, uid=uid)
+            for name in sorted(inode.data):
+                self.copy(f"{source.rstrip('/')}/{name}", f"{target.rstrip('/')}/{name}",
+                          True, cwd, uid)
+            return
+        self._check(inode, uid, READ, source)
+        self.write_file(target, inode.data, mode=inode.mode, cwd=cwd, uid=uid)
+
+    def walk(self, path: str = "/", cwd: int = ROOT, uid: int = 0) -> Iterator[Tuple[str, Inode]]:
+        """(caminho, inode) de tudo abaixo de path, em pré-ordem, sem seguir links"""
+        ino = self.lookup(path, cwd, True, uid)
+        pending = [(path.rstrip("/") or "/", ino)]
+        while pending:
+            current, ino = pending.pop()
+            inode = self.get(ino)
+            yield current, inode
+            if inode.kind == DIR:
+                prefix = "" if current == "/" else current
+                for name in sorted(inode.data, reverse=True):
+                    pending.append((f"{prefix}/{name}", inode.data[name]))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.walk("/"))
+
+
+_MISSING = object()
+
+
+# --- Comparação de árvores ---------------------------------------------------
+
+def _changed(fs: FileSystem, common: int) -> set:
+    """Inodes escritos depois das camadas comuns, e os diretórios acima deles"""
+    dirty = set()
+    for layer in fs.layers[common:] + [fs.top]:
+        for ino, inode in layer.items():
+            while ino not in dirty:
+                dirty.add(ino)
+                if inode is None or ino == ROOT:
+                    break
+                ino = inode.parent
+                inode = fs.get(ino)
+                if inode is None:
+                    break
+    return dirty
+
+
+def _describe(inode: Inode) -> str:
+    return {FILE: "arquivo", DIR: "diretório", LINK: "link simbólico"}[inode.kind]
+
+
+def diff(expected: FileSystem, actual: FileSystem, root: str = "/") -> List[str]:
+    """Diferenças de actual em relação a expected ('+' sobrando, '-' faltando, '~' diferente)"""
+    common = 0
+    for mine, theirs in zip(expected.layers, actual.layers):
+        if mine is not theirs:
+            break
+        common += 1
+    dirty = _changed(expected, common) | _changed(actual, common) if common else None
+    lines: List[str] = []
+    _compare(expected, expected.lookup(root), actual, actual.lookup(root), root, dirty, lines)
+    return lines
+
+
+def _compare(expected: FileSystem, e_ino: int, actual: FileSystem, a_ino: int,
+             path: str, dirty: Optional[set], lines: List[str]):
+    if dirty is not None and e_ino == a_ino and e_ino not in dirty:
+        return  # mesmo inode, intocado desde o snapshot comum
+    e, a = expected.get(e_ino), actual.get(a_ino)
+    if e.kind != a.kind:
+        lines.append(f"~ {path}: esperado {_describe(e)}, encontrado {_describe(a)}")
+        return
+    if e.mode != a.mode:
+        lines.append(f"~ {path}: permissões {a.mode:o}, esperado {e.mode:o}")
+    if (e.uid, e.gid) != (a.uid, a.gid):
+        lines.append(f"~ {path}: dono {USER_NAMES.get(a.uid, a.uid)}:{GROUP_NAMES.get(a.gid, a.gid)}, "
+                     f"esperado {USER_NAMES.get(e.uid, e.uid)}:{GROUP_NAMES.get(e.gid, e.gid)}")
+    if e.kind == FILE and e.data != a.data:
+        lines.append(f"~ {path}: conteúdo diferente do esperado")
+    elif e.kind == LINK and e.data != a.data:
+        lines.append(f"~ {path}: aponta para {a.data}, esperado {e.data}")
+    elif e.kind == DIR:
+        prefix = "" if path == "/" else path
+        for name in sorted(e.data.keys() | a.data.keys()):
+            child = f"{prefix}/{name}"
+            if name not in a.data:
+                lines.append(f"- {child}: {_describe(expected.get(e.data[name]))} faltando")
+            elif name not in e.data:
+                lines.append(f"+ {child}: {_describe(actual.get(a.data[name]))} a mais")
+            else:
+                _compare(expected, e.data[name], actual, a.data[name], child, dirty, lines)
+
+
+# --- Shell -------------------------------------------------------------------
+
+GLOB_CHARS = frozenset("*?[")
+OPERATORS = frozenset((";", "&&", "||", "|"))
+PUNCTUATION = "|;&<>"
+
+
+def split_words(line: str) -> List[Tuple[str, bool]]:
+    """(palavra sem aspas, tinha aspas) de cada palavra/operador da linha"""
+    words: List[Tuple[str, bool]] = []
+    word: List[str] = []
+    quoted = started = False
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if char in "'\"":
+            end = line.find(char, i + 1)
+            if end < 0:
+                raise VFSError("aspas sem fechamento")
+            word.append(line[i + 1:end])
+            quoted = started = True
+            i = end + 1
+            continue
+        if char == "\\" and i + 1 < len(line):
+            word.append(line[i + 1])
+            quoted = started = True
+            i += 2
+            continue
+        if char.isspace() or char in PUNCTUATION:
+            if started:
+                words.append(("".join(word), quoted))
+                word, quoted, started = [], False, False
+            if char in PUNCTUATION:
+                end = i
+                while end < len(line) and line[end] in PUNCTUATION:
+                    end += 1
+                words.append((line[i:end], False))
+                i = end
+                continue
+        else:
+            word.append(char)
+            started = True
+        i += 1
+    if started:
+        words.append(("".join(word), quoted))
+    return words
+
+
+def parse_mode(spec: str, current: int) -> int:
+    """Modo octal (755) ou simbólico (u+x,go-w, a=r)"""
+    if spec.isdigit():
+        if len(spec) > 4 or any(digit not in "01234567" for digit in spec):
+            raise VFSError(f"modo inválido: '{spec}'")
+        return int(spec, 8)
+    mode = current
+    for clause in spec.split(","):
+        who = ""
+        i = 0
+        while i < len(clause) and clause[i] in "ugoa":
+            who += clause[i]
+            i += 1
+        if i >= len(clause) or clause[i] not in "+-=":
+            raise VFSError(f"modo inválido: '{spec}'")
+        op, perms = clause[i], clause[i + 1:]
+        if any(p not in "rwx" for p in perms):
+            raise VFSError(f"modo inválido: '{spec}'")
+        bits = sum({"r": 4, "w": 2, "x": 1}[p] for p in perms)
+        mask = 0
+        for target in (who or "a").replace("a", "ugo"):
+            shift = {"u": 6, "g": 3, "o": 0}[target]
+            mask |= 7 << shift
+            if op == "+":
+                mode |= bits << shift
+            elif op == "-":
+                mode &= ~(bits << shift)
+            else:
+                mode = (mode & ~(7 << shift)) | (bits << shift)
+    return mode
+
+
+class Shell:
+    """Interpretador mínimo de comandos sobre um FileSystem"""
+
+    def __init__(self, fs: FileSystem, user: str = "aluno", cwd: str = "/"):
+        self.fs = fs
+        self.user = user
+        self.uid = USERS.get(user, 1000)
+        self.cwd = fs.lookup(cwd)
+
+    @property
+    def cwd_path(self) -> str:
+        return self.fs.path_of(self.cwd)
+
+    def run(self, line: str) -> str:
+        """Executa a linha e devolve a saída (incluindo mensagens de erro)"""
+        output: List[str] = []
+        status = 0
+        try:
+            tokens = split_words(line)
+        except VFSError as error:
+            return f"bash: {error}\n"
+        commands: List[Tuple[str, List[list]]] = []  # (operador anterior, pipeline)
+        operator, pipeline, words = ";", [], []
+        for token, quoted in tokens + [(";", False)]:
+            if token in OPERATORS and not quoted:
+                if token == "|":
+                    pipeline.append(words)
+                else:
+                    pipeline.append(words)
+                    commands.append((operator, pipeline))
+                    operator, pipeline = token, []
+                words = []
+            else:
+                words.append((token, quoted))
+        for operator, pipeline in commands:
+            if (operator == "&&" and status != 0) or (operator == "||" and status == 0):
+                continue
+            if not any(pipeline):
+                continue
+            stdin = None
+            for words in pipeline:
+                try:
+                    stdin, status = self._run_simple(words, stdin, output)
+                except Exception as error:  # falha do simulador: vira mensagem, não exceção
+                    output.append(f"bash: erro interno: {error!r}\n")
+                    stdin, status = None, 1
+            if stdin:
+                output.append(stdin)
+        return "".join(output)
+
+    def _run_simple(self, words: List[Tuple[str, bool]], stdin: Optional[str],
+                    errors: List[str]) -> Tuple[str, int]:
+        """Executa um comando simples; devolve (saída padrão, status)"""
+        args, redirect, append = [], None, False
+        i = 0
+        while i < len(words):
+            word, quoted = words[i]
+            if word in (">", ">>", "<") and not quoted and i + 1 < len(words):
+                target, target_quoted = words[i + 1]
+                if not target_quoted:
+                    target = self._tilde(target)
+                if word == "<":
+                    try:
+                        stdin = self.fs.read_file(target, self.cwd, self.uid)
+                    except VFSError as error:
+                        errors.append(f"bash: {error}\n")
+                        return "", 1
+                else:
+                    redirect, append = target, word == ">>"
+                i += 2
+                continue
+            args.extend([word] if quoted else self._expand(word))
+            i += 1
+        if not args:
+            return "", 0
+        name = args[0]
+        handler = getattr(self, f"cmd_{name.replace('-', '_')}", None)
+        if handler is None:
+            errors.append(f"{name}: comando não encontrado\n")
+            return "", 127
+        try:
+            stdout = handler(args[1:], stdin or "")
+            status = 0
+        except VFSError as error:
+            errors.append(f"{name}: {error}\n")
+            return "", 1
+        if redirect is not None:
+            try:
+                self.fs.write_file(redirect, stdout, append, cwd=self.cwd, uid=self.uid)
+            except VFSError as error:
+                errors.append(f"bash: {error}\n")
+                return "", 1
+            return "", status
+        return stdout, status
+
+    def _tilde(self, word: str) -> str:
+        """~ e ~usuário no início da palavra viram o diretório pessoal"""
+        if not word.startswith("~"):
+            return word
+        prefix, slash, rest = word[1:].partition("/")
+        user = prefix or self.user
+        if user not in USERS:
+            return word  # ~desconhecido fica como está, igual ao bash
+        return home_of(user) + slash + rest
+
+    def _expand(self, word: str) -> List[str]:
+        """Expansão do ~ e de glob (sem casamento, a palavra fica como está)"""
+        word = self._tilde(word)
+        if not GLOB_CHARS & set(word):
+            return [word]
+        head, pattern = posixpath.split(word)
+        try:
+            names = self.fs.listdir(head or ".", self.cwd, self.uid)
+        except VFSError:
+            return [word]
+        matches = [
+            posixpath.join(head, name) if head else name
+            for name in fnmatch.filter(names, pattern)
+            if not name.startswith(".") or pattern.startswith(".")
+        ]
+        return matches or [word]
+
+    @staticmethod
+    def _options(args: List[str]) -> Tuple[set, List[str]]:
+        flags, operands = set(), []
+        end_of_options = False
+        for arg in args:
+            if arg == "--" and not end_of_options:
+                end_of_options = True
+            elif arg.startswith("-") and len(arg) > 1 and not end_of_options:
+                flags.update(arg[1:])
+            else:
+                operands.append(arg)
+        return flags, operands
+
+    # --- Comandos ------------------------------------------------------------
+
+    def cmd_pwd(self, args, stdin):
+        return self.cwd_path + "\n"
+
+    def cmd_cd(self, args, stdin):
+        target = args[0] if args else home_of(self.user)
+        ino = self.fs.lookup(target, self.cwd, True, self.uid)
+        if self.fs.get(ino).kind != DIR:
+            raise VFSError(f"{target}: Não é um diretório")
+        self.cwd = ino
+        return ""
+
+    def cmd_ls(self, args, stdin):
+        flags, paths = self._options(args)
+        lines = []
+        for path in paths or ["."]:
+            inode = self.fs.stat(path, self.cwd, True, self.uid)
+            if inode.kind == DIR and "d" not in flags:
+                names = self.fs.listdir(path, self.cwd, self.uid)
+                if "a" not in flags:
+                    names = [name for name in names if not name.startswith(".")]
+                if len(paths) > 1:
+                    lines.append(f"{path}:")
+                entries = [(name, self.fs.get(inode.data[name])) for name in names]
+            else:
+                entries = [(path, inode)]
+            if "l" in flags:
+                for name, entry in entries:
+                    suffix = f" -> {entry.data}" if entry.kind == LINK else ""
+                    lines.append(
+                        f"{entry.mode_string()} {entry.nlink} "
+                        f"{USER_NAMES.get(entry.uid, entry.uid)} {GROUP_NAMES.get(entry.gid, entry.gid)} "
+                        f"{entry.size:>6} {name}{suffix}"
+                    )
+            elif entries:
+                lines.append("  ".join(name for name, _ in entries))
+        return "".join(line + "\n" for line in lines)
+
+    def cmd_mkdir(self, args, stdin):
+        flags, paths = self._options(args)
+        for path in paths:
+            self.fs.mkdir(path, parents="p" in flags, cwd=self.cwd, uid=self.uid)
+        return ""
+
+    def cmd_rmdir(self, args, stdin):
+        for path in args:
+            self.fs.rmdir(path, self.cwd, self.uid)
+        return ""
+
+    def cmd_touch(self, args, stdin):
+        for path in args:
+            self.fs.touch(path, self.cwd, self.uid)
+        return ""
+
+    def cmd_cat(self, args, stdin):
+        if not args:
+            return stdin
+        return "".join(self.fs.read_file(path, self.cwd, self.uid) for path in args)
+
+    def cmd_echo(self, args, stdin):
+        if args and args[0] == "-n":
+            return " ".join(args[1:])
+        return " ".join(args) + "\n"
+
+    def cmd_cp(self, args, stdin):
+        flags, paths = self._options(args)
+        if len(paths) < 2:
+            raise VFSError("falta o operando arquivo de destino")
+        *sources, target = paths
+        for source in sources:
+            self.fs.copy(source, target, bool(flags & set("rRa")), self.cwd, self.uid)
+        return ""
+
+    def cmd_mv(self, args, stdin):
+        _, paths = self._options(args)
+        if len(paths) < 2:
+            raise VFSError("falta o operando arquivo de destino")
+        *sources, target = paths
+        for source in sources:
+            self.fs.rename(source, target, self.cwd, self.uid)
+        return ""
+
+    def cmd_rm(self, args, stdin):
+        flags, paths = self._options(args)
+        for path in paths:
+            try:
+                if flags & set("rR"):
+                    self.fs.remove_tree(path, self.cwd, self.uid)
+                else:
+                    self.fs.unlink(path, self.cwd, self.uid)
+            except VFSError:
+                if "f" not in flags:
+                    raise
+        return ""
+
+    def cmd_ln(self, args, stdin):
+        flags, paths = self._options(args)
+        if len(paths) != 2:
+            raise VFSError("uso: ln [-s] ALVO NOME")
+        source, target = paths
+        target_ino = self.fs._maybe(target, self.cwd, self.uid)
+        if target_ino is not None and self.fs.get(target_ino).kind == DIR:
+            target = f"{target.rstrip('/')}/{posixpath.basename(source)}"
+        if "s" in flags:
+            self.fs.symlink(source, target, self.cwd, self.uid)
+        else:
+            self.fs.link(source, target, self.cwd, self.uid)
+        return ""
+
+    def cmd_chmod(self, args, stdin):
+        flags, operands = self._options(args)
+        if len(operands) < 2:
+            raise VFSError("falta operando")
+        spec, paths = operands[0], operands[1:]
+        for path in paths:
+            targets = [p for p, _ in self.fs.walk(path, self.cwd, self.uid)] if "R" in flags else [path]
+            for target in targets:
+                inode = self.fs.stat(target, self.cwd, True, self.uid)
+                self.fs.chmod(target, parse_mode(spec, inode.mode), self.cwd, self.uid)
+        return ""
+
+    def cmd_chown(self, args, stdin):
+        flags, operands = self._options(args)
+        if len(operands) < 2:
+            raise VFSError("falta operando")
+        owner, _, group = operands[0].partition(":")
+        if owner and owner not in USERS or group and group not in GROUPS:
+            raise VFSError(f"usuário ou grupo inválido: '{operands[0]}'")
+        for path in operands[1:]:
+            targets = [p for p, _ in self.fs.walk(path, self.cwd, self.uid)] if "R" in flags else [path]
+            for target in targets:
+                self.fs.chown(target, USERS[owner] if owner else None,
+                              GROUPS[group] if group else None, self.cwd, self.uid)
+        return ""
+
+    def cmd_find(self, args, stdin):
+        paths = []
+        while args and not args[0].startswith("-"):
+            paths.append(args.pop(0))
+        name = kind = None
+        max_depth = None
+        while args:
+            option = args.pop(0)
+            if not args:
+                raise VFSError(f"falta argumento para '{option}'")
+            value = args.pop(0)
+            if option == "-name":
+                name = value
+            elif option == "-type":
+                kind = {"f": FILE, "d": DIR, "l": LINK}.get(value)
+            elif option == "-maxdepth":
+                max_depth = int(value)
+            else:
+                raise VFSError(f"predicado desconhecido '{option}'")
+        lines = []
+        for start in paths or ["."]:
+            base_depth = start.rstrip("/").count("/")
+            for path, inode in self.fs.walk(start, self.cwd, self.uid):
+                if max_depth is not None and path.count("/") - base_depth > max_depth:
+                    continue
+                if name is not None and not fnmatch.fnmatchcase(posixpath.basename(path), name):
+                    continue
+                if kind is not None and inode.kind != kind:
+                    continue
+                lines.append(path + "\n")
+        return "".join(lines)
@@ -0,0 +1,63 @@
+"""Sorteio adaptativo ponderado (adaptive)"""
+
+import random
+
+import pytest
+
+from adaptive import DAY, MIN_WEIGHT, AdaptiveSampler, AliasTable, weakness_weight
+
+
+def test_alias_table_matches_weights():
+    weights = [1.0, 2.0, 3.0, 0.5, 3.5]
+    table = AliasTable(weights)
+    rng = random.Random(1)
+    draws = 200000
+    counts = [0] * len(weights)
+    for _ in range(draws):
+        counts[table.draw(rng)] += 1
+    for count, weight in zip(counts, weights):
+        assert count / draws == pytest.approx(weight / sum(weights), abs=0.005)
+
+
+@pytest.mark.parametrize("weights", [[], [0.0, 0.0]])
+def test_alias_table_rejects_empty_or_zero_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+
+def test_weakness_weight():
+    now = 100 * DAY
+    assert weakness_weight(0, 0, None, now) == pytest.approx(0.5 * 3)  # nunca vista
+    assert weakness_weight(10, 0, now, now) > weakness_weight(10, 10, now, now)
+    assert weakness_weight(10, 10, now - 30 * DAY, now) > weakness_weight(10, 10, now, now)
+    assert weakness_weight(1000, 1000, now, now) == MIN_WEIGHT
+
+
+def test_sampler_prefers_weak_questions():
+    now = 100 * DAY
+    ids = [f"q{i}" for i in range(20)]
+    stats = {qid: (10, 10, now) for qid in ids}
+    stats["q3"] = (10, 0, now - 30 * DAY)
+    sampler = AdaptiveSampler(ids, stats, now=now)
+    rng = random.Random(5)
+    hits = sum(3 in sampler.sample(3, rng) for _ in range(300))
+    assert hits > 250
+
+
+@pytest.mark.parametrize("num", [1, 5, 15, 20, 50])
+def test_sampler_returns_distinct_indexes(num):
+    sampler = AdaptiveSampler([f"q{i}" for i in range(20)], now=0.0)
+    chosen = sampler.sample(num, random.Random(num))
+    assert len(chosen) == min(num, 20)
+    assert len(set(chosen)) == len(chosen)
+
+
+def test_record_updates_weight_and_rebuilds_table():
+    sampler = AdaptiveSampler(["a", "b"], now=0.0)
+    sampler.sample(1)
+    before = sampler.weights[0]
+    sampler.record("a", True, now=0.0)
+    sampler.record("desconhecida", False)
+    assert sampler.weights[0] < before
+    assert sampler._table is None
+    assert (sampler.attempts, sampler.correct) == ([1, 0], [1, 0])
@@ -0,0 +1,97 @@
+"""Histórico de tentativas em SQLite (attempt_store)"""
+
+import sqlite3
+import time
+
+import pytest
+
+from attempt_store import AttemptStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    attempt_store = AttemptStore(str(tmp_path / "history.db"), flush_interval=0.01)
+    yield attempt_store
+    attempt_store.close()
+
+
+def test_aggregates_follow_attempts(store):
+    store.record("ana", "q1", "103.1", "0", True, answered_at=1.0)
+    store.record("ana", "q1", "103.1", "2", False, answered_at=2.0)
+    store.record("ana", "q2", "103.2", "1", True, answered_at=3.0)
+    store.flush()
+    assert store.topic_stats("ana") == {"103.1": (2, 1), "103.2": (1, 1)}
+    assert store.question_stats("ana", "103.1") == {"q1": (2, 1, 2.0)}
+    assert [row[2] for row in store.iter_attempts()] == ["q1", "q1", "q2"]
+
+
+def test_exercises_stay_out_of_question_history(store):
+    store.record("ana", "q1", "103.3", "0", True)
+    store.record_exercise("ana", "ex-103.3-logs", "103.3", False)
+    store.record_exercise("ana", "ex-103.3-logs", "103.3", True)
+    store.flush()
+    assert store.exercise_stats("ana") == {"ex-103.3-logs": (2, 1)}
+    assert store.topic_stats("ana") == {"103.3": (1, 1)}
+    assert list(store.question_stats("ana")) == ["q1"]
+    assert [row[2] for row in store.iter_attempts()] == ["q1"]
+
+
+def test_legacy_exercise_rows_are_migrated(tmp_path):
+    path = str(tmp_path / "history.db")
+    store = AttemptStore(path)
+    store.record("ana", "103.3-abc", "103.3", "1", True, answered_at=1.0)
+    store.record("ana", "ex-103.3-logs", "103.3", "exercicio", True, answered_at=2.0)
+    store.record("ana", "ex-103.1-saudacao", "103.1", "exercicio", False, answered_at=3.0)
+    store.close()
+
+    store = AttemptStore(path)
+    try:
+        assert store.exercise_stats("ana") == {"ex-103.3-logs": (1, 1), "ex-103.1-saudacao": (1, 0)}
+        assert store.topic_stats("ana") == {"103.3": (1, 1)}
+        assert list(store.question_stats("ana")) == ["103.3-abc"]
+        assert [row[2] for row in store.iter_attempts()] == ["103.3-abc"]
+    finally:
+        store.close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM exercise_attempts").fetchone() == (2,)
+
+
+def test_write_error_is_raised_by_flush(store, monkeypatch):
+    def fail(*args):
+        raise sqlite3.OperationalError("disco cheio")
+    monkeypatch.setattr(AttemptStore, "_write_batch", staticmethod(fail))
+    store.record("ana", "q1", "103.1", "0", True)
+    with pytest.raises(sqlite3.OperationalError):
+        store.flush()
+    store.flush()  # o erro é entregue uma vez só
+
+
+def test_close_does_not_wait_for_flush_interval(tmp_path):
+    store = AttemptStore(str(tmp_path / "history.db"), flush_interval=10)
+    start = time.monotonic()
+    store.close()
+    assert time.monotonic() - start < 5
+
+
+def test_stats_include_attempts_still_queued(tmp_path):
+    path = str(tmp_path / "history.db")
+    store = AttemptStore(path)
+    store.record("ana", "q1", "103.1", "0", True, answered_at=1.0)
+    store.close()
+
+    store = AttemptStore(path, flush_interval=10)  # o escritor segura o lote
+    store.record("ana", "q1", "103.1", "2", False, answered_at=2.0)
+    store.record("ana", "q2", "103.2", "1", True, answered_at=3.0)
+    store.record("bia", "q1", "103.1", "1", True, answered_at=4.0)
+    queued = (store.question_stats("ana"), store.question_stats("ana", "103.1"),
+              store.topic_stats("ana"))
+    store.close()
+    assert queued == ({"q1": (2, 1, 2.0), "q2": (1, 1, 3.0)}, {"q1": (2, 1, 2.0)},
+                      {"103.1": (2, 1), "103.2": (1, 1)})
+
+    store = AttemptStore(path)
+    try:
+        assert (store.question_stats("ana"), store.question_stats("ana", "103.1"),
+                store.topic_stats("ana")) == queued
+    finally:
+        store.close()
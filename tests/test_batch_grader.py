@@ -0,0 +1,68 @@
+"""Correção em lote de folhas de resposta (batch_grader)"""
+
+import io
+import json
+
+import pytest
+
+from batch_grader import AnswerKey, ResponseMatrix, _answer_mask, answer_mask, grade, grade_file
+
+KEY = AnswerKey(["q1", "q2", "q3"], ["101.1", "101.1", "101.2"], [0b1, 0b100, 0b101])
+
+
+@pytest.mark.parametrize("answer, mask", [
+    (None, 0), ("", 0), (2, 0b100), ("0;2", 0b101), ("0|2", 0b101), ([0, 2], 0b101), ((2,), 0b100),
+])
+def test_answer_mask(answer, mask):
+    assert answer_mask(answer) == mask
+
+
+def test_answer_mask_cache_is_bounded():
+    assert _answer_mask.cache_info().maxsize is not None
+
+
+@pytest.mark.parametrize("answer", [16, -1, "x", 1.5, [[0]]])
+def test_answer_mask_rejects(answer):
+    with pytest.raises((ValueError, TypeError)):
+        answer_mask(answer)
+
+
+def test_grade_jsonl_keeps_bad_sheets_as_errors():
+    lines = [
+        json.dumps({"student": "ana", "answers": {"q1": 0, "q2": 2, "q3": [0, 2]}}),
+        json.dumps({"student": "bia", "answers": {"q1": 99}}),
+        "{quebrado",
+        json.dumps({"student": "caio", "answers": [0, 1, 2, 3]}),
+        json.dumps({"student": "davi", "answers": [0, None, "0;2"]}),
+    ]
+    report = grade(KEY, ResponseMatrix.from_jsonl_lines(lines, KEY))
+    results = report.student_results()
+    assert [result["student"] for result in results] == ["ana", "bia", "2", "caio", "davi"]
+    assert [result.get("correct") for result in results] == [3, None, None, None, 2]
+    assert "fora do intervalo" in results[1]["error"]
+    assert "4 respostas" in results[3]["error"]
+    totals = report.totals()
+    assert (totals.students, totals.errors) == (2, 3)
+    assert totals.question_answered.tolist() == [2, 1, 2]
+
+
+def test_grade_csv_keeps_bad_rows_as_errors():
+    header = ["student", "q1", "q2", "q3"]
+    rows = [["ana", "0", "2", "0;2"], ["bia", "abc", "", ""], ["caio", "0", "", "", "1"], []]
+    sheets = ResponseMatrix.from_csv_rows(header, rows, KEY)
+    assert sheets.students == ["ana"]
+    assert [(position, student) for position, student, _ in sheets.errors] == [(1, "bia"), (2, "caio")]
+
+
+def test_grade_file_continues_after_bad_sheet(tmp_path):
+    path = tmp_path / "folhas.jsonl"
+    sheets = [{"student": f"a{i}", "answers": {"q1": 0}} for i in range(5)]
+    sheets[2]["answers"] = {"q1": 40}
+    path.write_text("".join(json.dumps(sheet) + "\n" for sheet in sheets), encoding="utf-8")
+    output = io.StringIO()
+    totals = grade_file(str(path), KEY, output, workers=1, chunk_size=2)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [result["student"] for result in results] == ["a0", "a1", "a2", "a3", "a4"]
+    assert "error" in results[2] and "error" not in results[3]
+    assert (totals.students, totals.errors) == (4, 1)
+    assert totals.summary()["errors"] == 1
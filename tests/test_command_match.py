@@ -0,0 +1,48 @@
+"""Equivalência de comandos nas respostas de texto (command_match)"""
+
+import pytest
+
+from command_match import canonical, compile_answers
+from question import TEXT, Question
+from quiz_session import grade_answer
+
+
+def text_question(*accepted):
+    return Question("?", TEXT, (), tuple(accepted))
+
+
+@pytest.mark.parametrize("answer", [
+    "ls -la /etc", "ls -al /etc", "ls -a -l /etc", "ls --all -l /etc", "  ls -l -a /etc ",
+    "/bin/ls -la /etc", "LS -la /etc",
+])
+def test_equivalent_commands_are_accepted(answer):
+    assert compile_answers(("ls -la /etc",)).matches(answer)
+
+
+@pytest.mark.parametrize("accepted, answer", [
+    ("ls -l", "ls -L"),
+    ("ls -r", "ls -R"),
+    ("tar -xzf backup.tar.gz", "tar -XZF backup.tar.gz"),
+    ("tar -x", "tar -X"),
+    ("/etc/fstab", "/ETC/FSTAB"),
+    ("cat /etc/fstab", "cat /ETC/FSTAB"),
+    ("ls -la /etc", "ls -la /etc/"),
+])
+def test_case_and_operands_must_match(accepted, answer):
+    assert not compile_answers((accepted,)).matches(answer)
+    assert not grade_answer(text_question(accepted), answer)
+
+
+def test_tar_dashless_and_separated_arguments():
+    assert canonical("tar czf a.tgz dir") == canonical("tar -c -z -f a.tgz dir")
+    assert canonical("head -5 f") == canonical("head -n 5 f") == canonical("head --lines=5 f")
+    assert canonical("cp -R a b") == canonical("cp --recursive a b")
+
+
+def test_operand_order_matters():
+    assert canonical("cp a b") != canonical("cp b a")
+
+
+def test_single_path_answer_is_not_reduced_to_basename():
+    assert not compile_answers(("/etc/fstab",)).matches("/usr/fstab")
+    assert compile_answers(("/etc/fstab",)).matches(" /etc/fstab")
@@ -0,0 +1,32 @@
+"""Exercícios práticos sobre o sistema de arquivos em memória (exercises)"""
+
+import pytest
+
+from exercises import EXERCISES, start_session
+
+# Soluções escritas como nos enunciados, com caminhos ~/...
+TILDE_SOLUTIONS = {
+    "ex-103.1-saudacao": "cd /; echo 'Olá LPIC' > ~/saudacao.txt; mkdir ~/bin",
+    "ex-103.3-logs": "mkdir ~/projeto/logs; mv ~/projeto/*.log ~/projeto/logs",
+    "ex-103.3-backup": "cp -r ~/config ~/config.bak; rm -r ~/config/cache",
+    "ex-103.3-links": "ln -s v2 ~/versoes/atual; ln ~/versoes/v2/LEIAME ~aluno/leiame.txt",
+    "ex-103.4-redirecao": "cat ~/parte1.txt ~/parte2.txt > ~/completo.txt; "
+                          "echo concluido >> ~/historico.log",
+}
+
+
+@pytest.mark.parametrize("exercise", EXERCISES, ids=lambda exercise: exercise.id)
+def test_reference_solution_passes_check(exercise):
+    session = start_session(exercise)
+    assert session.check()  # a árvore inicial ainda não é a resposta
+    assert session.run(exercise.solution) == ""
+    assert session.check() == []
+    session.reset()
+    assert session.check()
+
+
+@pytest.mark.parametrize("exercise", EXERCISES, ids=lambda exercise: exercise.id)
+def test_solution_with_tilde_paths_passes_check(exercise):
+    session = start_session(exercise)
+    assert session.run(TILDE_SOLUTIONS[exercise.id]) == ""
+    assert session.check() == []
@@ -0,0 +1,48 @@
+"""Correção tolerante a erros de digitação (fuzzy_match)"""
+
+import pytest
+
+from fuzzy_match import FuzzyMatcher, levenshtein
+from question import TEXT, Question
+from quiz_session import grade_answer
+
+
+@pytest.mark.parametrize("a, b, distance", [
+    ("", "", 0), ("lsblk", "lsbk", 1), ("particao", "partcaoo", 2), ("abc", "", 3),
+])
+def test_levenshtein(a, b, distance):
+    assert levenshtein(a, b) == distance
+    assert levenshtein(b, a) == distance
+
+
+@pytest.mark.parametrize("accepted, answer", [
+    ("partição", "particao"),
+    ("partição", "partcao"),
+    ("lsblk", "lsbk"),
+    ("chmod 755 script.sh", "chmd 755 script.sh"),
+    ("kill -9 1234", "kil -9 1234"),
+])
+def test_typos_in_words_are_tolerated(accepted, answer):
+    assert FuzzyMatcher((accepted,)).matches(answer)
+    assert grade_answer(Question("?", TEXT, (), (accepted,)), answer, typos=2)
+
+
+@pytest.mark.parametrize("accepted, answer", [
+    # o README promete: opções, números e caminhos exatos, inclusive na caixa
+    ("ls -l", "ls -L"),
+    ("ls -r", "ls -R"),
+    ("tar -x", "tar -X"),
+    ("/etc/fstab", "/ETC/FSTAB"),
+    ("cat /etc/fstab", "cat /etc/fsab"),
+    ("chmod 755 script.sh", "chmod 754 script.sh"),
+    ("chmod 755 script.sh", "chmod 755 scrpt.sh"),
+    ("kill -9 1234", "kill -9 1235"),
+    ("tail -n 20 /var/log/messages", "tail -n 30 /var/log/messages"),
+])
+def test_options_numbers_and_paths_must_be_exact(accepted, answer):
+    assert not FuzzyMatcher((accepted,)).matches(answer)
+    assert not grade_answer(Question("?", TEXT, (), (accepted,)), answer, typos=2)
+
+
+def test_short_answers_have_no_tolerance():
+    assert not FuzzyMatcher(("df",)).matches("du")
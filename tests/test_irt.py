@@ -0,0 +1,70 @@
+"""Calibração TRI e teste adaptativo (irt)"""
+
+import numpy as np
+import pytest
+
+from irt import AdaptiveTest, InformationIndex, ItemParameters, calibrate, fisher_information, probability
+
+
+def simulate(a, b, users=3000, seed=3):
+    rng = np.random.default_rng(seed)
+    theta = rng.standard_normal(users)
+    p = 1 / (1 + np.exp(-(np.outer(theta, a) - a * b)))
+    correct = (rng.random(p.shape) < p).astype(np.int8)
+    users_idx, items_idx = np.indices(p.shape)
+    return users_idx.ravel(), items_idx.ravel(), correct.ravel()
+
+
+def test_probability_and_information():
+    a, d, c = np.array([1.0, 2.0]), np.array([0.0, -2.0]), np.array([0.0, 0.25])
+    p = probability(a, d, c, [0.0, 1.0])
+    assert p[0, 0] == pytest.approx(0.5)
+    assert p[1, 1] == pytest.approx(0.625)  # c + (1 - c)/2 em θ = b
+    info = fisher_information(a, d, c, [0.0])[:, 0]
+    assert info[0] == pytest.approx(0.25)  # a² p q
+
+
+def test_calibrate_2pl_recovers_parameters():
+    a = np.array([0.8, 1.0, 1.5, 2.0, 1.2, 0.9])
+    b = np.array([-1.5, -0.5, 0.0, 0.5, 1.0, 1.5])
+    users, items, correct = simulate(a, b)
+    params = calibrate(users, items, correct, [f"q{i}" for i in range(len(a))])
+    assert np.abs(params.b - b).max() < 0.3
+    assert np.corrcoef(params.a, a)[0, 1] > 0.8
+
+
+def test_calibrate_rejects_unknown_model():
+    with pytest.raises(ValueError):
+        calibrate(np.zeros(1), np.zeros(1), np.zeros(1), ["q"], model="4PL")
+
+
+def test_parameters_save_load_and_defaults(tmp_path):
+    params = ItemParameters(["q1", "q2"], [1.5, 0.7], [0.3, -0.2], [0.0, 0.0])
+    path = str(tmp_path / "irt.json")
+    params.save(path)
+    loaded = ItemParameters.load(path)
+    assert loaded.question_ids == ["q1", "q2"]
+    assert loaded.a.tolist() == [1.5, 0.7]
+    subset = loaded.for_questions(["q2", "nova"])
+    assert subset.a.tolist() == [0.7, 1.0] and subset.d.tolist() == [-0.2, 0.0]
+    assert len(ItemParameters.load(str(tmp_path / "ausente.json"))) == 0
+
+
+def test_adaptive_test_picks_informative_items_and_stops():
+    count = 60
+    params = ItemParameters([f"q{i}" for i in range(count)], np.full(count, 1.5),
+                            -1.5 * np.linspace(-3, 3, count), np.zeros(count))
+    test = AdaptiveTest(InformationIndex(params, top_k=8))
+    first = test.next_item()
+    assert abs(params.b[first]) < 0.1  # em θ = 0, a questão mais informativa tem b ≈ 0
+    rng = np.random.default_rng(0)
+    true_theta = 1.0
+    while not test.finished:
+        item = test.next_item()
+        assert item not in test.used
+        p = probability(params.a[item:item + 1], params.d[item:item + 1],
+                        params.c[item:item + 1], [true_theta])[0, 0]
+        test.record(item, bool(rng.random() < p))
+    assert test.next_item() is None
+    assert test.se < 0.35 or len(test.used) == test.max_items
+    assert abs(test.theta - true_theta) < 3 * test.se
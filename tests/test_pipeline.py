@@ -0,0 +1,83 @@
+"""Avaliador de pipelines de filtros de texto (pipeline)"""
+
+import pytest
+
+import pipeline
+import timed_worker
+from pipeline import Files, PipelineError, grade, grade_output, parse, preview_output, run
+
+PASSWD = ("/etc/passwd",)
+LOG = ("/var/log/access.log",)
+WORDS = ("/tmp/palavras.txt",)
+
+
+def output(text, paths):
+    return list(run(text, Files(paths)))
+
+
+@pytest.fixture(scope="module")
+def worker():
+    yield timed_worker.shared()
+    timed_worker.shutdown()
+
+
+@pytest.mark.parametrize("answer, reference, paths", [
+    ("cut -d: -f7 /etc/passwd | sort | uniq", "cut -d: -f7 /etc/passwd | sort -u", PASSWD),
+    ("cat /etc/passwd | cut -f1 -d:", "cut -d: -f1 /etc/passwd", PASSWD),
+    ("tr a-z A-Z < /tmp/palavras.txt | head -n 5", "tr 'a-z' 'A-Z' < /tmp/palavras.txt | head -5", WORDS),
+    ("tr '[:lower:]' '[:upper:]' < /tmp/palavras.txt | head -5", "tr a-z A-Z < /tmp/palavras.txt | head -5", WORDS),
+    ("grep -c bash /etc/passwd", "grep bash /etc/passwd | wc -l", PASSWD),
+    ("cut -d' ' -f1 /var/log/access.log | sort | uniq -c | sort -rn | head -3",
+     "cut -d ' ' -f 1 /var/log/access.log | sort | uniq -c | sort -nr | head -n3", LOG),
+    ("tail -n +2 /etc/passwd | head -1", "head -2 /etc/passwd | tail -1", PASSWD),
+])
+def test_equivalent_pipelines_pass(answer, reference, paths):
+    assert grade_output(answer, (reference,), paths)
+
+
+@pytest.mark.parametrize("answer, reference, paths", [
+    ("cut -d: -f1 /etc/passwd | sort", "cut -d: -f1 /etc/passwd", PASSWD),
+    ("head -4 /tmp/palavras.txt", "head -5 /tmp/palavras.txt", WORDS),
+    ("cat /etc/shadow", "cat /etc/passwd", PASSWD),
+    ("cut -d: -f7 /etc/passwd | uniq", "cut -d: -f7 /etc/passwd | sort -u", PASSWD),
+    ("rm -rf /", "cat /etc/passwd", PASSWD),
+])
+def test_different_output_fails(answer, reference, paths):
+    assert not grade_output(answer, (reference,), paths)
+
+
+@pytest.mark.parametrize("text", [
+    "cat /etc/passwd; ls", "cat /etc/passwd > saida", "cat /etc/passwd |", "| sort", "awk 1 /etc/passwd",
+    "grep 'sem fim /etc/passwd",
+])
+def test_parse_rejects(text):
+    with pytest.raises(PipelineError):
+        parse(text)
+
+
+def test_wc_and_tr_delete_newlines():
+    assert output("cut -d: -f1 /etc/passwd | head -2 | wc -c", PASSWD) == ["12"]
+    assert output("cut -d: -f1 /etc/passwd | head -2 | tr -d '\\n' | wc -c", PASSWD) == ["10"]
+
+
+def test_stage_output_is_bounded(monkeypatch):
+    monkeypatch.setattr(pipeline, "MAX_STAGE_LINES", 10)
+    with pytest.raises(PipelineError):
+        output("cat /etc/passwd /etc/passwd", PASSWD)
+
+
+def test_preview_output():
+    assert preview_output("head -2 /etc/passwd", PASSWD) == (
+        "root:x:0:0:root:/root:/bin/bash\ndaemon:x:1:1:daemon:/usr/sbin:/usr/sbin/nologin"
+    )
+    assert preview_output("cat /etc/passwd", PASSWD, 1).endswith("\n...")
+    assert preview_output("grep nada /etc/passwd", PASSWD) == "(saída vazia)"
+    assert preview_output("cat /nao/existe", PASSWD).startswith("erro: ")
+
+
+def test_grade_runs_in_worker(worker):
+    references = ("cut -d: -f7 /etc/passwd | sort -u",)
+    assert grade("cut -d: -f7 /etc/passwd | sort | uniq", references, PASSWD)
+    assert not grade("cut -d: -f7 /etc/passwd", references, PASSWD)
+    assert not grade("cut -d: -f7 /etc/passwd; ls", references, PASSWD)
+    assert pipeline.preview("head -1 /etc/passwd", PASSWD) == "root:x:0:0:root:/root:/bin/bash"
@@ -0,0 +1,48 @@
+"""Banco de questões com cache LRU de tópicos (question_bank)"""
+
+import pytest
+
+from question_bank import QuestionBank
+
+
+@pytest.fixture
+def bank():
+    question_bank = QuestionBank(max_cached_topics=2)
+    yield question_bank
+    question_bank.pack.close()
+
+
+def test_lru_keeps_at_most_max_cached_topics(bank):
+    topics = bank.get_all_topics()
+    for topic in topics[:4]:
+        bank.get_questions(topic)
+    assert list(bank._cache) == topics[2:4]
+
+
+def test_id_index_is_evicted_with_its_topic(bank):
+    topics = bank.get_all_topics()
+    first = bank.get_questions(topics[0])[0]
+    assert bank.get_question_by_id(first.id, topics[0]) is first
+    for topic in topics[1:3]:
+        bank.get_questions(topic)
+    assert topics[0] not in bank._id_index
+    assert set(bank._id_index) <= set(bank._cache)
+    assert bank.get_question_by_id(first.id, topics[0]).id == first.id
+
+
+def test_counts_and_offsets_without_materializing(bank):
+    topic = bank.get_all_topics()[-1]
+    count = bank.get_topic_count(topic)
+    question = bank.get_question(topic, count - 1)
+    assert topic not in bank._cache
+    assert question.topic == topic
+    assert bank.get_questions(topic)[count - 1].id == question.id
+    assert bank.get_topic_count("999.9") == 0
+    assert bank.get_questions("999.9") == []
+
+
+def test_random_questions_are_distinct(bank):
+    topic = bank.get_all_topics()[0]
+    questions = bank.get_random_questions(topic, 1000)
+    assert len(questions) == bank.get_topic_count(topic)
+    assert len({question.id for question in questions}) == len(questions)
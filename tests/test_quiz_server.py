@@ -0,0 +1,106 @@
+"""Servidor HTTP/JSON de testes (quiz_server): sessões e respostas"""
+
+import asyncio
+import json
+
+import pytest
+
+from question import MULTIPLE
+from quiz_server import NO_ANSWER, HTTPError, QuizServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    quiz_server = QuizServer()
+    yield quiz_server
+    quiz_server.bank.pack.close()
+
+
+def request(server, method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else b""
+    try:
+        status, payload = asyncio.run(server.route(method, path, data))
+    except HTTPError as error:
+        return error.status, {"error": str(error)}
+    return status, json.loads(payload)
+
+
+def new_session(server, topic="101.1", num=5):
+    status, body = request(server, "POST", "/sessions", {"topic": topic, "num": num})
+    assert status == 201
+    return body["session"]
+
+
+def multiple_index(server, session_id):
+    session = server.sessions[session_id]
+    return next(index for index, offset in enumerate(session.offsets)
+                if server.bank.get_question(session.topic, offset).kind == MULTIPLE)
+
+
+def test_answer_is_graded_once(server):
+    session_id = new_session(server)
+    index = multiple_index(server, session_id)
+    path = f"/sessions/{session_id}/answers"
+    status, body = request(server, "POST", path, {"index": index, "answer": "0"})
+    assert status == 200 and isinstance(body["correct"], bool)
+    status, _ = request(server, "POST", path, {"index": index, "answer": "1"})
+    assert status == 409
+    status, results = request(server, "GET", f"/sessions/{session_id}/results")
+    assert status == 200 and results["answered"] == 1
+
+
+@pytest.mark.parametrize("answer", [None, 123, ["ls"], {"a": 1}, True])
+def test_non_string_answer_is_rejected_without_using_the_question(server, answer):
+    session_id = new_session(server)
+    path = f"/sessions/{session_id}/answers"
+    status, _ = request(server, "POST", path, {"index": 0, "answer": answer})
+    assert status == 400
+    assert server.sessions[session_id].answers[0] == NO_ANSWER
+    status, _ = request(server, "POST", path, {"index": 0, "answer": "0"})
+    assert status == 200
+
+
+@pytest.mark.parametrize("body, status", [
+    ({"index": 0, "answer": "  "}, 400),
+    ({"index": 0}, 400),
+    ({"index": 99, "answer": "0"}, 404),
+    ({"index": "x", "answer": "0"}, 400),
+])
+def test_invalid_answer_requests(server, body, status):
+    session_id = new_session(server)
+    assert request(server, "POST", f"/sessions/{session_id}/answers", body)[0] == status
+
+
+def test_unicode_digit_answer_is_wrong_not_an_error(server):
+    session_id = new_session(server)
+    index = multiple_index(server, session_id)
+    status, body = request(server, "POST", f"/sessions/{session_id}/answers",
+                           {"index": index, "answer": "²"})
+    assert status == 200 and body["correct"] is False
+
+
+def test_routes_and_sessions(server):
+    assert request(server, "GET", "/topics")[0] == 200
+    assert request(server, "DELETE", "/topics")[0] == 405
+    assert request(server, "POST", "/sessions", {"topic": "999.9"})[0] == 404
+    session_id = new_session(server)
+    status, body = request(server, "GET", f"/sessions/{session_id}/questions/0")
+    assert status == 200 and "correct" not in body["question"]
+    assert request(server, "DELETE", f"/sessions/{session_id}")[0] == 200
+    assert request(server, "GET", f"/sessions/{session_id}/results")[0] == 404
+
+
+def test_failed_grading_releases_the_question(server, monkeypatch):
+    import quiz_server
+
+    def broken(question, answer):
+        raise RuntimeError("falha na correção")
+
+    session_id = new_session(server)
+    path = f"/sessions/{session_id}/answers"
+    monkeypatch.setattr(quiz_server, "grade_answer", broken)
+    with pytest.raises(RuntimeError):
+        asyncio.run(server.route("POST", path, b'{"index": 0, "answer": "0"}'))
+    assert server.sessions[session_id].answers[0] == NO_ANSWER
+    monkeypatch.undo()
+    assert request(server, "POST", path, {"index": 0, "answer": "0"})[0] == 200
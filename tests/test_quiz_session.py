@@ -0,0 +1,59 @@
+"""Sessão de teste e correção de múltipla escolha (quiz_session)"""
+
+import pytest
+
+from question import MULTIPLE, Question
+from quiz_session import QuizSession, grade_answer, performance_rating
+
+
+def multiple(correct=1, topic="101.1"):
+    return Question("?", MULTIPLE, ("a", "b", "c", "d"), correct, topic=topic)
+
+
+@pytest.mark.parametrize("answer, expected", [
+    ("1", True), ("0", False), ("²", False), ("¹", False), ("-1", False), ("1.0", False),
+    ("", False), ("b", False), ("99999999999999999999", False),
+])
+def test_grade_multiple(answer, expected):
+    assert grade_answer(multiple(), answer) is expected
+
+
+def test_session_answer_and_stats():
+    session = QuizSession([multiple(1), multiple(2, "101.2"), multiple(0)])
+    assert session.answer(" 1 ") is True
+    with pytest.raises(ValueError):
+        session.answer("1")  # já respondida
+    assert session.next()
+    assert session.answer("²") is False  # dígito Unicode: errada, sem exceção
+    assert session.next()
+    with pytest.raises(ValueError):
+        session.answer("   ")
+    assert session.stats.answered == 2
+    assert session.stats.correct == 1
+    assert session.stats.topics == {"101.1": [1, 1], "101.2": [1, 0]}
+    assert session.stats.options == {1: 1}
+    assert session.stats.remaining == 1
+
+
+def test_session_records_result_graded_elsewhere():
+    # Pipelines e regex são corrigidos numa thread; a sessão só registra o resultado
+    session = QuizSession([multiple(1)])
+    assert session.answer("0", is_correct=True) is True
+    assert session.question_results == {0: True}
+    assert session.stats.correct == 1
+
+
+def test_performance_rating_thresholds():
+    assert performance_rating(90)[0] == "Excelente!"
+    assert performance_rating(70)[0] == "Bom!"
+    assert performance_rating(50)[0] == "Regular"
+    assert performance_rating(49.9)[0] == "Precisa melhorar"
+
+
+def test_item_analysis_ignores_unicode_digits():
+    pytest.importorskip("numpy")
+    from item_analysis import ItemAnalysis
+
+    analysis = ItemAnalysis()
+    rows = [(1, "ana", "q1", "101.1", "²", 0), (2, "bia", "q1", "101.1", "2", 1)]
+    assert analysis.add_attempts(rows) == 2
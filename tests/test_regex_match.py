@@ -0,0 +1,52 @@
+"""Exercícios de expressões regulares (regex_match)"""
+
+import pytest
+
+import regex_match
+from regex_match import RegexError, parse_answer, selected_lines
+
+LINES = ("root:x:0:0", "#comentario", "  #indentado", "")
+
+
+@pytest.mark.parametrize("answer, spec", [
+    ("^#", ("^#", True, False, False, False, False, False)),
+    ("'^#'", ("^#", True, False, False, False, False, False)),
+    ("grep -v '^#'", ("^#", False, False, False, False, False, True)),
+    ("grep -Eiwx a", ("a", True, False, True, True, True, False)),
+    ("fgrep a.b", ("a.b", False, True, False, False, False, False)),
+    ("sed -n '/^#/p'", ("^#", False, False, False, False, False, False)),
+    ("sed '/^#/d'", ("^#", False, False, False, False, False, True)),
+    ("sed '/^#/!d'", ("^#", False, False, False, False, False, False)),
+])
+def test_parse_answer(answer, spec):
+    assert parse_answer(answer) == spec
+
+
+@pytest.mark.parametrize("answer", [
+    "grep", "grep a arquivo", "sed '/a/p'", "sed -n '/a/d'", "sed s/a/b/", "grep a | wc -l",
+])
+def test_parse_answer_rejects(answer):
+    with pytest.raises(RegexError):
+        parse_answer(answer)
+
+
+def test_selected_lines():
+    assert selected_lines(parse_answer("^#"), LINES) == {1}
+    assert selected_lines(parse_answer("grep '^[[:space:]]*#'"), LINES) == {1, 2}
+    assert selected_lines(parse_answer("grep -v ."), LINES) == {3}
+    assert selected_lines(parse_answer("grep -F '#'"), LINES) == {1, 2}
+
+
+def test_grade_and_feedback_reuse_outcome(monkeypatch):
+    # Com o outcome da correção, o feedback não volta ao processo de trabalho
+    def fail(*args):
+        raise AssertionError("avaliou de novo")
+    monkeypatch.setattr(regex_match, "evaluate", fail)
+    lines = ("#a", "#b", "c")
+    assert regex_match.grade("^#", lines, 2, (frozenset({0, 1}), ""))
+    assert not regex_match.grade("^#", lines, 2, (None, "tempo esgotado"))
+    assert regex_match.feedback("x", lines, 2, (None, "tempo esgotado")) == ["Erro: tempo esgotado"]
+    assert regex_match.feedback("x", lines, 2, (frozenset({1, 2}), "")) == [
+        "Deveriam casar e não casaram: '#a'",
+        "Casaram sem dever: 'c'",
+    ]
@@ -0,0 +1,50 @@
+"""Revisão espaçada SM-2 (review)"""
+
+import pytest
+
+from review import DAY, DEFAULT_EASE, MIN_EASE, Card, ReviewScheduler
+
+
+def test_card_intervals_follow_sm2():
+    card = Card("q1", "101.1")
+    intervals = []
+    for _ in range(4):
+        card.review(4, now=0.0)
+        intervals.append(card.interval)
+    assert intervals == [1, 6, 15, 38]  # 6 x 2.5 = 15; 15 x 2.5 = 37.5
+    assert card.ease == pytest.approx(DEFAULT_EASE)
+    assert card.due == 38 * DAY
+
+
+def test_wrong_answer_resets_and_ease_has_floor():
+    card = Card("q1", "101.1", reps=3, interval=20)
+    for _ in range(10):
+        card.review(1, now=100.0)
+    assert (card.reps, card.interval, card.due) == (0, 1, 100.0 + DAY)
+    assert card.ease == MIN_EASE
+
+
+def test_scheduler_returns_most_overdue_first():
+    scheduler = ReviewScheduler([
+        Card("a", "101.1", due=3 * DAY), Card("b", "101.1", due=1 * DAY),
+        Card("c", "101.2", due=10 * DAY), Card("d", "101.2", due=2 * DAY),
+    ])
+    now = 5 * DAY
+    assert [card.question_id for card in scheduler.next_due(10, now)] == ["b", "d", "a"]
+    assert [card.question_id for card in scheduler.next_due(2, now)] == ["b", "d"]
+    assert scheduler.due_count(now) == 3
+    # Os cartões continuam na fila até serem revisados
+    assert len(scheduler.next_due(10, now)) == 3
+
+
+def test_review_moves_card_and_drops_stale_entries():
+    scheduler = ReviewScheduler([Card("a", "101.1", due=0.0), Card("b", "101.1", due=1.0)])
+    card = scheduler.review("a", "101.1", True, now=10.0)
+    assert card.due == 10.0 + DAY
+    assert [c.question_id for c in scheduler.next_due(5, now=20.0)] == ["b"]
+    new = scheduler.review("z", "102.1", False, now=0.0)
+    assert "z" in scheduler and new.reps == 0 and len(scheduler) == 3
+    for i in range(500):  # o heap é compactado e não cresce sem limite
+        scheduler.review("a", "101.1", i % 2 == 0, now=float(i))
+    assert len(scheduler._heap) <= 2 * len(scheduler) + 64
+    assert [c.question_id for c in scheduler.next_due(5, now=499.0 + DAY)] == ["b", "z", "a"]
@@ -0,0 +1,61 @@
+"""Busca textual com BM25 e trigramas (search_index)"""
+
+import pytest
+
+from question_bank import QuestionBank
+from search_index import SearchIndex, normalize, tokenize
+
+
+@pytest.fixture(scope="module")
+def index():
+    bank = QuestionBank()
+    yield SearchIndex.build(bank, bank.pack.signature())
+    bank.pack.close()
+
+
+def brute_force(index, query, limit):
+    """Soma, por grupo de termos, do maior peso do documento; só documentos em todos os grupos"""
+    groups = [index.expand(token) for token in dict.fromkeys(tokenize(query))]
+    totals = None
+    for terms in groups:
+        best = {}
+        for term in terms:
+            docs, scores = index.postings[term]
+            for doc, score in zip(docs, scores):
+                best[doc] = max(best.get(doc, 0.0), score)
+        totals = best if totals is None else {
+            doc: totals[doc] + score for doc, score in best.items() if doc in totals
+        }
+    return sorted(totals.values(), reverse=True)[:limit]
+
+
+def test_normalize_and_tokenize():
+    assert normalize("Partição É") == "particao e"
+    assert tokenize("Qual é a partição de /boot?") == ["particao", "boot"]
+
+
+@pytest.mark.parametrize("query", [
+    "modulo", "lsmod modulo", "kernel modulos carregados", "interrupt", "grep arquivo linha",
+    "particao disco", "dpkg pacote", "arquivo comando", "diretorio arquivos",
+])
+def test_search_matches_brute_force(index, query):
+    results = index.search(query, limit=5)
+    expected = brute_force(index, query, 5)
+    assert results
+    assert [score for _, _, score in results] == pytest.approx(expected, rel=1e-5)
+
+
+def test_search_expands_inflections_and_fragments(index):
+    assert "modulos" in index.expand("modulo")
+    assert all("interrupt" in term for term in index.expand("interrupt"))
+    assert index.search("xyzzyinexistente") == []
+    assert index.search("de a o") == []
+
+
+def test_save_and_load_checks_signature(index, tmp_path):
+    path = str(tmp_path / "search.idx")
+    index.save(path)
+    loaded = SearchIndex.load(path, index.signature)
+    assert loaded is not None and loaded.search("lsmod") == index.search("lsmod")
+    assert SearchIndex.load(path, "outro pacote") is None
+    assert SearchIndex.load(str(tmp_path / "ausente.idx")) is None
@@ -0,0 +1,75 @@
+"""Sistema de arquivos em memória e shell dos exercícios (vfs)"""
+
+import pytest
+
+from vfs import FileSystem, Shell, VFSError, diff
+
+
+@pytest.fixture
+def fs():
+    filesystem = FileSystem()
+    Shell(filesystem, "root").run(
+        "mkdir -p /home/aluno /srv; chown aluno:aluno /home/aluno; "
+        "echo comum > /srv/comum; chown root:users /srv/comum; "
+        "echo prof > /srv/prof; chown root:professor /srv/prof; "
+        "echo dono > /srv/aluno; chown aluno:root /srv/aluno; "
+        "chmod 640 /srv/comum /srv/prof /srv/aluno"
+    )
+    return filesystem
+
+
+def test_group_permission_uses_membership(fs):
+    aluno = Shell(fs, "aluno")
+    assert aluno.run("cat /srv/comum") == "comum\n"  # aluno está no grupo users
+    assert "Permissão negada" in aluno.run("cat /srv/prof")
+    assert aluno.run("cat /srv/aluno") == "dono\n"
+    assert Shell(fs, "professor").run("cat /srv/prof /srv/comum") == "prof\ncomum\n"
+    with pytest.raises(VFSError):
+        fs.read_file("/srv/aluno", uid=1001)
+
+
+def test_tilde_expansion(fs):
+    aluno = Shell(fs, "aluno")
+    assert aluno.run("echo ~ ~/a ~root ~professor/b ~nada '~'") == (
+        "/home/aluno /home/aluno/a /root /home/professor/b ~nada ~\n"
+    )
+    assert aluno.run("echo oi > ~/nota; cat ~aluno/nota") == "oi\n"
+    assert aluno.run("cd /srv; cd; pwd") == "/home/aluno\n"
+
+
+def test_snapshot_restore_and_fork_are_isolated(fs):
+    start = fs.snapshot()
+    fork = fs.fork()
+    Shell(fs, "root").run("echo novo > /srv/novo; rm /srv/comum; chmod 600 /srv/prof")
+    assert fs.exists("/srv/novo") and not fs.exists("/srv/comum")
+    assert not fork.exists("/srv/novo") and fork.read_file("/srv/comum") == "comum\n"
+    fs.restore(start)
+    assert not fs.exists("/srv/novo")
+    assert fs.read_file("/srv/comum") == "comum\n"
+    assert fs.stat("/srv/prof").mode == 0o640
+    assert diff(fork, fs) == []
+
+
+def test_diff_reports_each_kind_of_change(fs):
+    start = fs.snapshot()
+    expected, actual = FileSystem(start), FileSystem(start)
+    Shell(expected, "root").run("mkdir /srv/logs; ln -s comum /srv/atalho")
+    Shell(actual, "root").run(
+        "echo outro > /srv/comum; chmod 600 /srv/prof; chown professor /srv/aluno; "
+        "ln -s prof /srv/atalho; echo x > /srv/extra"
+    )
+    assert diff(expected, actual) == [
+        "~ /srv/aluno: dono professor:root, esperado aluno:root",
+        "~ /srv/atalho: aponta para prof, esperado comum",
+        "~ /srv/comum: conteúdo diferente do esperado",
+        "+ /srv/extra: arquivo a mais",
+        "- /srv/logs: diretório faltando",
+        "~ /srv/prof: permissões 600, esperado 640",
+    ]
+
+
+def test_diff_without_common_snapshot_compares_whole_tree():
+    left, right = FileSystem(), FileSystem()
+    Shell(left, "root").run("mkdir -p /a/b; echo 1 > /a/b/f")
+    Shell(right, "root").run("mkdir -p /a/b; echo 2 > /a/b/f; mkdir /c")
+    assert diff(left, right) == ["~ /a/b/f: conteúdo diferente do esperado", "+ /c: diretório a mais"]